@@ -12,8 +12,11 @@ This is the main file for the checkers game.
 """
 
 
+import os
 import sys
 from source import CheckersGame
+from source.book import default_book_path
+from source.tablebase import default_tablebase_path
 
 
 # Constants for the bot's search algorithm.
@@ -21,14 +24,48 @@ SCORE = 1e9
 DEPTH = 25
 TIME = 10
 
+# The successor generator backend: 'list' or 'bitboard'.
+BACKEND = 'list'
 
-# Implement a scoring functon here if you so choose
+# The most memory in megabytes the bot's transposition table may use.
+HASH_MB = 64
+
+# The number of processes the bot searches with. 1 searches in this process.
+WORKERS = 1
+
+# Whether the bot searches the player's expected reply while the player thinks.
+PONDER = False
+
+# The most plies of jumps the bot follows past DEPTH before scoring a position.
+QUIESCENCE = 8
+
+# The evaluator the bot scores positions with: 'default' or 'material'.
+EVALUATOR = 'default'
+
+# The file each finished game is added to as a PDN record, or None.
+PDN = None
+
+# Define a scoring function here and set EVALUATOR to it if you so choose, or
+# register an Evaluator from source.evaluation and name it above.
 
 
 # run the game
 if len(sys.argv) > 1:
-    game = CheckersGame(sys.argv[1], SCORE, DEPTH, TIME)
+    layout = sys.argv[1]
 else:
-    game = CheckersGame('layouts/8x8.board', SCORE, DEPTH, TIME)
+    layout = 'layouts/8x8.board'
+
+# Use the layout's opening book and endgame tablebase if they have been built.
+book = default_book_path(layout)
+if not os.path.exists(book):
+    book = None
+tablebase = default_tablebase_path(layout)
+if not os.path.exists(tablebase):
+    tablebase = None
+
+game = CheckersGame(layout, SCORE, DEPTH, TIME, bot_func=EVALUATOR,
+                    backend=BACKEND, hash_mb=HASH_MB,
+                    workers=WORKERS, book=book, tablebase=tablebase,
+                    ponder=PONDER, quiescence=QUIESCENCE, pdn=PDN)
 
 game.play()
@@ -0,0 +1,284 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""analysis
+
+File: analysis.py\n
+Author: Alan Grant\n
+Version: 1.0\n
+Date: 10/18/2026\n
+Class: CSCI-C 458\n
+
+This module provides the bulk analysis of recorded games. Every position of
+every game in a PDN collection is searched by a CheckersBot, and each move
+played is written as a line of JSON with the score of the move the bot
+prefers and of the move played, both at the same depth, and whether the move
+played lost so much that it counts as a blunder. Games are read one at a
+time and handed to a pool of worker processes, with only a few more games in
+flight than there are workers, so a collection of any size is analysed in
+constant memory and the lines come out in the order of the games.
+
+Analyse a collection with:
+
+    python -m source.analysis games.pdn --depth 8 --workers 4 -o games.jsonl
+"""
+
+
+import argparse
+import json
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from time import time
+
+from .checkers_bot import CheckersBot
+from .encoding import decode_move
+from .pdn import read_games, move_text
+
+
+# The max score of the bot's search.
+SCORE = 1e9
+
+# The loss in score, from the side on move's point of view, at which a move
+# is flagged as a blunder: about one man.
+BLUNDER = 1.0
+
+# The number of tasks kept in flight for each worker process.
+QUEUE_PER_WORKER = 2
+
+# The bot of a worker process, built once by _init_worker.
+_bot = None
+
+
+def bounded_map(func, items, workers, initializer, initargs):
+    """bounded_map
+
+    The bounded_map function calls func on every item over a pool of worker
+    processes and yields the results in the order of the items. Unlike
+    ProcessPoolExecutor.map it reads items only as workers become free, at
+    most QUEUE_PER_WORKER per worker ahead of the result being waited for,
+    so items may come from a stream too long to hold in memory. With one
+    worker everything runs in this process.
+
+    Args:
+        func (function) : The function to call, defined at the top level of
+        a module.\n
+        items (iterable) : The tuples of arguments to call func with.\n
+        workers (int) : The number of worker processes.\n
+        initializer (function) : The function run once in every worker.\n
+        initargs (tuple) : The arguments of initializer.
+
+    Yields:
+        object : The result of func for each item.
+    """
+    if workers <= 1:
+        initializer(*initargs)
+        for item in items:
+            yield func(*item)
+        return
+    with ProcessPoolExecutor(max_workers=workers, initializer=initializer,
+                             initargs=initargs) as pool:
+        pending = deque()
+        for item in items:
+            pending.append(pool.submit(func, *item))
+            if len(pending) >= workers * QUEUE_PER_WORKER:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _init_worker(max_depth, max_time, tablebase):
+    """_init_worker
+
+    The _init_worker function runs once in every worker process. It builds
+    the bot the positions are searched with.
+
+    Args:
+        max_depth (int) : The max depth of each search.\n
+        max_time (float) : The max time in seconds of each search.\n
+        tablebase (str) : The file path to an endgame tablebase, or None.
+    """
+    global _bot
+    _bot = CheckersBot(None, SCORE, max_depth, max_time, None,
+                       tablebase=tablebase)
+
+
+def evaluate(bot, state):
+    """evaluate
+
+    The evaluate function searches a position for the side on move. The
+    position is not turned around for the player as it is in a tournament,
+    so that the scores of successive positions are made by the same scoring
+    function and differ only by what the moves change.
+
+    Args:
+        bot (CheckersBot) : The bot to search with.\n
+        state (CheckersState) : The position.
+
+    Returns:
+        tuple : The path of the best move, or None if the side on move has
+        lost, the score from the side on move's point of view, or None if no
+        iteration finished in time, and the depth of the last iteration
+        which finished. The best move and the score are both those of that
+        iteration.
+    """
+    bot.update_state(state)
+    result = bot.get_move()
+    if result is None:
+        return None, -SCORE, 0
+    finished = [stats for stats in bot.stats if stats.complete]
+    if not finished:
+        return result.moves, None, 0
+    last = finished[-1]
+    return (decode_move(last.pv[0], state.size), round(last.score, 4),
+            last.depth)
+
+
+def analyse_game(bot, number, game, blunder=BLUNDER):
+    """analyse_game
+
+    The analyse_game function analyses every move of a game. Each position
+    is searched once, and the move played, if it is not the best move, is
+    then scored at the root of the same position to the depth of the last
+    iteration that finished, so the two scores have the same horizon. The
+    loss of a move is how much lower its score is than the best move's,
+    and never less than 0; the best move loses nothing.
+
+    Args:
+        bot (CheckersBot) : The bot to search with.\n
+        number (int) : The number of the game in its collection, from 1.\n
+        game (PdnGame) : The game.\n
+        blunder (float) : The loss in score at which a move is a blunder.
+
+    Returns:
+        list : A dict for each move with the game number, the ply, the side
+        on move ('B' or 'W'), the move played, the best move, the scores of
+        the best move and of the move played, the loss, the depth searched
+        and whether it was a blunder. A game which cannot be replayed gives
+        one dict with the error instead.
+    """
+    try:
+        plies = list(game.replay())
+    except ValueError as e:
+        return [{'game': number, 'error': str(e)}]
+    if not plies:
+        return []
+    size = plies[0][0].size
+    bot.new_game()
+    records = []
+    for ply, (state, move) in enumerate(plies):
+        best, score, depth = evaluate(bot, state)
+        after = loss = None
+        if score is not None:
+            if best == list(move[0]):
+                after = score
+            else:
+                after = bot.score_move(state, move, depth)
+        if after is not None:
+            after = round(after, 4)
+            loss = round(max(score - after, 0.0), 4)
+        records.append({
+            'game': number, 'ply': ply + 1,
+            'side': 'W' if state.bots_move else 'B',
+            'move': move_text(move[0], size),
+            'best': move_text(best, size) if best else None,
+            'score': score, 'after': after, 'loss': loss, 'depth': depth,
+            'blunder': loss is not None and loss >= blunder})
+    return records
+
+
+def _analyse(number, game, blunder):
+    """_analyse
+
+    The _analyse function analyses one game in a worker process.
+
+    Args:
+        number (int) : The number of the game in its collection.\n
+        game (PdnGame) : The game.\n
+        blunder (float) : The loss in score at which a move is a blunder.
+
+    Returns:
+        list : The records of analyse_game.
+    """
+    return analyse_game(_bot, number, game, blunder)
+
+
+def analyse_collection(stream, output, max_depth, max_time, workers=1,
+                       blunder=BLUNDER, tablebase=None):
+    """analyse_collection
+
+    The analyse_collection function analyses every game of a PDN collection
+    and writes each move's record to output as a line of JSON, in the order
+    of the games.
+
+    Args:
+        stream (file) : The open PDN collection.\n
+        output (file) : The open file to write to.\n
+        max_depth (int) : The max depth of each search.\n
+        max_time (float) : The max time in seconds of each search.\n
+        workers (int) : The number of processes to analyse games on.\n
+        blunder (float) : The loss in score at which a move is a blunder.\n
+        tablebase (str) : The file path to an endgame tablebase, or None.
+
+    Returns:
+        dict : The number of games, moves, blunders and games which could
+        not be replayed.
+    """
+    totals = {'games': 0, 'moves': 0, 'blunders': 0, 'errors': 0}
+    items = ((number, game, blunder)
+             for number, game in enumerate(read_games(stream), 1))
+    for records in bounded_map(_analyse, items, workers, _init_worker,
+                               (max_depth, max_time, tablebase)):
+        totals['games'] += 1
+        for record in records:
+            if 'error' in record:
+                totals['errors'] += 1
+            else:
+                totals['moves'] += 1
+                totals['blunders'] += record['blunder']
+            output.write(json.dumps(record) + '\n')
+    if workers <= 1 and _bot is not None:
+        _bot.close()
+    return totals
+
+
+def main():
+    """main
+
+    The main function is the command line interface of the analysis.
+    """
+    parser = argparse.ArgumentParser(
+        description='Analyse every move of a collection of PDN games.')
+    parser.add_argument('pdn', help='the PDN collection, or - for stdin')
+    parser.add_argument('-o', '--output',
+                        help='file to write the JSON lines to '
+                             '(default: stdout)')
+    parser.add_argument('--depth', type=int, default=8,
+                        help='max depth of each search in plies')
+    parser.add_argument('--time', type=float, default=1.0,
+                        help='max seconds of each search')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='processes to analyse games on')
+    parser.add_argument('--blunder', type=float, default=BLUNDER,
+                        help='loss in score flagged as a blunder')
+    parser.add_argument('--tablebase',
+                        help='endgame tablebase to score endings with')
+    args = parser.parse_args()
+    stream = sys.stdin if args.pdn == '-' else open(args.pdn)
+    output = open(args.output, 'w') if args.output else sys.stdout
+    start = time()
+    try:
+        totals = analyse_collection(stream, output, args.depth, args.time,
+                                    args.workers, args.blunder,
+                                    args.tablebase)
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+        if output is not sys.stdout:
+            output.close()
+    print('{games} games, {moves} moves, {blunders} blunders, {errors} '
+          'errors'.format(**totals), '({:.1f}s)'.format(time() - start),
+          file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
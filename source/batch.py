@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""batch
+
+File: batch.py\n
+Author: Alan Grant\n
+Version: 1.0\n
+Date: 10/18/2026\n
+Class: CSCI-C 458\n
+
+This module provides batched scoring of many boards at once with NumPy. A
+batch scoring function takes a stacked (n, size, size) int8 array of boards
+and an array of n booleans saying whether the bot is on move in each, and
+returns an array of n scores from the point of view of the side on move, just
+like a scoring function for a single CheckersState. NumPy is only needed when
+batched scoring is used.
+"""
+
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .evaluation import score_tables
+
+
+# The int8 code of each square of a board.
+PIECE_CODES = {'_': 0, 'b': 1, 'B': 2, 'p': -1, 'P': -2}
+
+# Value tables as (2, size, size) arrays of men and kings, keyed by board size
+# and side.
+_ARRAYS = {}
+
+
+def require_numpy():
+    """require_numpy
+
+    The require_numpy function raises an ImportError if NumPy is not
+    installed.
+    """
+    if np is None:
+        raise ImportError('Batched scoring needs NumPy. Install it with '
+                          '"pip install numpy".')
+
+
+def board_key(board):
+    """board_key
+
+    The board_key function flattens a board into a string of its squares,
+    the cheap form boards are collected in before being stacked.
+
+    Args:
+        board (list) : The board as a list of rows of squares.
+
+    Returns:
+        str : The squares of the board, row by row.
+    """
+    return ''.join(map(''.join, board))
+
+
+def stack_boards(keys, size):
+    """stack_boards
+
+    The stack_boards function turns boards flattened by board_key into one
+    (n, size, size) int8 array using PIECE_CODES.
+
+    Args:
+        keys (list) : The flattened boards.\n
+        size (int) : The size of the boards.
+
+    Returns:
+        numpy.ndarray : The stacked boards.
+    """
+    require_numpy()
+    codes = np.zeros(128, dtype=np.int8)
+    for square, code in PIECE_CODES.items():
+        codes[ord(square)] = code
+    flat = np.frombuffer(''.join(keys).encode('ascii'), dtype=np.uint8)
+    return codes[flat].reshape(len(keys), size, size)
+
+
+def _value_arrays(size):
+    """_value_arrays
+
+    The _value_arrays function returns the values the default evaluator
+    gives men and kings of each side as arrays.
+
+    Args:
+        size (int) : The size of the board.
+
+    Returns:
+        tuple : The (2, size, size) arrays of the bot's and the player's man
+        and king values.
+    """
+    if size not in _ARRAYS:
+        tables = score_tables(size)
+        _ARRAYS[size] = (np.array([tables['b'], tables['B']]),
+                         np.array([tables['p'], tables['P']]))
+    return _ARRAYS[size]
+
+
+def batch_score(boards, bots_move):
+    """batch_score
+
+    The batch_score function is the vectorised form of the default
+    evaluator. It sums the value of every piece of each side on each board
+    and returns the difference from the point of view of the side on move.
+
+    Args:
+        boards (numpy.ndarray) : An (n, size, size) int8 array of boards.\n
+        bots_move (numpy.ndarray) : An array of n booleans, True where the bot
+        is on move.
+
+    Returns:
+        numpy.ndarray : The n scores.
+    """
+    bot_values, player_values = _value_arrays(boards.shape[1])
+    bot = ((boards == 1) * bot_values[0]
+           + (boards == 2) * bot_values[1]).sum(axis=(1, 2))
+    player = ((boards == -1) * player_values[0]
+              + (boards == -2) * player_values[1]).sum(axis=(1, 2))
+    return np.where(bots_move, bot - player, player - bot)
@@ -0,0 +1,312 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""benchmark
+
+File: benchmark.py\n
+Author: Alan Grant\n
+Version: 1.0\n
+Date: 10/18/2026\n
+Class: CSCI-C 458\n
+
+This module provides the benchmark suite of the successor generators and the
+bot's search. perft counts the positions reached after each number of moves
+from the start of every layout, which checks the generators as well as timing
+them, and fixed depth searches of a few chosen positions time the search.
+Results are saved as JSON and compared with a saved baseline, so a change
+which makes the generators or the search slower is flagged.
+
+Run the suite and compare it with a baseline with:
+
+    python -m source.benchmark --output new.json --baseline baseline.json
+"""
+
+
+import argparse
+import json
+import os
+import platform
+import sys
+from time import time
+
+from .board import CheckersBoard
+from .checkers_state import CheckersState
+from .checkers_bot import CheckersBot
+from .successors import GENERATORS, get_generator
+
+
+# The perft depth of each shipped layout, each taking about a second.
+PERFT_DEPTHS = {
+    '4x4': 10,
+    '6x6': 7,
+    '8x8': 6,
+    '10x10': 5,
+    '12x12': 5,
+}
+
+# The positions searched by the search benchmark: the rows of the board and
+# True if the bot is on move.
+POSITIONS = {
+    '6x6 start': ([
+        '_ b _ b _ b',
+        'b _ b _ b _',
+        '_ _ _ _ _ _',
+        '_ _ _ _ _ _',
+        '_ p _ p _ p',
+        'p _ p _ p _'], True),
+    '8x8 start': ([
+        '_ b _ b _ b _ b',
+        'b _ b _ b _ b _',
+        '_ b _ b _ b _ b',
+        '_ _ _ _ _ _ _ _',
+        '_ _ _ _ _ _ _ _',
+        'p _ p _ p _ p _',
+        '_ p _ p _ p _ p',
+        'p _ p _ p _ p _'], True),
+    '8x8 middle game': ([
+        '_ b _ b _ _ _ b',
+        'b _ _ _ b _ b _',
+        '_ b _ _ _ b _ _',
+        '_ _ b _ _ _ _ _',
+        '_ p _ _ _ p _ b',
+        'p _ _ _ p _ _ _',
+        '_ p _ p _ _ _ p',
+        'p _ _ _ p _ p _'], True),
+    '8x8 kings': ([
+        '_ _ _ _ _ _ _ _',
+        '_ _ B _ _ _ _ _',
+        '_ _ _ _ _ b _ _',
+        '_ _ _ _ B _ _ _',
+        '_ _ _ P _ _ _ _',
+        '_ _ _ _ _ _ p _',
+        '_ P _ _ _ _ _ _',
+        '_ _ _ _ _ _ _ _'], True),
+}
+
+# The depth of the search benchmark, in plies.
+SEARCH_DEPTH = 10
+
+
+def perft(state, depth, generator, counts, ply=0):
+    """perft
+
+    The perft function walks every sequence of legal moves up to depth from a
+    state with the successors method of a generator, counting the states
+    reached after each number of moves.
+
+    Args:
+        state (CheckersState) : The state to start from.\n
+        depth (int) : The number of moves to look ahead.\n
+        generator (class) : The successor generator class.\n
+        counts (list) : The number of states reached after 1, 2, ... moves,
+        added to as they are found.\n
+        ply (int) : The number of moves made so far.
+
+    Returns:
+        int : The number of states reached after depth moves.
+    """
+    if depth == 0:
+        return 1
+    successors = generator(state).successors()
+    counts[ply] += len(successors)
+    if depth == 1:
+        return len(successors)
+    return sum(perft(successor, depth - 1, generator, counts, ply + 1)
+               for successor in successors)
+
+
+def divide(state, depth, generator):
+    """divide
+
+    The divide function splits the perft count of a state by its first move,
+    which narrows down where two generators disagree.
+
+    Args:
+        state (CheckersState) : The state to start from.\n
+        depth (int) : The number of moves to look ahead.\n
+        generator (class) : The successor generator class.
+
+    Returns:
+        list : The path of each first move and the number of states reached
+        after depth moves starting with it.
+    """
+    counts = [0] * depth
+    return [(successor.moves, perft(successor, depth - 1, generator, counts))
+            for successor in generator(state).successors()]
+
+
+def _layout_state(name, layouts):
+    """_layout_state
+
+    The _layout_state function returns the start of a shipped layout, with
+    the player on move as in a game.
+
+    Args:
+        name (str) : The name of the layout, such as "8x8".\n
+        layouts (str) : The directory of the layout files.
+
+    Returns:
+        CheckersState : The start of the layout.
+    """
+    board = CheckersBoard(os.path.join(layouts, name + '.board')).board
+    return CheckersState(board, False, [], len(board))
+
+
+def bench_perft(layouts, depths=PERFT_DEPTHS, backends=GENERATORS):
+    """bench_perft
+
+    The bench_perft function runs perft on the start of each layout with each
+    successor generator.
+
+    Args:
+        layouts (str) : The directory of the layout files.\n
+        depths (dict) : The perft depth of each layout.\n
+        backends (iterable) : The names of the generators to run.
+
+    Returns:
+        dict : The results keyed by "layout/backend": the depth, the states
+        reached after each number of moves, the seconds taken and the states
+        generated per second.
+    """
+    results = {}
+    for name, depth in depths.items():
+        state = _layout_state(name, layouts)
+        for backend in backends:
+            counts = [0] * depth
+            start = time()
+            perft(state, depth, get_generator(backend), counts)
+            elapsed = time() - start
+            results['{}/{}'.format(name, backend)] = {
+                'depth': depth, 'counts': counts, 'time': elapsed,
+                'nps': sum(counts) / max(elapsed, 1e-9)}
+    return results
+
+
+def bench_search(positions=POSITIONS, depth=SEARCH_DEPTH,
+                 backends=GENERATORS):
+    """bench_search
+
+    The bench_search function searches each position to a fixed depth with
+    no time limit, with each successor generator.
+
+    Args:
+        positions (dict) : The positions to search, as in POSITIONS.\n
+        depth (int) : The depth to search to.\n
+        backends (iterable) : The names of the generators to search with.
+
+    Returns:
+        dict : The results keyed by "position/backend": the depth, the
+        positions visited, the seconds taken, the positions visited per second
+        and the move chosen.
+    """
+    results = {}
+    for name, (rows, bots_move) in positions.items():
+        board = [row.split() for row in rows]
+        state = CheckersState(board, bots_move, [], len(board))
+        for backend in backends:
+            # The bot searches up to max_depth - 1 plies.
+            bot = CheckersBot(state, 1e9, depth + 1, 1e9, None,
+                              backend=backend)
+            start = time()
+            best = bot.get_move()
+            elapsed = time() - start
+            bot.close()
+            results['{}/{}'.format(name, backend)] = {
+                'depth': depth, 'nodes': bot.nodes, 'time': elapsed,
+                'nps': bot.nodes / max(elapsed, 1e-9),
+                'move': best.moves if best else None}
+    return results
+
+
+def compare(results, baseline, threshold):
+    """compare
+
+    The compare function checks a run of the suite against a baseline. perft
+    counts must match exactly; a speed more than threshold below the
+    baseline's is a regression. Searches which visit a different number of
+    positions are noted, since that is expected when the search changes.
+
+    Args:
+        results (dict) : The results of this run.\n
+        baseline (dict) : The results of the baseline run.\n
+        threshold (float) : The fraction of speed that may be lost.
+
+    Returns:
+        tuple : A list of regressions and a list of notes, as strings.
+    """
+    regressions, notes = [], []
+    for suite in ('perft', 'search'):
+        for key, new in results.get(suite, {}).items():
+            old = baseline.get(suite, {}).get(key)
+            if old is None or old['depth'] != new['depth']:
+                continue
+            if suite == 'perft' and new['counts'] != old['counts']:
+                regressions.append('{} {}: counts {} differ from {}'.format(
+                    suite, key, new['counts'], old['counts']))
+            if suite == 'search' and new['nodes'] != old['nodes']:
+                notes.append('{} {}: {} nodes, was {}'.format(
+                    suite, key, new['nodes'], old['nodes']))
+            change = new['nps'] / old['nps'] - 1
+            line = '{} {}: {:.0f} nodes/s, was {:.0f} ({:+.1%})'.format(
+                suite, key, new['nps'], old['nps'], change)
+            if change < -threshold:
+                regressions.append(line)
+            else:
+                notes.append(line)
+    return regressions, notes
+
+
+def main():
+    """main
+
+    The main function is the command line interface of the benchmark suite.
+    It exits with status 1 if a regression was found.
+    """
+    parser = argparse.ArgumentParser(
+        description='Benchmark the move generators and the search.')
+    parser.add_argument('--layouts', default='layouts',
+                        help='the directory of the layout files')
+    parser.add_argument('--output', help='write the results to this file')
+    parser.add_argument('--baseline', help='compare with these results')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='the fraction of speed that may be lost')
+    parser.add_argument('--depth', type=int, default=SEARCH_DEPTH,
+                        help='the depth of the search benchmark')
+    parser.add_argument('--divide', metavar='LAYOUT',
+                        help='print the perft count of each first move of '
+                        'a layout, such as 8x8, and exit')
+    args = parser.parse_args()
+
+    if args.divide:
+        state = _layout_state(args.divide, args.layouts)
+        depth = PERFT_DEPTHS.get(args.divide, 4)
+        for backend in GENERATORS:
+            print('{} depth {}:'.format(backend, depth))
+            for path, count in divide(state, depth, get_generator(backend)):
+                print('  {} {}'.format(path, count))
+        return
+
+    results = {'python': platform.python_version(),
+               'perft': bench_perft(args.layouts),
+               'search': bench_search(depth=args.depth)}
+    for suite in ('perft', 'search'):
+        for key, result in results[suite].items():
+            print('{} {}: {:.0f} nodes/s, {:.2f}s'.format(
+                suite, key, result['nps'], result['time']))
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions, notes = compare(results, baseline, args.threshold)
+        for line in notes:
+            print(line)
+        for line in regressions:
+            print('REGRESSION ' + line)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
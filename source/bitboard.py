@@ -0,0 +1,295 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""bitboard
+
+File: bitboard.py\n
+Author: Alan Grant\n
+Version: 1.0\n
+Date: 10/18/2026\n
+Class: CSCI-C 458\n
+
+This module provides access to the BitboardGenerator class. It is an
+alternative backend for the SuccessorGenerator class which keeps the pieces
+of a position as integer bit masks and generates moves and jumps by shifting
+and masking whole sets of pieces at once.
+
+The masks are read from the board once, when the generator is given a state.
+A CheckersPosition searched with make and unmake moves tells its generator of
+every move, and the masks are updated by toggling the bits of the squares the
+move changes, so they are never read from the board again during a search.
+"""
+
+
+from .geometry import get_geometry
+
+
+# For each piece, the table turning a row of the board into a row of bits:
+# '1' where the piece stands and '0' everywhere else.
+_BIT_TABLES = {piece: str.maketrans({square: '1' if square == piece else '0'
+                                     for square in 'bBpP_'})
+               for piece in 'bBpP'}
+
+
+def _split(amount):
+    """_split
+
+    The _split function splits a bit shift into a left and a right shift, one
+    of them 0, so that bits << left >> right shifts either way without a
+    branch.
+
+    Args:
+        amount (int) : The bit shift; negative values shift towards bit 0.
+
+    Returns:
+        tuple : The left and the right shift.
+    """
+    return (amount, 0) if amount > 0 else (0, -amount)
+
+
+def read_masks(board):
+    """read_masks
+
+    The read_masks function reads a board into one bit mask per piece. The
+    rows are joined with a spare square between them, so the string has a
+    character for every bit of a bitboard row, and each piece's mask is the
+    string read as a binary number, last square first.
+
+    Args:
+        board (list) : The board as a list of rows of squares.
+
+    Returns:
+        dict : The bitboard of the squares each of 'b', 'B', 'p' and 'P'
+        stands on.
+    """
+    text = '_'.join(map(''.join, board))[::-1]
+    return {piece: int(text.translate(table), 2)
+            for piece, table in _BIT_TABLES.items()}
+
+
+class BitboardGenerator:
+    """BitboardGenerator
+
+    The BitboardGenerator class generates the same successor states, in the
+    same order, as the SuccessorGenerator class. Instead of testing every
+    square of the board it keeps four bit masks (bot men, bot kings, player
+    men and player kings) and finds every piece able to step or jump in a
+    direction with a single shift and mask.
+
+    Attributes:
+        state : The current CheckersState we are finding successors for.\n
+        geometry (BoardGeometry) : The lookup tables for the board's size.\n
+        masks (dict) : The bitboard of each piece, kept up to date by
+        make_move and unmake_move.
+    """
+
+    def __init__(self, state):
+        """__init__
+
+        The __init__ method is the constructor for the BitboardGenerator
+        class.
+
+        Args:
+            state (CheckersState) : The current state of the game.
+        """
+        self.update_state(state)
+
+    def _directions(self, geometry, bots_move):
+        """_directions
+
+        The _directions method returns the steps a king of a side can make,
+        in the order SuccessorGenerator tries them, and which of them a man
+        can make too.
+
+        Args:
+            geometry (BoardGeometry) : The lookup tables for the board.\n
+            bots_move (bool) : True for the bot's pieces.
+
+        Returns:
+            list : A (left, right, man) tuple for each step: the left and
+            right shift of the step, as _split returns them, and True if a
+            man can make it.
+        """
+        man = geometry.steps['b' if bots_move else 'p']
+        return [_split(geometry.shifts[step]) + (step in man,)
+                for step in geometry.steps['B']]
+
+    def _jump_chains(self, square, king, empty, opp, path, captured, moves):
+        """_jump_chains
+
+        The _jump_chains method follows every jump sequence available to the
+        piece on square. Jumped pieces are taken off the board as the chain
+        goes on, so a piece cannot be jumped twice, and a man that reaches
+        the far row is kinged and carries on jumping as a king.
+
+        Args:
+            square (int) : The bit of the square the piece is on.\n
+            king (bool) : True if the piece is a king.\n
+            empty (int) : The mask of empty squares.\n
+            opp (int) : The mask of the opponent's pieces.\n
+            path (list) : The bits of the squares visited so far.\n
+            captured (list) : The bits of the pieces jumped so far.\n
+            moves (list) : A list of (path, captured, piece) move tuples, one
+            added for every finished jump sequence.
+        """
+        end_jump = True
+        for left, right, man_step in self._steps[self.state.bots_move]:
+            if not (king or man_step):
+                continue
+            over = (square << left >> right) & opp
+            if not over:
+                continue
+            land = (over << left >> right) & empty
+            if not land:
+                continue
+            path.append(land)
+            captured.append(over)
+            self._jump_chains(land, king or bool(land & self._crown),
+                              (empty | square | over) & ~land, opp & ~over,
+                              path, captured, moves)
+            path.pop()
+            captured.pop()
+            end_jump = False
+
+        if end_jump and len(path) > 1:
+            squares = self.geometry.squares
+            moves.append(([squares[bit] for bit in path],
+                          tuple(squares[bit] for bit in captured),
+                          self._pieces[king]))
+
+    def _bit_moves(self, jumps_only=False):
+        """_bit_moves
+
+        The _bit_moves method finds every jump sequence and then every normal
+        move of the side to move. Pieces are visited in the same row by row
+        order SuccessorGenerator scans the board in. Every mask is within the
+        board, so shifted masks need no trimming once they are anded with
+        one of them.
+
+        Args:
+            jumps_only (bool) : True to leave out the normal moves.
+
+        Returns:
+            moves (list) : A list of (path, captured, piece) move tuples.
+        """
+        bots_move = self.state.bots_move
+        masks = self.masks
+        if bots_move:
+            men, kings, opp = masks['b'], masks['B'], masks['p'] | masks['P']
+            self._pieces = ('b', 'B')
+        else:
+            men, kings, opp = masks['p'], masks['P'], masks['b'] | masks['B']
+            self._pieces = ('p', 'P')
+        pieces = men | kings
+        empty = self.geometry.board_mask & ~(pieces | opp)
+        crown = self._crown = self.geometry.crown_mask[bots_move]
+        steps = self._steps[bots_move]
+        moves = []
+
+        # Every piece with an enemy next to it and an empty square behind.
+        jumpers = 0
+        for left, right, man_step in steps:
+            jumpers |= ((pieces if man_step else kings)
+                        & (opp >> left << right)
+                        & (empty >> 2 * left << 2 * right))
+        while jumpers:
+            square = jumpers & -jumpers
+            jumpers ^= square
+            self._jump_chains(square, bool(square & kings), empty, opp,
+                              [square], [], moves)
+        if jumps_only:
+            return moves
+
+        # Every piece with an empty square next to it. Only kings are kept
+        # for the steps a man cannot make.
+        movers, candidates = [], 0
+        for left, right, man_step in steps:
+            step_movers = ((pieces if man_step else kings)
+                           & (empty >> left << right))
+            movers.append(step_movers)
+            candidates |= step_movers
+        squares, (man, king) = self.geometry.squares, self._pieces
+        while candidates:
+            square = candidates & -candidates
+            candidates ^= square
+            crowned = square & kings
+            for (left, right, _), step_movers in zip(steps, movers):
+                if step_movers & square:
+                    land = square << left >> right
+                    moves.append(([squares[square], squares[land]], (),
+                                  king if crowned or land & crown else man))
+        return moves
+
+    def update_state(self, new_state):
+        """update_state
+
+        The update_state function does exactly what it says i does: updates
+        the current state to a new state, and reads its board into masks.
+
+        Args:
+            new_state (CheckersState) : The most recent state of the game.
+        """
+        self.state = new_state
+        self.geometry = get_geometry(new_state.size)
+        self._steps = {side: self._directions(self.geometry, side)
+                       for side in (True, False)}
+        self.masks = read_masks(new_state.board)
+
+    def make_move(self, move, moved, taken):
+        """make_move
+
+        The make_move method updates the masks for a move just made on the
+        state's board. Toggling the same bits again takes the move back, so
+        unmake_move is the same method.
+
+        Args:
+            move (tuple) : The (path, captured, piece) move tuple.\n
+            moved (str) : The piece which stood on the first square of path.\n
+            taken (list) : The pieces which stood on the captured squares.
+        """
+        path, captured, piece = move
+        masks, bits = self.masks, self.geometry.bits
+        x, y = path[0]
+        masks[moved] ^= bits[x][y]
+        x, y = path[-1]
+        masks[piece] ^= bits[x][y]
+        for (x, y), square in zip(captured, taken):
+            masks[square] ^= bits[x][y]
+
+    # Toggling the same bits again takes the move back.
+    unmake_move = make_move
+
+    def moves(self):
+        """moves
+
+        The moves method generates all legal moves of the current
+        CheckersState in the same (path, captured, piece) format as
+        SuccessorGenerator.moves.
+
+        Returns:
+            moves (list) : A list of (path, captured, piece) move tuples.
+        """
+        return self._bit_moves()
+
+    def jumps(self):
+        """jumps
+
+        The jumps method generates only the jumps of the current
+        CheckersState, in the same order and format as moves.
+
+        Returns:
+            moves (list) : A list of (path, captured, piece) move tuples.
+        """
+        return self._bit_moves(jumps_only=True)
+
+    def successors(self):
+        """successors
+
+        The successors method generates all possible successors of the
+        current CheckersState and returns them as a list of CheckersState
+        objects.
+
+        Returns:
+            successors (list) : A list of CheckersState objects representing
+            the possible successor states.
+        """
+        return [self.state.result(move) for move in self.moves()]
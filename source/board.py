@@ -16,6 +16,7 @@ provided at initialization.
 
 
 import sys
+from .geometry import get_geometry
 
 
 class CheckersBoard:
@@ -29,7 +30,9 @@ class CheckersBoard:
     Attributes:
         layout (str) : The file path to file containing the board layout.\n
         board (list) : A list of strings which represents the layout of the
-        board.
+        board.\n
+        geometry (BoardGeometry) : The lookup tables for the board's size,
+        shared with the successor generators and the bot.
     """
 
     def __init__(self, layout):
@@ -76,3 +79,4 @@ class CheckersBoard:
 
         with f:
             self.board = [line.strip().split() for line in f]
+        self.geometry = get_geometry(len(self.board))
@@ -0,0 +1,275 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""book
+
+File: book.py\n
+Author: Alan Grant\n
+Version: 1.0\n
+Date: 10/18/2026\n
+Class: CSCI-C 458\n
+
+This module provides access to the OpeningBook class and the build_book
+function. An opening book maps positions from the first moves of a game to
+the move a long search chose for the bot, so the bot can answer them at once
+instead of spending its whole time limit. Books are built offline, one per
+layout, and stored as a sorted table of Zobrist hashes which is read through
+mmap without loading the whole file.
+
+Build the book for a layout with:
+
+    python -m source.book layouts/8x8.board --plies 6 --time 30
+"""
+
+
+import argparse
+import mmap
+import os
+import struct
+from bisect import bisect_left
+
+from .board import CheckersBoard
+from .checkers_state import CheckersState
+from .checkers_bot import CheckersBot
+from .successors import SuccessorGenerator
+from .transposition import zobrist_keys, zobrist_hash
+from .encoding import (encode_move, move_bytes, bytes_move, index_moves,
+                       find_move)
+
+
+# The file starts with a header: magic, version, board size, record count and
+# the Zobrist key of the bot being on move, which identifies the hash keys the
+# book was built with.
+HEADER = struct.Struct('>4sBBxxIQ')
+MAGIC = b'CKBK'
+VERSION = 2
+
+# Each record is a position hash followed by the code of the move, as the
+# squares of its path padded with zeros (see encoding.move_bytes).
+RECORD = struct.Struct('>Q16s')
+MAX_PATH = 16
+
+
+def default_book_path(layout):
+    """default_book_path
+
+    The default_book_path function returns where the book for a layout is
+    kept: next to the layout file, with a .book extension.
+
+    Args:
+        layout (str) : The file path to the layout file.
+
+    Returns:
+        str : The file path to the layout's book.
+    """
+    return os.path.splitext(layout)[0] + '.book'
+
+
+class OpeningBook:
+    """OpeningBook
+
+    The OpeningBook class looks positions up in a book file. The file is
+    memory-mapped, so a lookup is a binary search touching a handful of pages
+    rather than a read of the whole book.
+
+    Attributes:
+        path (str) : The file path to the book.\n
+        size (int) : The board size the book was built for.\n
+        count (int) : The number of positions in the book.\n
+        keys (_RecordKeys) : A sequence view of the record hashes for bisect.
+    """
+
+    def __init__(self, path):
+        """__init__
+
+        The __init__ method is the constructor for the OpeningBook class. It
+        opens and maps the book file and checks its header.
+
+        Args:
+            path (str) : The file path to the book.
+        """
+        self.path = path
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.size, self.count, bot_key = HEADER.unpack_from(
+            self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError('{} is not a version {} opening book'.format(
+                             path, VERSION))
+        if bot_key != zobrist_keys(self.size)[1]:
+            raise ValueError('{} was built with different hash keys'.format(
+                             path))
+        self.keys = _RecordKeys(self._map, self.count)
+
+    def lookup(self, state):
+        """lookup
+
+        The lookup method finds the book move for a state.
+
+        Args:
+            state (CheckersState) : The current state of the game.
+
+        Returns:
+            tuple : The (path, captured, piece) move tuple from the book, or
+            None if the position is not in the book or the stored move is not
+            legal in it.
+        """
+        if state.size != self.size:
+            return None
+        key = zobrist_hash(state)
+        i = bisect_left(self.keys, key)
+        if i == self.count or self.keys[i] != key:
+            return None
+        _, squares = RECORD.unpack_from(
+            self._map, HEADER.size + i * RECORD.size)
+        return index_moves(SuccessorGenerator(state).moves(),
+                           self.size).get(bytes_move(squares))
+
+    def close(self):
+        """close
+
+        The close method unmaps the book file.
+        """
+        self._map.close()
+
+
+class _RecordKeys:
+    """_RecordKeys
+
+    The _RecordKeys class lets bisect search the hashes of a mapped book
+    without copying them into a list.
+    """
+
+    def __init__(self, data, count):
+        """__init__
+
+        The __init__ method is the constructor for the _RecordKeys class.
+
+        Args:
+            data (mmap) : The mapped book file.\n
+            count (int) : The number of records in the book.
+        """
+        self.data = data
+        self.count = count
+
+    def __len__(self):
+        """__len__
+
+        The __len__ method returns the number of records.
+        """
+        return self.count
+
+    def __getitem__(self, i):
+        """__getitem__
+
+        The __getitem__ method returns the hash of record i.
+
+        Args:
+            i (int) : The index of the record.
+        """
+        offset = HEADER.size + i * RECORD.size
+        return int.from_bytes(self.data[offset:offset + 8], 'big')
+
+
+def write_book(path, size, entries):
+    """write_book
+
+    The write_book function writes book entries to a file, sorted by hash.
+
+    Args:
+        path (str) : The file path to write the book to.\n
+        size (int) : The size of the board.\n
+        entries (dict) : A dict mapping a position hash to the path of the
+        move to play, as a list of squares (x, y).
+    """
+    records = sorted((key, path_) for key, path_ in entries.items()
+                     if len(path_) <= MAX_PATH)
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, size, len(records),
+                            zobrist_keys(size)[1]))
+        for key, path_ in records:
+            f.write(RECORD.pack(key, move_bytes(encode_move(path_, size),
+                                                MAX_PATH)))
+
+
+def build_book(layout, path, plies, max_depth, max_time, workers=1,
+               log=print):
+    """build_book
+
+    The build_book function builds the opening book for a layout by
+    self-play. Starting from the layout with the player on move it follows
+    every player move, and for every position reached with the bot on move it
+    runs a long search and follows the move chosen, until plies moves have
+    been made.
+
+    Args:
+        layout (str) : The file path to the layout file.\n
+        path (str) : The file path to write the book to.\n
+        plies (int) : The number of moves from the start the book covers.\n
+        max_depth (int) : The max depth of each search.\n
+        max_time (float) : The max time in seconds of each search.\n
+        workers (int) : The number of processes each search runs on.\n
+        log (function) : Called with a line of progress for every search.
+
+    Returns:
+        int : The number of positions in the book.
+    """
+    board = CheckersBoard(layout).board
+    size = len(board)
+    bot = CheckersBot(None, 1e9, max_depth, max_time, None,
+                      workers=workers)
+    entries = {}
+
+    def visit(state, ply):
+        if ply >= plies or state.is_terminal():
+            return
+        if not state.bots_move:
+            for successor in SuccessorGenerator(state).successors():
+                visit(successor, ply + 1)
+            return
+        key = zobrist_hash(state)
+        if key not in entries:
+            bot.update_state(state)
+            best = bot.get_move()
+            if best is None:
+                return
+            entries[key] = best.moves
+            log('{:6d} positions, ply {}, {} nodes'.format(
+                len(entries), ply, bot.nodes))
+        index = index_moves(SuccessorGenerator(state).moves(), size)
+        visit(state.result(find_move(index, entries[key], size)), ply + 1)
+
+    try:
+        visit(CheckersState(board, False, [], size), 0)
+    finally:
+        bot.close()
+    write_book(path, size, entries)
+    return len(entries)
+
+
+def main():
+    """main
+
+    The main function is the command line interface of the book builder.
+    """
+    parser = argparse.ArgumentParser(
+        description='Build the opening book for a checkers layout.')
+    parser.add_argument('layout', help='the .board layout file')
+    parser.add_argument('-o', '--output',
+                        help='the book file (default: next to the layout)')
+    parser.add_argument('--plies', type=int, default=6,
+                        help='number of moves from the start to cover')
+    parser.add_argument('--depth', type=int, default=25,
+                        help='max depth of each search')
+    parser.add_argument('--time', type=float, default=30,
+                        help='max seconds for each search')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='processes to run each search on')
+    args = parser.parse_args()
+    output = args.output or default_book_path(args.layout)
+    count = build_book(args.layout, output, args.plies, args.depth,
+                       args.time, args.workers)
+    print('Wrote {} positions to {}'.format(count, output))
+
+
+if __name__ == '__main__':
+    main()
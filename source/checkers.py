@@ -14,9 +14,11 @@ class controls the logic for running a checkers simulation.
 
 
 from .board import CheckersBoard
-from .successors import SuccessorGenerator
+from .successors import get_generator
 from .checkers_state import CheckersState
 from .checkers_bot import CheckersBot
+from .encoding import index_moves, find_move
+from .pdn import dark_parity, game_text, result_text
 
 
 class CheckersGame:
@@ -31,16 +33,26 @@ class CheckersGame:
         bot_depth (int) : The max depth for the bot's IDDFS search.\n
         bot_time (float) : The max search time for the bot's search.\n
         bot_func (function) : The evaluation function used for scoring of
-        states found by the bot's search.\n
+        states found by the bot's search, or the name of a registered
+        evaluator.\n
         board_size (int) : The current size of the board layout being used.\n
         player_gen (SuccessorGenerator) : The generator used to find legal
         moves that the human player can make.\n
-        bot (CheckersBot) : The checkers bot.
+        bot (CheckersBot) : The checkers bot.\n
+        backend (str) : The name of the successor generator backend used by
+        both the player's move checks and the bot's search.\n
+        ponder (bool) : True if the bot searches while the player thinks.\n
+        pdn (str) : The file path each finished game is added to as a PDN
+        record, or None.\n
+        start (CheckersState) : The position the game started from.\n
+        paths (list) : The path of each move made so far.\n
+        bot_options (dict) : Extra keyword arguments for the CheckersBot.
 
     """
 
     def __init__(self, layout, bot_score, bot_depth, bot_time,
-                 bot_func=None):
+                 bot_func=None, backend='list', ponder=False, pdn=None,
+                 **bot_options):
         """ __init__
 
         The __init__ function is the constructor for the CheckersGame Class.
@@ -52,7 +64,16 @@ class CheckersGame:
             bot_depth (int) : The max depth for the bot's IDDFS search.\n
             bot_time (float) : The max search time for the bot's search.\n
             bot_func (function) : The evaluation function used for scoring of
-            states found by the bot's search.\n
+            states found by the bot's search, or the name of a registered
+            evaluator such as 'default' or 'material'.\n
+            backend (str) : The name of the successor generator backend, either
+            'list' or 'bitboard'.\n
+            ponder (bool) : True to let the bot search the player's expected
+            reply while the player thinks.\n
+            pdn (str) : The file path to add each finished game to as a PDN
+            record, or None.\n
+            bot_options : Extra keyword arguments passed on to the CheckersBot,
+            such as hash_mb.
         """
         self.board = CheckersBoard(layout)
         self.bot_score = bot_score
@@ -63,6 +84,12 @@ class CheckersGame:
         self.player_gen = None
         self.bot = None
         self.bot_func = bot_func
+        self.backend = backend
+        self.ponder = ponder
+        self.pdn = pdn
+        self.start = None
+        self.paths = []
+        self.bot_options = bot_options
 
     def _get_player_move(self):
         """_get_player_move
@@ -82,30 +109,27 @@ class CheckersGame:
         except:
             return None
 
-    def _is_valid_move(self, successors, moves):
+    def _is_valid_move(self, legal, moves):
         """_is_valid_move
 
         The _is_valid_move function takes the player's move list and checks if
         it repesents a legal move for the current game state.
 
         Args:
+            legal (dict) : The legal move index of the current game state,
+            built by encoding.index_moves.\n
             moves (list) : A list of tuples (x,y) representing squares on the
             board. This list is the sequence of steps
             {start, step1, step2, ..., end} which the comprise the player's
             move.
-            successors (list) : A list of CheckersState objects representing
-            all ending states of the player's legal moves.
 
         Returns:
             bool : True if moves represents a legal move, False otherwise.
+            tuple : The (path, captured, piece) move tuple of the player's
+            move, or None.
         """
-        valid = False
-        new_board = None
-        for successor in successors:
-            if successor.moves == moves:
-                valid = True
-                new_board = successor.board
-        return valid, new_board
+        move = find_move(legal, moves, self.board_size)
+        return move is not None, move
 
     def _game_over(self, state):
         """_game_over
@@ -118,6 +142,12 @@ class CheckersGame:
         Args:
             state (CheckersState) : The current game state. 
         """
+        if self.pdn:
+            with open(self.pdn, 'a') as f:
+                f.write(game_text(self.start, self.paths,
+                                  result_text(not state.bot_lost),
+                                  {'White': 'CheckersBot',
+                                   'Black': 'Player'}))
         if state.bot_lost:
             print('CONGRATULATIONS! YOU WON THE GAME!')
         else:
@@ -144,30 +174,40 @@ class CheckersGame:
         The play function begins the game. It instantiates player_gen and bot
         with new objects. It uses a while True loop which continues until a
         terminal state has been reached.
+
+        Raises:
+            ValueError : If games are added to a PDN file and the layout's
+            pieces stand on squares of both colours, which PDN cannot number.
         """
         state = CheckersState(self.board.board, False, [], self.board_size)
-        self.player_gen = SuccessorGenerator(state)
+        if self.pdn:
+            dark_parity(state.board)
+        self.start, self.paths = state, []
+        self.player_gen = get_generator(self.backend)(state)
         self.bot = CheckersBot(state,
                                self.bot_score,
                                self.bot_depth,
                                self.bot_time,
-                               self.bot_func)
+                               self.bot_func,
+                               self.backend,
+                               **self.bot_options)
         while True:
             print(self.board)
 
             # The player's move
-            self.player_gen.update_state(
-                CheckersState(self.board.board, False, [], self.board_size))
+            player_state = CheckersState(self.board.board, False, [],
+                                         self.board_size)
+            self.player_gen.update_state(player_state)
 
-            successors = self.player_gen.successors()
+            legal = index_moves(self.player_gen.moves(), self.board_size)
 
-            if len(successors) == 0:
+            if len(legal) == 0:
                 self._game_over(state)
                 break
 
             moves = self._get_player_move()
             if moves:
-                valid, new_board = self._is_valid_move(successors, moves)
+                valid, move = self._is_valid_move(legal, moves)
             else:
                 valid = False
 
@@ -175,7 +215,8 @@ class CheckersGame:
                 print('That is not a legal move. Please attempt another move')
                 continue
             else:
-                self.board.board = new_board
+                self.board.board = player_state.result(move).board
+                self.paths.append(move[0])
 
             print('\n' + str(self.board))
 
@@ -195,7 +236,13 @@ class CheckersGame:
                 print('The bot has chosen the following move: \n' +
                       bot_move_str)
                 self.board.board = bots_move.board
+                self.paths.append(bots_move.moves)
+                if self.ponder:
+                    self.bot.ponder(CheckersState(self.board.board, False, [],
+                                                  self.board_size))
             elif not bots_move or bots_move.is_terminal():
                 state.bot_lost = True
                 self._game_over(state)
                 break
+
+        self.bot.close()
@@ -14,27 +14,109 @@ state.
 """
 
 
+import threading
 from time import time
-from .successors import SuccessorGenerator
+from .successors import get_generator
+from .position import CheckersPosition
+from .evaluation import Evaluator, get_evaluator, DEFAULT
+from .encoding import encode_move, decode_move, index_moves
+from .parallel import ParallelSearch
+from .batch import np, board_key, stack_boards, require_numpy
+from .transposition import TranspositionTable, EXACT, LOWER, UPPER
+from .stats import SearchStats
+from .deadline import (SearchTimeout, MIN_CHECK_NODES, check_interval,
+                       predict_iteration)
+
+
+# The width of a null window. Scores are floats, so it is much less than the
+# smallest difference between two piece values.
+NULL_WINDOW = 1e-6
+
+# The number of plies each iteration of the search goes deeper than the last.
+# Going two at a time ends every iteration on the same side's move, so the
+# scores of successive iterations can be compared.
+DEPTH_STEP = 2
+
+# Late move reductions: quiet moves after the first LMR_MOVES of a position
+# at least LMR_DEPTH plies from the leaves are searched one ply less deep.
+LMR_MOVES = 3
+LMR_DEPTH = 3
+
+# Futility pruning: with 1 or 2 plies left, quiet moves are skipped when the
+# position's score plus this margin cannot reach alpha. A quiet move gains at
+# most about one man, by moving a man onto an edge; moves which king a man
+# are not quiet.
+FUTILITY_MARGINS = (1.25, 2.5)
+
+# How far either side of the last iteration's score the next iteration's
+# aspiration window reaches at first.
+ASPIRATION = 0.25
 
 
 class CheckersBot:
     """CheckersBot
 
     The CheckersBot class is used to control a bot when playing the checkers
-    game. To decide on which move it should make it performs a minimax
-    iterative deepening depth-first search with Alph-Beta pruning.
+    game. To decide on which move it should make it performs a negamax
+    iterative deepening depth-first search with Alph-Beta pruning, principal
+    variation search and aspiration windows.
 
     Attributes:
         state (CheckersState) : The current state of the game.
         max_score (int) : The upper limit for the minimax score.
         max_depth (int) : The max depth for the bot's iddfs algorithm.
         max_time (double) : The max time in seconds for the bot to search.
+        A search is aborted when it runs out.
+        soft_time (double) : The time in seconds after which no new iteration
+        is started.
         score_func (function) : The scoring function for the bot to use.
+        evaluator (Evaluator) : The evaluator whose tables positions keep
+        their material sums with.
         start_time (int) : The start time of the bot's search.
+        deadline (float) : The time the current search must end by.
+        next_check (int) : The value of nodes at which the search next checks
+        the clock.
+        stopped (bool) : Set to stop a search running in another thread.
+        game (int) : The number of games begun with new_game.
+        generator (class) : The successor generator class used by the search.
+        table (TranspositionTable) : The table of positions already searched.
+        killers (list) : The codes of the two latest moves to cause a cutoff
+        at each ply.
+        history (dict) : How often, weighted by depth, each normal move caused
+        a cutoff, keyed by the move's code and the side on move.
+        pv (list) : The principal variation of the last finished iteration.
+        nodes (int) : The number of positions visited by the last search.
+        cutoffs (int) : The number of beta cutoffs of the last search.
+        first_cutoffs (int) : The number of cutoffs by the first move tried.
+        evals (int) : The number of positions scored by the last search.
+        generated (int) : The number of moves generated by the last search.
+        stats (list) : The SearchStats of each iteration of the last search.
+        stats_stream (file) : A file each SearchStats is written to as a line
+        of JSON, or None.
+        workers (int) : The number of processes the search runs on.
+        options (dict) : The keyword arguments a worker's bot is built with.
+        parallel (ParallelSearch) : The parallel root search, created on the
+        first search when workers is more than one.
+        incremental (bool) : True if an evaluator is used, in which case
+        positions are scored from their running material sums.
+        quiescence (int) : The most plies of jumps searched past the depth
+        limit.
+        lmr (bool) : True if late moves are searched less deep.
+        lmr_research (bool) : True if a reduced move which beats alpha is
+        searched again to the full depth.
+        futility (bool) : True if futile quiet moves near the leaves are
+        skipped.
+        batch_func (function) : The batch scoring function, or None.
+        batch_depth (int) : The depth at which batch scoring starts.
+        book (OpeningBook) : The opening book, or None.
+        tablebase (Tablebase) : The endgame tablebase, or None.
     """
 
-    def __init__(self, state, max_score, max_depth, max_time, score_func):
+    def __init__(self, state, max_score, max_depth, max_time, score_func,
+                 backend='list', hash_mb=16, workers=1, batch_func=None,
+                 batch_depth=1, book=None, tablebase=None,
+                 stats_stream=None, soft_time=None, quiescence=8, lmr=True,
+                 lmr_research=True, futility=True):
         """ __init__
 
         The __init__ function is the constructor for the CheckersBot.
@@ -45,175 +127,873 @@ class CheckersBot:
             max_depth (int) : The max depth for the bot's IDDFS search.\n
             max_time (float) : The max search time for the bot's search.\n
             score_func (function) : The evaluation function used for scoring of
-            states found by the bot's search.\n
+            states found by the bot's search. An Evaluator, or the name of a
+            registered one, is scored incrementally; None uses the default
+            evaluator.\n
+            backend (str) : The name of the successor generator backend.\n
+            hash_mb (float) : The most memory in megabytes the transposition
+            table may use.\n
+            workers (int) : The number of processes to search with. With more
+            than one the root moves are searched in parallel by a
+            ParallelSearch.\n
+            batch_func (function) : A batch scoring function, such as
+            batch.batch_score. If given, every position searched to
+            batch_depth or less has all its leaves scored by one call to it
+            instead of calling score_func once per leaf. Needs NumPy.\n
+            batch_depth (int) : The depth at which batch mode starts.\n
+            book (str) : The file path to an opening book built by
+            source.book. Positions found in it are answered with the book
+            move without searching.\n
+            tablebase (str) : The file path to an endgame tablebase built by
+            source.tablebase. Positions with few enough pieces are scored
+            exactly from it instead of being searched.\n
+            stats_stream (file) : An open file to write the statistics of
+            every iteration of every search to, as JSON lines.\n
+            soft_time (float) : The time in seconds after which no new
+            iteration is started, max_time if None. An iteration is also not
+            started if it is not expected to finish within max_time.\n
+            quiescence (int) : The most plies of jumps searched past the depth
+            limit before a position is scored, so a leaf is not scored in the
+            middle of an exchange. 0 scores leaves as they are.\n
+            lmr (bool) : True to search quiet moves ordered late one ply less
+            deep.\n
+            lmr_research (bool) : True to search a reduced move again to the
+            full depth if it beats alpha. If False, a reduced move is only
+            ever searched one ply less deep.\n
+            futility (bool) : True to skip quiet moves near the leaves which
+            cannot raise the score to alpha.
         """
         self.state = state
         self.max_score = max_score
         self.max_depth = max_depth
         self.max_time = max_time
+        self.soft_time = max_time if soft_time is None else soft_time
         self.start_time = 0
-        if score_func:
-            self.score_func = score_func
+        self.stopped = False
+        self.game = 0
+        self._ponder_thread = None
+        self._ponder_state = self._ponder_move = None
+        self.generator = get_generator(backend)
+        self.table = TranspositionTable(hash_mb)
+        self.killers, self.history, self.pv = [], {}, []
+        self.nodes = self.cutoffs = self.first_cutoffs = 0
+        self.evals = self.generated = 0
+        self.set_deadline(0)
+        self.stats = []
+        self.stats_stream = stats_stream
+        self.workers = workers
+        self.quiescence = quiescence
+        self.lmr, self.lmr_research = lmr, lmr_research
+        self.futility = futility
+        self.options = {'backend': backend, 'hash_mb': hash_mb,
+                        'batch_func': batch_func, 'batch_depth': batch_depth,
+                        'tablebase': tablebase, 'quiescence': quiescence,
+                        'lmr': lmr, 'lmr_research': lmr_research,
+                        'futility': futility}
+        if batch_func:
+            require_numpy()
+        self.batch_func = batch_func
+        self.batch_depth = batch_depth
+        self.parallel = None
+        self.book = None
+        if book:
+            # Imported here so source.book and source.tablebase can also be
+            # run as scripts.
+            from .book import OpeningBook
+            self.book = OpeningBook(book)
+        self.tablebase = None
+        if tablebase:
+            from .tablebase import Tablebase
+            self.tablebase = Tablebase(tablebase)
+        if isinstance(score_func, str):
+            score_func = get_evaluator(score_func)
+        self.incremental = not score_func or isinstance(score_func, Evaluator)
+        if self.incremental:
+            self.evaluator = score_func or DEFAULT
+            self.score_func = self.evaluator.score
         else:
-            self.score_func = self._score
+            self.evaluator = DEFAULT
+            self.score_func = score_func
 
-    def _is_invulnerable(self, state, x, y):
-        """_is_invulnerable
+    def _killers(self, ply):
+        """_killers
 
-        The _is_invulnerable function checks to see if a piece is at the edge
-        of the board. If the piece is located at an edge it cannot be taken.
+        The _killers function returns the two killer moves kept for a ply of
+        the search, growing the list of killer moves if needed.
 
         Args:
-            state (CheckersState) : The current state of the game.
-            x (int) : The row on the board.
-            y (int) : The column on the board.
+            ply (int) : The number of moves made since the root.
 
         Returns:
-            bool : True if the piece is on an edge, False otherwise.
+            list : The two most recent killer moves at ply, or None.
         """
-        x_bounds = x == 0 or x == (state.size - 1)
-        y_bounds = y == 0 or y == (state.size - 1)
-        return x_bounds or y_bounds
+        while len(self.killers) <= ply:
+            self.killers.append([None, None])
+        return self.killers[ply]
 
-    def _score(self, state):
-        """_score
+    def _code(self, position, move):
+        """_code
 
-        This is a generic scoring function for a CheckersState. It simply
-        assigns a score to each piece on the board and sums that score. It
-        also will adjust the score if the piece is invulnerable. Pieces
-        which cannot be taken are given a higher score.
+        The _code function encodes a move of a position for the
+        transposition table.
 
         Args:
-            state (CheckersState) : The current game state.
+            position (CheckersPosition) : The position the move is made
+            from.
+            move (tuple) : The move, or None.
 
         Returns:
-            score (int) : A score based on how many pieces are on the board in
-            the current state.
+            int : The code of the move, or None if move is None.
         """
-        bot, player = 0, 0
-        for x, row in enumerate(state.board):
-            for y, square in enumerate(row):
-                if self._is_invulnerable(state, x, y):
-                    adjuster = 1
-                else:
-                    adjuster = 0
+        if move is None:
+            return None
+        return encode_move(move[0], position.state.size)
 
-                if square == 'b':
-                    bot += (1.0 + adjuster) * (1 + (.1 * ((x + 1) 
-                                               / state.size)))
-                elif square == 'B':
-                    bot += 2 + adjuster
-                elif square == 'p':
-                    player += (1.0 + adjuster) * (1 + (.1 * ((state.size 
-                                                  - (x + 1)) / state.size)))
-                elif square == 'P':
-                    player += 2 + adjuster
+    def _to_table(self, score, ply):
+        """_to_table
 
-        return (bot - player) if state.bots_move else (player - bot)
+        The _to_table function turns a score of the search into the score
+        saved in the transposition table. Wins and losses are scored by how
+        many plies from the root they are, but a position may be reached at
+        other plies, so they are saved counted from the position instead.
 
-    def _max_value(self, state, alpha, beta, depth):
-        """_max_value
+        Args:
+            score (float) : The score of the position.
+            ply (int) : The number of moves made since the root.
 
-        The _max_value function is used by the minimax algorithm to attempt to
-        find the best (highest value) move from all the successors of the
-        current state.
+        Returns:
+            float : The score to save.
+        """
+        if score >= self.max_score / 2:
+            return score + ply
+        if score <= -self.max_score / 2:
+            return score - ply
+        return score
+
+    def _from_table(self, score, ply):
+        """_from_table
+
+        The _from_table function turns a score saved by _to_table back into
+        a score of the search.
 
         Args:
-            state (CheckersState) : The current state of the game.
-            alpha (int) : The current alpha pruning score.
-            beta (int) : The current beta pruning score.
-            depth (int) : The current depth of the search algorithm.
+            score (float) : The saved score.
+            ply (int) : The number of moves made since the root.
+
+        Returns:
+            float : The score of the position.
+        """
+        if score >= self.max_score / 2:
+            return score - ply
+        if score <= -self.max_score / 2:
+            return score + ply
+        return score
+
+    def _order_moves(self, position, moves, ply, hash_code):
+        """_order_moves
+
+        The _order_moves function sorts the moves of a position so the ones
+        most likely to cause a cutoff are searched first: the best move stored
+        in the transposition table, the move of the previous iteration's
+        principal variation, jumps (most pieces taken first), the killer moves
+        of this ply and then the rest by their history score. Moves which tie
+        keep the order the generator produced them in.
+
+        Args:
+            position (CheckersPosition) : The current position of the game.
+            moves (list) : The moves of the current position.
+            ply (int) : The number of moves made since the root.
+            hash_code (int) : The code of the stored best move, or None.
+
+        Returns:
+            list : The sorted moves.
+        """
+        size = position.state.size
+        hash_path = decode_move(hash_code, size) if hash_code else None
+        pv_move = None
+        if ply < len(self.pv) and self.pv[ply][0] == position.hash:
+            pv_move = self.pv[ply][1]
+        killers = self._killers(ply)
+        history = self.history
+        side = position.state.bots_move
+
+        def priority(move):
+            if move[0] == hash_path:
+                return 4, 0
+            if move == pv_move:
+                return 3, 0
+            if move[1]:
+                return 2, len(move[1])
+            code = encode_move(move[0], size)
+            if code in killers:
+                return 1, 0
+            return 0, history.get(code << 1 | side, 0)
+
+        moves.sort(key=priority, reverse=True)
+        return moves
+
+    def _record_cutoff(self, position, move, ply, depth):
+        """_record_cutoff
+
+        The _record_cutoff function remembers a normal move which caused a
+        cutoff, both as a killer move for its ply and in the history table.
+        Jumps are already searched early, so they are left out.
+
+        Args:
+            position (CheckersPosition) : The position the move was made
+            from.
+            move (tuple) : The move which caused the cutoff.
+            ply (int) : The number of moves made since the root.
+            depth (int) : The depth left to search below the position.
+        """
+        if move[1]:
+            return
+        code = encode_move(move[0], position.state.size)
+        killers = self._killers(ply)
+        if code != killers[0]:
+            killers[1], killers[0] = killers[0], code
+        key = code << 1 | position.state.bots_move
+        self.history[key] = self.history.get(key, 0) + depth * depth
+
+    def _count_cutoff(self, move, moves):
+        """_count_cutoff
+
+        The _count_cutoff function counts a cutoff for the search statistics.
+
+        Args:
+            move (tuple) : The move which caused the cutoff.
+            moves (list) : The moves of the position, in the order searched.
+        """
+        self.cutoffs += 1
+        if move is moves[0]:
+            self.first_cutoffs += 1
+
+    def _alpha_beta_search(self, position, alpha, beta, depth, ply):
+        """_alpha_beta_search
+
+        The _alpha_beta_search function is the negamax core of the search.
+        Every score is from the point of view of the side on move, so a
+        child's score is negated, and every ply takes one off depth. The first
+        move is searched with the full window; the rest are principal
+        variation searched: first with a null window, which only asks whether
+        the move beats alpha, and again with the full window if it does.
+        Results are looked up in and saved to the transposition table, and
+        positions at the depth limit are scored by _quiescence. The search is
+        made selective by late move reductions and futility pruning; a quiet
+        move is one which neither jumps nor kings a man.
+
+        Args:
+            position (CheckersPosition) : The current position of the game.
+            alpha (float) : The score the side on move is already sure of.
+            beta (float) : The score the other side is already sure of.
+            depth (int) : The number of plies left to search.
+            ply (int) : The number of moves made since the root.
 
         Return:
-            int : The max score for the successor states.
-        """
-        val = -self.max_score
-        max_gen = SuccessorGenerator(state)
-        for successor in max_gen.successors():
-            val = max(val, self._alpha_beta_search(
-                      successor, alpha, beta, depth))
-            if val >= beta:
-                return val
-            alpha = max(alpha, val)
+            float : The score of the position for the side on move. A score
+            of alpha or less is only an upper bound and one of beta or more
+            only a lower bound.
+
+        Raises:
+            SearchTimeout : If the deadline has passed.
+        """
+        self.nodes += 1
+        if self.nodes >= self.next_check:
+            self._check_time()
+        state = position.state
+        if position.is_terminal():
+            # The side on move has no pieces left.
+            return ply - self.max_score
+
+        if self.tablebase and (position.bot_pieces + position.player_pieces
+                               <= self.tablebase.pieces):
+            score = self.tablebase.score(state, self.max_score - ply)
+            if score is not None:
+                return score
+
+        if depth <= 0:
+            return self._quiescence(position, alpha, beta, ply,
+                                    self.quiescence)
+
+        hash_code = None
+        entry = self.table.probe(position.hash)
+        if entry is not None:
+            _, stored_depth, flag, score, hash_code, _ = entry
+            score = self._from_table(score, ply)
+            if stored_depth >= depth and (
+                    flag == EXACT or (flag == LOWER and score >= beta) or
+                    (flag == UPPER and score <= alpha)):
+                return score
+
+        if self.batch_func and depth <= self.batch_depth:
+            val, best_move = self._batch_search(position, depth, ply)
+            self.table.store(position.hash, depth, EXACT,
+                             self._to_table(val, ply),
+                             self._code(position, best_move))
+            return val
+
+        original_alpha = alpha
+        val, best_move = ply - self.max_score, None
+        moves = self._order_moves(position, position.moves(), ply, hash_code)
+        self.generated += len(moves)
+        killers = self._killers(ply)
+        # Near the leaves of a null window search, quiet moves are pruned if
+        # even a good one could not lift the score of the position to alpha.
+        futile = False
+        if (self.futility and depth <= len(FUTILITY_MARGINS) and
+                beta - alpha <= NULL_WINDOW and
+                abs(alpha) < self.max_score / 2):
+            static = (position.score() if self.incremental
+                      else self.score_func(state))
+            futile = static + FUTILITY_MARGINS[depth - 1] <= alpha
+        for i, move in enumerate(moves):
+            x, y = move[0][0]
+            quiet = not move[1] and move[2] == position.board[x][y]
+            if futile and quiet and best_move is not None:
+                continue
+            position.make_move(move)
+            if best_move is None:
+                score = -self._alpha_beta_search(position, -beta, -alpha,
+                                                 depth - 1, ply + 1)
+            else:
+                # Quiet moves ordered late are searched less deep, and
+                # searched again to the full depth if they beat alpha. With
+                # lmr_research off they are never searched to the full
+                # depth, not even by the full window search.
+                reduction = 0
+                if (self.lmr and quiet and i >= LMR_MOVES and
+                        depth >= LMR_DEPTH and
+                        encode_move(move[0], state.size) not in killers):
+                    reduction = 1
+                score = -self._alpha_beta_search(
+                    position, -alpha - NULL_WINDOW, -alpha,
+                    depth - 1 - reduction, ply + 1)
+                if reduction and score > alpha and self.lmr_research:
+                    reduction = 0
+                    score = -self._alpha_beta_search(
+                        position, -alpha - NULL_WINDOW, -alpha, depth - 1,
+                        ply + 1)
+                if alpha < score < beta:
+                    score = -self._alpha_beta_search(
+                        position, -beta, -alpha, depth - 1 - reduction,
+                        ply + 1)
+            position.unmake_move(move)
+            if best_move is None or score > val:
+                val, best_move = score, move
+            if val > alpha:
+                alpha = val
+            if alpha >= beta:
+                self._count_cutoff(move, moves)
+                self._record_cutoff(position, move, ply, depth)
+                break
+
+        if val <= original_alpha:
+            flag = UPPER
+        elif val >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        self.table.store(position.hash, depth, flag,
+                         self._to_table(val, ply),
+                         self._code(position, best_move))
         return val
 
-    def _min_value(self, state, alpha, beta, depth):
-        """_min_value
+    def _quiescence(self, position, alpha, beta, ply, extension):
+        """_quiescence
 
-        The _min_value function is used by the minimax algorithm to attempt to
-        find the worst (least value) move from all the successors of the
-        current state.
+        The _quiescence function scores a position at the depth limit. Moves
+        are not forced, so the side on move may stand pat on the score of the
+        position as it is; only its jumps are searched, for as long as jumps
+        follow each other, to see whether taking pieces does better. This
+        stops the search from scoring a position halfway through an exchange.
 
         Args:
-            state (CheckersState) : The current state of the game.
-            alpha (int) : The current alpha pruning score.
-            beta (int) : The current beta pruning score.
-            depth (int) : The current depth of the search algorithm.
+            position (CheckersPosition) : The current position of the game.
+            alpha (float) : The score the side on move is already sure of.
+            beta (float) : The score the other side is already sure of.
+            ply (int) : The number of moves made since the root.
+            extension (int) : The number of plies of jumps still allowed.
 
         Return:
-            int : The min score for the successor states.
-        """
-        val = self.max_score
-        min_gen = SuccessorGenerator(state)
-        for successor in min_gen.successors():
-            val = min(val, self._alpha_beta_search(
-                successor, alpha, beta, depth - 1))
-            if val <= alpha:
-                return val
-            beta = min(beta, val)
+            float : The score of the position for the side on move, bounded
+            by alpha and beta as for _alpha_beta_search.
+
+        Raises:
+            SearchTimeout : If the deadline has passed.
+        """
+        self.evals += 1
+        if self.incremental:
+            val = position.score()
+        else:
+            val = self.score_func(position.state)
+        if val >= beta or extension <= 0:
+            return val
+        jumps = position.jumps()
+        self.generated += len(jumps)
+        if not jumps:
+            return val
+        alpha = max(alpha, val)
+        jumps.sort(key=lambda move: len(move[1]), reverse=True)
+        for move in jumps:
+            position.make_move(move)
+            self.nodes += 1
+            if self.nodes >= self.next_check:
+                self._check_time()
+            if position.is_terminal():
+                score = self.max_score - ply - 1
+            else:
+                score = -self._quiescence(position, -beta, -alpha, ply + 1,
+                                          extension - 1)
+            position.unmake_move(move)
+            if score > val:
+                val = score
+                if val > alpha:
+                    alpha = val
+                if alpha >= beta:
+                    self._count_cutoff(move, jumps)
+                    break
         return val
 
-    def _alpha_beta_search(self, state, alpha, beta, depth):
-        """_alpha_beta_search
+    def _expand(self, position, depth, ply, leaves):
+        """_expand
 
-        The _alpha_beta_search function is used by the minimax algorithm to
-        attempt to prune out tree branches of the search tree for which the
-        result would be one we will likely never choose.
+        The _expand function builds the whole tree below a position, without
+        pruning, down to the depth limit. The leaves are not scored yet; their
+        boards are collected instead. Unlike _alpha_beta_search it does not
+        follow jumps past the depth limit.
 
         Args:
-            state (CheckersState) : The current state of the game.
-            alpha (int) : The current alpha pruning score.
-            beta (int) : The current beta pruning score.
-            depth (int) : The current depth of the search algorithm.
+            position (CheckersPosition) : The current position of the game.
+            depth (int) : The number of plies left to search.
+            ply (int) : The number of moves made since the root.
+            leaves (list) : The flattened boards of the leaves found so far,
+            each with True if the bot is on move.
 
-        Return:
-            int : The score for the given state.
+        Returns:
+            tuple : (0, i) for the i-th leaf, (1, score) for a position whose
+            score is already known and (2, children) for any other position.
+
+        Raises:
+            SearchTimeout : If the deadline has passed.
+        """
+        self.nodes += 1
+        if self.nodes >= self.next_check:
+            self._check_time()
+        state = position.state
+        if position.is_terminal():
+            return 1, ply - self.max_score
+
+        if depth <= 0:
+            self.evals += 1
+            leaves.append((board_key(position.board), state.bots_move))
+            return 0, len(leaves) - 1
+
+        moves = position.moves()
+        self.generated += len(moves)
+        if not moves:
+            return 1, ply - self.max_score
+        children = []
+        for move in moves:
+            position.make_move(move)
+            children.append(self._expand(position, depth - 1, ply + 1,
+                                         leaves))
+            position.unmake_move(move)
+        return 2, children
+
+    def _back_up(self, node, scores):
+        """_back_up
+
+        The _back_up function computes the negamax score of a tree built by
+        _expand once its leaves have been scored.
+
+        Args:
+            node (tuple) : A node returned by _expand.
+            scores (list) : The score of every leaf.
+
+        Returns:
+            float : The score of node for the side on move.
+        """
+        kind, payload = node
+        if kind == 0:
+            return scores[payload]
+        if kind == 1:
+            return payload
+        return max(-self._back_up(child, scores) for child in payload)
+
+    def _batch_search(self, position, depth, ply):
+        """_batch_search
+
+        The _batch_search function searches the last plies of the tree in
+        batch mode: every leaf below the position is collected, all of them
+        are scored with one call to batch_func, and the scores are then backed
+        up by negamax. Pruning is given up for these plies in exchange for
+        scoring thousands of leaves per call instead of one.
+
+        Args:
+            position (CheckersPosition) : The current position of the game.
+            depth (int) : The number of plies left to search.
+            ply (int) : The number of moves made since the root.
+
+        Returns:
+            tuple : The score of the position for the side on move and its
+            best move.
+        """
+        leaves = []
+        moves = position.moves()
+        self.generated += len(moves)
+        if not moves:
+            return ply - self.max_score, None
+        children = []
+        for move in moves:
+            position.make_move(move)
+            children.append(self._expand(position, depth - 1, ply + 1,
+                                         leaves))
+            position.unmake_move(move)
+
+        scores = []
+        if leaves:
+            boards = stack_boards([key for key, _ in leaves],
+                                  position.state.size)
+            sides = np.array([bots_move for _, bots_move in leaves])
+            scores = self.batch_func(boards, sides).tolist()
+
+        values = [-self._back_up(child, scores) for child in children]
+        best = max(values)
+        return best, moves[values.index(best)]
+
+    def _principal_variation(self, position, best_move):
+        """_principal_variation
+
+        The _principal_variation function follows the best moves stored in
+        the transposition table from the root to find the line of play the
+        last iteration expects.
+
+        Args:
+            position (CheckersPosition) : The root position.
+            best_move (tuple) : The best move found at the root.
+
+        Returns:
+            list : A list of (hash, move) pairs, one per ply, giving the hash
+            of each position on the line and the move expected from it.
+        """
+        pv, seen, move = [], set(), best_move
+        while move is not None and position.hash not in seen:
+            seen.add(position.hash)
+            pv.append((position.hash, move))
+            position.make_move(move)
+            entry = self.table.probe(position.hash)
+            move = None
+            if entry is not None and entry[4] is not None:
+                move = index_moves(position.moves(),
+                                   position.state.size).get(entry[4])
+        for _, move in reversed(pv):
+            position.unmake_move(move)
+        return pv
+
+    def reset_tables(self):
+        """reset_tables
+
+        The reset_tables function forgets everything learned by earlier
+        searches: the transposition table, killer moves, history scores and
+        principal variation.
+        """
+        self.table.clear()
+        self.killers, self.history, self.pv = [], {}, []
+
+    def age_tables(self):
+        """age_tables
+
+        The age_tables function prepares what earlier searches learned for a
+        search two plies further into the game, after the bot's move and the
+        player's reply. The transposition table marks its entries as old, the
+        killer moves and principal variation move up two plies and the history
+        scores are halved so recent cutoffs count for more.
+        """
+        self.table.age()
+        self.killers, self.pv = self.killers[2:], self.pv[2:]
+        self.history = {key: value // 2 for key, value in self.history.items()
+                        if value > 1}
+
+    def new_game(self):
+        """new_game
+
+        The new_game function gets the bot ready for a new game by stopping
+        any pondering and forgetting everything learned in the last one.
+        """
+        self.stop_pondering()
+        self.reset_tables()
+        self.game += 1
+
+    def set_deadline(self, deadline):
+        """set_deadline
+
+        The set_deadline function sets the time a search must end by, and has
+        the clock checked again soon, as nothing is known yet of how fast the
+        search will go.
+
+        Args:
+            deadline (float) : The time the search must end by.
+        """
+        self.deadline = deadline
+        self.next_check = self.nodes + MIN_CHECK_NODES
+        self._checked_nodes, self._checked_at = self.nodes, time()
+
+    def _check_time(self):
+        """_check_time
+
+        The _check_time function checks the clock, and sets when it is next
+        checked from how fast the search went since the last check.
+
+        Raises:
+            SearchTimeout : If the deadline has passed or stopped is set.
+        """
+        now = time()
+        if now > self.deadline or self.stopped:
+            raise SearchTimeout()
+        self.next_check = self.nodes + check_interval(
+            self.nodes - self._checked_nodes, now - self._checked_at,
+            self.deadline - now)
+        self._checked_nodes, self._checked_at = self.nodes, now
+
+    def counters(self):
+        """counters
+
+        The counters function returns the running counts of the search
+        statistics.
+
+        Returns:
+            tuple : The nodes, cutoffs, first_cutoffs, evals and generated
+            counts.
+        """
+        return (self.nodes, self.cutoffs, self.first_cutoffs, self.evals,
+                self.generated)
+
+    def add_counters(self, counts):
+        """add_counters
+
+        The add_counters function adds counts from another search, such as a
+        parallel worker's, to the running counts.
+
+        Args:
+            counts (tuple) : The counts to add, ordered as counters returns
+            them.
         """
-        if state.is_terminal():
-            return (self.max_score if state.bots_move != state.bot_lost
-                    else -self.max_score)
+        (self.nodes, self.cutoffs, self.first_cutoffs, self.evals,
+         self.generated) = [a + b for a, b in zip(self.counters(), counts)]
 
-        if depth <= 0 or time() - self.start_time > self.max_time:
-            return self.score_func(state)
+    def _record_iteration(self, depth, complete, score, start, counts, size):
+        """_record_iteration
 
-        return (self._max_value(state, alpha, beta, depth) if state.bots_move
-                else self._min_value(state, alpha, beta, depth))
+        The _record_iteration function adds the SearchStats of an iteration
+        to stats and writes it to stats_stream.
 
-    def _iterative_deepening_dfs(self):
+        Args:
+            depth (int) : The depth of the iteration.
+            complete (bool) : False if the deadline cut the iteration short.
+            score (float) : The score of the best move.
+            start (float) : The time the iteration began.
+            counts (tuple) : The counters when the iteration began.\n
+            size (int) : The size of the board, to encode the principal
+            variation with.
+        """
+        now = time()
+        counts = [a - b for a, b in zip(self.counters(), counts)]
+        stats = SearchStats(
+            depth, complete, counts, now - start, score,
+            [encode_move(move[0], size) for _, move in self.pv])
+        self.stats.append(stats)
+        if self.stats_stream:
+            self.stats_stream.write(stats.to_json() + '\n')
+            self.stats_stream.flush()
+
+    def search_root_move(self, position, move, alpha, beta, depth,
+                         scout=False):
+        """search_root_move
+
+        The search_root_move function searches the position reached by one
+        root move.
+
+        Args:
+            position (CheckersPosition) : The root position.
+            move (tuple) : The root move to search.
+            alpha (float) : The best score already found for another root
+            move, or the bottom of the aspiration window.
+            beta (float) : The top of the aspiration window.
+            depth (int) : The depth of the current iteration.
+            scout (bool) : True to first search with a null window and only
+            search again with the full window if the move beats alpha.
+
+        Returns:
+            float : The score of the move for the bot, or a score no higher
+            than alpha if it cannot beat alpha, or one no lower than beta if
+            it reaches beta.
+        """
+        position.make_move(move)
+        if scout:
+            score = -self._alpha_beta_search(position, -alpha - NULL_WINDOW,
+                                             -alpha, depth - 1, 1)
+            if alpha < score < beta:
+                score = -self._alpha_beta_search(position, -beta, -alpha,
+                                                 depth - 1, 1)
+        else:
+            score = -self._alpha_beta_search(position, -beta, -alpha,
+                                             depth - 1, 1)
+        position.unmake_move(move)
+        return score
+
+    def _search_root(self, state, position, root_moves, depth, parallel,
+                     alpha, beta):
+        """_search_root
+
+        The _search_root function runs one iteration of the search over the
+        root moves, in parallel if given a ParallelSearch. The first move is
+        searched with the whole window and the rest are principal variation
+        searched. A later move only replaces the best one if it beats alpha,
+        as only then is its score more than a bound from the scout search.
+        If the deadline passes, the best of the root moves searched to the
+        end is returned. The clock is also checked before each root move.
+
+        Args:
+            state (CheckersState) : The root state, which position was
+            created from.
+            position (CheckersPosition) : The root position. It is left in an
+            unknown state if the deadline passes.
+            root_moves (list) : The root moves, best first.
+            depth (int) : The depth of the iteration.
+            parallel (ParallelSearch) : The parallel search to use, or None.
+            alpha (float) : The bottom of the aspiration window.
+            beta (float) : The top of the aspiration window.
+
+        Returns:
+            tuple : The best score, the best move and False if the deadline
+            cut the iteration short. The best move is None if not even the
+            first root move was searched to the end. A best score of alpha or
+            less, or of beta or more, means the true score is outside the
+            window.
+        """
+        if parallel and len(root_moves) > 1:
+            return parallel.search(state, position, root_moves, depth, alpha,
+                                   beta)
+        val, best_move = alpha, None
+        try:
+            for move in root_moves:
+                self._check_time()
+                score = self.search_root_move(position, move, alpha, beta,
+                                              depth, best_move is not None)
+                if best_move is None or score > alpha:
+                    val, best_move = score, move
+                    alpha = max(alpha, score)
+                if alpha >= beta:
+                    break
+        except SearchTimeout:
+            return val, best_move, False
+        return val, best_move, True
+
+    def _iterative_deepening_dfs(self, state, start_time, ponder=False,
+                                 age=True):
         """_iterative_deepening_dfs
 
         The _iterative_deepening_dfs searches the tree of successor states
-        looking for the best move. It uses a minimax algorithm with Alpha-Beta
+        looking for the best move. It uses a negamax algorithm with Alpha-Beta
         pruning to ignore branches of the tree where we will never choose the
-        result from.
+        result from. The whole search runs on one CheckersPosition with moves
+        made and unmade in place; only the chosen move is turned into a new
+        CheckersState. Each iteration starts with the previous iteration's
+        best move and follows its principal variation first. What earlier
+        searches of the game learned is kept, aged by age_tables.
+
+        Each iteration searches DEPTH_STEP plies deeper than the last, up to
+        max_depth - 1, in an aspiration window of ASPIRATION either side of
+        the last iteration's score. A score outside the window is searched
+        again with the window widened on that side, four times as far each
+        time.
+
+        The search ends by max_time. No iteration is started after soft_time,
+        or when it is not expected to finish in time, and one which is cut
+        short only counts the root moves it searched to the end. As the
+        first of those is the previous best move, a later one is only chosen
+        if it is better. If not even the first root move of the first
+        iteration is searched to the end, the first legal move is played
+        rather than none.
+
+        Args:
+            state (CheckersState) : The state to search.
+            start_time (float) : The time the limits are counted from.
+            ponder (bool) : True to search without a time limit, in this
+            process only, until stopped is set.
+            age (bool) : False if the search carries on from the last one,
+            so the tables are not aged.
 
         Returns:
-            bestMove (CheckersState) : A CheckersState representing the end
-            state of the "best" move the bot could make.
+            tuple : The (path, captured, piece) move tuple of the "best" move
+            the bot could make, or None if it has no moves.
         """
-        self.start_time = time()
+        self.start_time = start_time
+        self.nodes = self.cutoffs = self.first_cutoffs = 0
+        if ponder:
+            self.set_deadline(float('inf'))
+            soft_deadline = self.deadline
+        else:
+            self.set_deadline(start_time + self.max_time)
+            soft_deadline = start_time + self.soft_time
+        times = []
+        self.evals = self.generated = 0
+        self.stats = []
+        if age:
+            self.age_tables()
         best_move = None
-        generator = SuccessorGenerator(self.state)
+        position = CheckersPosition(state, self.generator,
+                                    self.evaluator.tables(state.size))
+        root_moves = position.moves()
+        self.generated += len(root_moves)
+        if self.workers > 1 and len(root_moves) > 1 and not self.parallel:
+            self.parallel = ParallelSearch(self, self.workers, self.options)
+        parallel = None if ponder else self.parallel
 
-        for depth in range(1, self.max_depth):
-            if time() - self.start_time > self.max_time:
+        val = None
+        for depth in range(DEPTH_STEP, self.max_depth + DEPTH_STEP - 1,
+                           DEPTH_STEP):
+            # The last iteration may be shorter, to stop at max_depth - 1.
+            depth = min(depth, self.max_depth - 1)
+            start = time()
+            if start > soft_deadline or (
+                    start + predict_iteration(times) > self.deadline):
                 break
-            val = -self.max_score
-            for successor in generator.successors():
-                score = self._alpha_beta_search(
-                    successor, -self.max_score, self.max_score, depth)
-                if score > val:
-                    val, best_move = score, successor
+            counts = self.counters()
+            alpha, beta = -self.max_score, self.max_score
+            delta = ASPIRATION
+            if val is not None and abs(val) < self.max_score / 2:
+                alpha, beta = val - delta, val + delta
+            while True:
+                val, move, complete = self._search_root(
+                    state, position, root_moves, depth, parallel, alpha,
+                    beta)
+                if not complete:
+                    break
+                # Search again with a wider window if the score fell outside
+                # the aspiration window.
+                if val <= alpha and alpha > -self.max_score:
+                    alpha = max(val - delta, -self.max_score)
+                elif val >= beta and beta < self.max_score:
+                    beta = min(val + delta, self.max_score)
+                else:
+                    break
+                delta *= 4
+            if not complete:
+                best_move = move or best_move
+                self._record_iteration(depth, False, val, start, counts,
+                                       state.size)
+                break
+            best_move = move
+            if best_move is not None:
+                root_moves.remove(best_move)
+                root_moves.insert(0, best_move)
+                self.pv = self._principal_variation(position, best_move)
+            self._record_iteration(depth, True, val, start, counts,
+                                   state.size)
+            times.append(time() - start)
+        if best_move is None and root_moves:
+            best_move = root_moves[0]
         return best_move
 
     def update_state(self, new_state):
@@ -227,14 +1007,140 @@ class CheckersBot:
         """
         self.state = new_state
 
+    def ponder(self, state):
+        """ponder
+
+        The ponder function starts searching on the opponent's time. Given the
+        state after the bot's move, it predicts the player's reply from the
+        principal variation of the last search and searches the position it
+        leads to in a background thread until get_move is called. If the
+        player does make that reply, get_move goes on from where the ponder
+        search got to, counting the time pondered as time searched.
+
+        Args:
+            state (CheckersState) : The state with the player on move.
+        """
+        self.stop_pondering()
+        if len(self.pv) < 2 or self.pv[1][1] not in self.generator(
+                state).moves():
+            return
+        self._ponder_state = state.result(self.pv[1][1])
+        if self.book and self.book.lookup(self._ponder_state):
+            return
+        self._ponder_move = None
+        self.stopped = False
+        self._ponder_thread = threading.Thread(
+            target=self._ponder, args=(self._ponder_state, time()),
+            daemon=True)
+        self._ponder_thread.start()
+
+    def _ponder(self, state, start_time):
+        """_ponder
+
+        The _ponder function is the body of the pondering thread.
+
+        Args:
+            state (CheckersState) : The predicted state to search.
+            start_time (float) : The time pondering began.
+        """
+        self._ponder_move = self._iterative_deepening_dfs(state, start_time,
+                                                          ponder=True)
+
+    def stop_pondering(self):
+        """stop_pondering
+
+        The stop_pondering function stops the pondering thread, if there is
+        one, and waits for it to finish.
+
+        Returns:
+            CheckersState : The state that was pondered, or None if the bot
+            was not pondering.
+        """
+        if not self._ponder_thread:
+            return None
+        self.stopped = True
+        self._ponder_thread.join()
+        self._ponder_thread = None
+        self.stopped = False
+        return self._ponder_state
+
+    def score_move(self, state, move, depth):
+        """score_move
+
+        The score_move function searches one root move of a state with the
+        full window. Searched to the depth of the last finished iteration of
+        a search of the same state, its score has the same horizon as that
+        iteration's best score, so the two can be compared; the tables the
+        search filled are used again. It stops after max_time.
+
+        Args:
+            state (CheckersState) : The root state.
+            move (tuple) : The (path, captured, piece) move tuple to score.
+            depth (int) : The depth to search the move to.
+
+        Returns:
+            float : The score of the move for the side on move, or None if
+            the time ran out first.
+        """
+        position = CheckersPosition(state, self.generator,
+                                    self.evaluator.tables(state.size))
+        self.set_deadline(time() + self.max_time)
+        try:
+            return self.search_root_move(position, move, -self.max_score,
+                                         self.max_score, depth)
+        except SearchTimeout:
+            return None
+
     def get_move(self):
         """get_move
 
-        The get_move function is a public helper function which simply calls
-        the iddfs function.
+        The get_move function is a public helper function which plays the
+        book move if the current state is in the opening book, and otherwise
+        calls the iddfs function. If the bot pondered the current state, the
+        search carries on from the pondering, and if the bot has pondered for
+        longer than soft_time the pondering's move is played at once. If it
+        pondered another state the tables are not aged again, as the
+        pondering already aged them when it began.
 
         Returns:
             CheckersState : The state object representing the end state of
             what the bot has determined is the "best" move.
         """
-        return self._iterative_deepening_dfs()
+        pondered = self.stop_pondering()
+        if self.book:
+            move = self.book.lookup(self.state)
+            if move:
+                self.nodes = self.cutoffs = self.first_cutoffs = 0
+                self.evals = self.generated = 0
+                self.stats = []
+                return self.state.result(move)
+        if (pondered and pondered.squares == self.state.squares and
+                pondered.bots_move == self.state.bots_move):
+            if self._ponder_move and (time() - self.start_time
+                                      >= self.soft_time):
+                move = self._ponder_move
+            else:
+                move = self._iterative_deepening_dfs(
+                    self.state, self.start_time, age=False)
+        else:
+            move = self._iterative_deepening_dfs(self.state, time(),
+                                                 age=pondered is None)
+        return self.state.result(move) if move else None
+
+    def close(self):
+        """close
+
+        The close function stops pondering, shuts down the worker processes
+        of a parallel search, if there are any, and closes the opening book
+        and the tablebase.
+        """
+        self.stop_pondering()
+        if self.book:
+            self.book.close()
+            self.book = None
+        if self.tablebase:
+            self.tablebase.close()
+            self.tablebase = None
+        if self.parallel:
+            self.parallel.close()
+            self.parallel = None
@@ -17,8 +17,16 @@ representation of the game board, win/loss condition, and player turn.
 class CheckersState:
     '''CheckersState represents a board state for a checkers game.
 
+    The board is kept packed as bytes, one character per square row by row,
+    which is small and hashable. It is unpacked into a list of rows the first
+    time board is read, and the rows are kept from then on. A state built
+    from a list of rows keeps that list, and the owner may change it in
+    place, as CheckersPosition does; squares then packs it afresh on every
+    read. Rows unpacked from squares must not be changed.
+
     Attributes:
         board : A list of strings which represent the state of the board.
+        squares (bytes) : The board packed one byte per square.
         bots_move : True if it is black's (the bot's) move.
         moves : A list of coordinates representing the sequence of moves.
         size : Size of the board. i.e. if the size is 8 then the board is 8x8.
@@ -26,6 +34,9 @@ class CheckersState:
         False otherwise.
     '''
 
+    __slots__ = ('_squares', '_rows', 'bots_move', 'moves', 'size',
+                 'bot_lost')
+
     def __init__(self, board, bots_move, moves, size):
         """__init__
 
@@ -34,19 +45,60 @@ class CheckersState:
 
         Args:
             board (list) : A list of strings representing the current state of
-            the game board.\n
+            the game board, or the board packed as bytes.\n
             bots_move (bool) : True if it's the bot's move, False otherwise.\n
             moves (list) : A list of tuples (x, y) representing the squares in
             the proposed move.\n
             size (int) : The size of the checkers board. A size of 6 is a 6x6
             board.
         """
-        self.board = board
+        if isinstance(board, bytes):
+            self._squares, self._rows = board, None
+        else:
+            self._squares, self._rows = None, board
         self.bots_move = bots_move
         self.moves = moves
         self.size = size
         self.bot_lost = False
 
+    @property
+    def board(self):
+        """board
+
+        The board property returns the board as a list of rows, each a list
+        of one character strings, unpacking squares if needed.
+
+        Returns:
+            list : The board.
+        """
+        if self._rows is None:
+            text, size = self._squares.decode('ascii'), self.size
+            self._rows = [list(text[i:i + size])
+                          for i in range(0, size * size, size)]
+        return self._rows
+
+    @board.setter
+    def board(self, board):
+        """Sets the board from a list of rows or from packed bytes."""
+        if isinstance(board, bytes):
+            self._squares, self._rows = board, None
+        else:
+            self._squares, self._rows = None, board
+
+    @property
+    def squares(self):
+        """squares
+
+        The squares property returns the board packed as bytes, one
+        character per square row by row.
+
+        Returns:
+            bytes : The packed board.
+        """
+        if self._squares is not None:
+            return self._squares
+        return pack_board(self._rows)
+
     def is_terminal(self):
         '''is_terminal
 
@@ -56,14 +108,54 @@ class CheckersState:
         Returns:
             bool : True if a terminal state has been reached, False otherwise.
         '''
-        bot_exists, player_exists = False, False
-        for row in self.board:
-            for square in row:
-                if square == 'b' or square == 'B':
-                    bot_exists = True
-                elif square == 'p' or square == 'P':
-                    player_exists = True
-                if bot_exists and player_exists:
-                    return False
+        squares = self.squares
+        bot_exists = b'b' in squares or b'B' in squares
+        player_exists = b'p' in squares or b'P' in squares
+        if bot_exists and player_exists:
+            return False
         self.bot_lost = player_exists
         return True
+
+    def result(self, move):
+        """result
+
+        The result method returns the CheckersState reached by making a move
+        from this state. The board of this state is left untouched, and the
+        new state's board is packed.
+
+        Args:
+            move (tuple) : A (path, captured, piece) move tuple as returned by
+            SuccessorGenerator.moves.
+
+        Returns:
+            CheckersState : The state after the move has been made.
+        """
+        path, captured, piece = move
+        size = self.size
+        squares = bytearray(self.squares)
+        x, y = path[0]
+        squares[x * size + y] = EMPTY
+        for x, y in captured:
+            squares[x * size + y] = EMPTY
+        x, y = path[-1]
+        squares[x * size + y] = ord(piece)
+        return CheckersState(bytes(squares), not self.bots_move, path, size)
+
+
+# The byte of an empty square.
+EMPTY = ord('_')
+
+
+def pack_board(board):
+    """pack_board
+
+    The pack_board function packs a board given as a list of rows into
+    bytes, one character per square.
+
+    Args:
+        board (list) : The board as a list of rows of squares.
+
+    Returns:
+        bytes : The packed board.
+    """
+    return ''.join(map(''.join, board)).encode('ascii')
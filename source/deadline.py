@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""deadline
+
+File: deadline.py\n
+Author: Alan Grant\n
+Version: 1.0\n
+Date: 10/18/2026\n
+Class: CSCI-C 458\n
+
+This module provides the pieces of the bot's time management: the
+SearchTimeout exception which aborts a search when its hard deadline passes,
+check_interval, which says how many positions the search may visit before it
+looks at the clock again, and predict_iteration, which guesses how long the
+next iteration of the iterative deepening search will take so one that
+cannot finish is not started.
+"""
+
+
+# How often, in seconds, the search aims to check the clock, and the fewest
+# and most positions it visits between two checks. The number of positions is
+# sized from the rate the search has been visiting them at.
+CHECK_SECONDS = 0.002
+MIN_CHECK_NODES = 16
+MAX_CHECK_NODES = 1024
+
+# The least and most each iteration is expected to take, as a multiple of the
+# one before it.
+MIN_GROWTH = 2.0
+MAX_GROWTH = 16.0
+
+
+class SearchTimeout(Exception):
+    """SearchTimeout
+
+    The SearchTimeout exception is raised from anywhere in the bot's search
+    when the hard deadline has passed. Nothing found by the interrupted
+    iteration below the root is kept.
+    """
+
+
+def predict_iteration(times):
+    """predict_iteration
+
+    The predict_iteration function guesses how long the next iteration of an
+    iterative deepening search will take from how long the finished ones
+    took. Each iteration is assumed to grow by as much as the last one did.
+
+    Args:
+        times (list) : The seconds each finished iteration took, in order.
+
+    Returns:
+        float : The predicted seconds of the next iteration.
+    """
+    if not times:
+        return 0.0
+    growth = MIN_GROWTH
+    if len(times) > 1 and times[-2] > 0:
+        growth = min(max(times[-1] / times[-2], MIN_GROWTH), MAX_GROWTH)
+    return times[-1] * growth
+
+
+def check_interval(nodes, elapsed, remaining):
+    """check_interval
+
+    The check_interval function returns how many positions the search may
+    visit before it next checks the clock. It is the number visited in
+    CHECK_SECONDS at the rate measured since the last check, or in a quarter
+    of the time left if that is less, so a search overruns its deadline by
+    little even when positions are slow to search or the budget is small.
+
+    Args:
+        nodes (int) : The positions visited since the last check.\n
+        elapsed (float) : The seconds since the last check.\n
+        remaining (float) : The seconds left until the deadline.
+
+    Returns:
+        int : The positions to visit before the next check.
+    """
+    if nodes <= 0 or elapsed <= 0:
+        return MIN_CHECK_NODES
+    interval = int(nodes / elapsed * min(CHECK_SECONDS, remaining / 4))
+    return min(max(interval, MIN_CHECK_NODES), MAX_CHECK_NODES)
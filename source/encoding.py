@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""encoding
+
+File: encoding.py\n
+Author: Alan Grant\n
+Version: 1.0\n
+Date: 10/18/2026\n
+Class: CSCI-C 458\n
+
+This module provides the compact encoding of moves. A move is known by its
+path, the squares its piece visits: once the position is known the path gives
+the pieces it takes and whether it kings. Each square (x, y) of a board of
+size n is the byte x * n + y + 1, which fits boards of up to 15x15, and a path
+is the integer whose little-endian bytes are its squares, the first square in
+the lowest byte. No square is 0, so paths of any length have distinct codes
+and the bytes of a code can be padded with zeros to a fixed length.
+
+The search keys its transposition table, killer moves and history scores by
+move codes, the opening book stores them, and a legal move index maps the
+code of each legal move of a position to the move, so the player's move is
+found without comparing it against every legal move.
+"""
+
+
+# The largest board whose squares each fit in a byte of a move code.
+MAX_SIZE = 15
+
+
+def encode_move(path, size):
+    """encode_move
+
+    The encode_move function encodes the path of a move.
+
+    Args:
+        path (list) : The squares (x, y) the piece visits.\n
+        size (int) : The size of the board.
+
+    Returns:
+        int : The code of the move.
+    """
+    code, shift = 0, 0
+    for x, y in path:
+        code |= (x * size + y + 1) << shift
+        shift += 8
+    return code
+
+
+def decode_move(code, size):
+    """decode_move
+
+    The decode_move function decodes the path of a move from its code.
+
+    Args:
+        code (int) : The code of the move.\n
+        size (int) : The size of the board.
+
+    Returns:
+        list : The squares (x, y) the piece visits.
+    """
+    path = []
+    while code:
+        path.append(divmod((code & 0xff) - 1, size))
+        code >>= 8
+    return path
+
+
+def move_bytes(code, length):
+    """move_bytes
+
+    The move_bytes function returns a move code as a fixed number of bytes,
+    as it is stored in a file.
+
+    Args:
+        code (int) : The code of the move.\n
+        length (int) : The number of bytes, at least the number of squares
+        in the path.
+
+    Returns:
+        bytes : The squares of the path padded with zeros.
+    """
+    return code.to_bytes(length, 'little')
+
+
+def bytes_move(data):
+    """bytes_move
+
+    The bytes_move function reads a move code written by move_bytes.
+
+    Args:
+        data (bytes) : The squares of the path padded with zeros.
+
+    Returns:
+        int : The code of the move.
+    """
+    return int.from_bytes(data, 'little')
+
+
+def index_moves(moves, size):
+    """index_moves
+
+    The index_moves function builds the legal move index of a position.
+
+    Args:
+        moves (list) : The (path, captured, piece) move tuples of the
+        position.\n
+        size (int) : The size of the board.
+
+    Returns:
+        dict : A dict mapping the code of each move to the move tuple.
+    """
+    return {encode_move(move[0], size): move for move in moves}
+
+
+def find_move(index, path, size):
+    """find_move
+
+    The find_move function looks a path up in a legal move index. Paths
+    from outside, such as the player's, may leave the board, and their
+    squares could then have the code of another square, so they are checked
+    first.
+
+    Args:
+        index (dict) : The legal move index built by index_moves.\n
+        path (list) : The squares (x, y) of the move.\n
+        size (int) : The size of the board.
+
+    Returns:
+        tuple : The (path, captured, piece) move tuple, or None if the path
+        is not a legal move.
+    """
+    if not all(0 <= x < size and 0 <= y < size for x, y in path):
+        return None
+    return index.get(encode_move(path, size))
@@ -0,0 +1,262 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""evaluation
+
+File: evaluation.py\n
+Author: Alan Grant\n
+Version: 1.0\n
+Date: 10/18/2026\n
+Class: CSCI-C 458\n
+
+This module provides access to the Evaluator class and the registry of
+evaluators. An evaluator is a scoring function declared as weights: the value
+of a man and of a king, a bonus for standing on the edge, a bonus for how far
+a man has advanced and optional per-square bonuses. It is compiled once per
+board size into tables of the value of each piece on each square, so scoring
+a board is a sum of table lookups. A CheckersPosition uses the same tables to
+keep each side's score up to date as moves are made instead of rescoring the
+whole board.
+
+The default evaluator is the one the bot scores with unless it is given
+another. Evaluators are registered by name so one can be chosen with
+get_evaluator, or by passing its name to the CheckersBot as the scoring
+function.
+"""
+
+
+from .geometry import get_geometry
+
+
+class Evaluator:
+    """Evaluator
+
+    The Evaluator class is a scoring function declared as weights. A man
+    which has advanced a rows on a board of size n is worth
+
+        (man + edge on the edge) * (1 + advancement * a / n)
+
+    plus its square's man bonus, and a king is worth king, plus edge on the
+    edge, plus its square's king bonus. The bot's men on row x have advanced
+    x + 1 rows and the player's size - 1 - x.
+    Square bonuses are given the row counted from the piece's own back row.
+    The score of a board is the value of the pieces of the side on move less
+    the value of the other side's.
+
+    Attributes:
+        name (str) : The name the evaluator is registered under.\n
+        man (float) : The value of a man.\n
+        king (float) : The value of a king.\n
+        edge (float) : The bonus of a piece on the edge, where it cannot be
+        jumped.\n
+        advancement (float) : How much more a man is worth, as a fraction,
+        for every row it has advanced.\n
+        man_squares (function) : A function of the board size, row and
+        column giving the bonus of a man on that square, or None.\n
+        king_squares (function) : The same for a king, or None.
+    """
+
+    def __init__(self, name, man=1.0, king=2.0, edge=0.0, advancement=0.0,
+                 man_squares=None, king_squares=None):
+        """__init__
+
+        The __init__ method is the constructor for the Evaluator class.
+
+        Args:
+            name (str) : The name to register the evaluator under.\n
+            man (float) : The value of a man.\n
+            king (float) : The value of a king.\n
+            edge (float) : The bonus of a piece on the edge.\n
+            advancement (float) : How much more a man is worth, as a
+            fraction, for every row it has advanced.\n
+            man_squares (function) : A function (size, row, column) giving
+            the bonus of a man on a square, or None. It is called only when
+            the evaluator is compiled, so it must be defined at the top level
+            of a module for the evaluator to be sent to worker processes.\n
+            king_squares (function) : The same for a king, or None.
+        """
+        self.name = name
+        self.man = man
+        self.king = king
+        self.edge = edge
+        self.advancement = advancement
+        self.man_squares = man_squares
+        self.king_squares = king_squares
+        self._tables = {}
+        self._flat = {}
+
+    def __getstate__(self):
+        """__getstate__
+
+        The __getstate__ method leaves the compiled tables out when the
+        evaluator is pickled; they are compiled again where it is used.
+        """
+        state = dict(self.__dict__)
+        state['_tables'], state['_flat'] = {}, {}
+        return state
+
+    def _value(self, size, piece, x, y, on_edge):
+        """_value
+
+        The _value method computes the value of one piece on one square.
+
+        Args:
+            size (int) : The size of the board.\n
+            piece (str) : The piece, one of 'bBpP'.\n
+            x (int) : The row of the square.\n
+            y (int) : The column of the square.\n
+            on_edge (bool) : True if the square is on the edge.
+
+        Returns:
+            float : The value of the piece.
+        """
+        if piece in 'bB':
+            row, advanced = x, x + 1
+        else:
+            row = advanced = size - 1 - x
+        edge = self.edge if on_edge else 0
+        if piece in 'bp':
+            value = (self.man + edge) * (1 + (self.advancement
+                                              * (advanced / size)))
+            if self.man_squares:
+                value += self.man_squares(size, row, y)
+        else:
+            value = self.king + edge
+            if self.king_squares:
+                value += self.king_squares(size, row, y)
+        return value
+
+    def tables(self, size):
+        """tables
+
+        The tables method returns the value of each piece on each square of
+        a board of the given size, compiling them the first time.
+
+        Args:
+            size (int) : The size of the board.
+
+        Returns:
+            dict : A dict mapping each piece to a size x size list of values.
+        """
+        if size not in self._tables:
+            edge = get_geometry(size).edge
+            self._tables[size] = {
+                piece: [[self._value(size, piece, x, y, edge[x][y])
+                         for y in range(size)] for x in range(size)]
+                for piece in 'bBpP'}
+        return self._tables[size]
+
+    def flat_tables(self, size):
+        """flat_tables
+
+        The flat_tables method returns the tables flattened for scoring a
+        packed board: for each byte of a piece, the value of that piece on
+        each square in row by row order.
+
+        Args:
+            size (int) : The size of the board.
+
+        Returns:
+            dict : A dict mapping the byte of each piece to a list of size *
+            size values.
+        """
+        if size not in self._flat:
+            self._flat[size] = {
+                ord(piece): [value for row in rows for value in row]
+                for piece, rows in self.tables(size).items()}
+        return self._flat[size]
+
+    def score(self, state):
+        """score
+
+        The score method scores a CheckersState from the point of view of the
+        side on move.
+
+        Args:
+            state (CheckersState) : The state to score.
+
+        Returns:
+            float : The value of the pieces of the side on move less the
+            value of the other side's.
+        """
+        flat = self.flat_tables(state.size)
+        bot = player = 0
+        for i, square in enumerate(state.squares):
+            if square in BOT_BYTES:
+                bot += flat[square][i]
+            elif square in PLAYER_BYTES:
+                player += flat[square][i]
+        return (bot - player) if state.bots_move else (player - bot)
+
+    def __call__(self, state):
+        """__call__
+
+        The __call__ method lets an evaluator be used as a scoring function.
+        """
+        return self.score(state)
+
+
+# The bytes of each side's pieces on a packed board.
+BOT_BYTES = frozenset(b'bB')
+PLAYER_BYTES = frozenset(b'pP')
+
+# The registered evaluators, keyed by name.
+EVALUATORS = {}
+
+
+def register(evaluator):
+    """register
+
+    The register function adds an evaluator to the registry under its name,
+    replacing any evaluator of the same name.
+
+    Args:
+        evaluator (Evaluator) : The evaluator to register.
+
+    Returns:
+        Evaluator : The evaluator.
+    """
+    EVALUATORS[evaluator.name] = evaluator
+    return evaluator
+
+
+def get_evaluator(name):
+    """get_evaluator
+
+    The get_evaluator function returns the registered evaluator of a name.
+
+    Args:
+        name (str) : The name of the evaluator, one of EVALUATORS.
+
+    Returns:
+        Evaluator : The evaluator.
+    """
+    try:
+        return EVALUATORS[name]
+    except KeyError:
+        raise ValueError('Unknown evaluator {!r}. Choose one of: {}'
+                         .format(name, ', '.join(sorted(EVALUATORS))))
+
+
+# The evaluator the bot scores with by default: pieces on an edge cannot be
+# jumped and are worth one more, and men are worth a little more the closer
+# they are to being kinged.
+DEFAULT = register(Evaluator('default', man=1.0, king=2.0, edge=1.0,
+                             advancement=0.1))
+
+# Material only: every man is worth one and every king two.
+register(Evaluator('material', man=1.0, king=2.0))
+
+
+def score_tables(size):
+    """score_tables
+
+    The score_tables function returns the value the default evaluator gives
+    each piece on each square of a board of the given size.
+
+    Args:
+        size (int) : The size of the board.
+
+    Returns:
+        dict : A dict mapping each piece to a size x size list of values.
+    """
+    return DEFAULT.tables(size)
@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""geometry
+
+File: geometry.py\n
+Author: Alan Grant\n
+Version: 1.0\n
+Date: 10/18/2026\n
+Class: CSCI-C 458\n
+
+This module provides access to the BoardGeometry class. A BoardGeometry holds
+lookup tables for everything about a board that depends only on its size:
+where each piece can step or jump to from each square, which rows crown a
+piece and which squares are on the edge. One is built per board size and
+shared by the successor generators and the scoring functions.
+"""
+
+
+# The directions each piece can move in, in the order moves are generated.
+STEPS = {
+    'b': [(1, -1), (1, 1)],
+    'p': [(-1, -1), (-1, 1)],
+    'B': [(-1, -1), (-1, 1), (1, -1), (1, 1)],
+    'P': [(-1, -1), (-1, 1), (1, -1), (1, 1)],
+}
+
+# Geometries, keyed by board size.
+_GEOMETRIES = {}
+
+
+class BoardGeometry:
+    """BoardGeometry
+
+    The BoardGeometry class holds the lookup tables for a board of one size.
+    Use get_geometry to get the shared instance for a size rather than
+    building a new one.
+
+    Attributes:
+        size (int) : The size of the board.\n
+        steps (dict) : The directions (dx, dy) each piece can move in.\n
+        neighbours (dict) : For each piece, a size x size table listing the
+        squares (x2, y2) on the board one step away from (x, y) in the
+        piece's directions.\n
+        jumps (dict) : For each piece, a size x size table listing (x2, y2,
+        x3, y3) for each jump from (x, y) over (x2, y2) to a landing square
+        (x3, y3) on the board.\n
+        crown_row (dict) : The row which kings a man, keyed by True for the
+        bot and False for the player.\n
+        edge (list) : A size x size table, True for squares on the edge.\n
+        stride (int) : The bits per row of a bitboard, size + 1. The spare bit
+        of each row catches diagonal shifts that leave the board.\n
+        board_mask (int) : The bitboard of all squares on the board.\n
+        crown_mask (dict) : The bitboard of crown_row, keyed like crown_row.\n
+        edge_mask (int) : The bitboard of the edge squares.\n
+        shifts (dict) : The bitboard shift of each direction (dx, dy).\n
+        bits (list) : A size x size table of the bitboard of each square.\n
+        squares (dict) : The square (x, y) of each single square bitboard.
+    """
+
+    def __init__(self, size):
+        """__init__
+
+        The __init__ method is the constructor for the BoardGeometry class. It
+        builds all the tables for the given board size.
+
+        Args:
+            size (int) : The size of the board.
+        """
+        self.size = size
+        self.steps = STEPS
+        self.crown_row = {True: size - 1, False: 0}
+        self.edge = [[x in (0, size - 1) or y in (0, size - 1)
+                      for y in range(size)] for x in range(size)]
+
+        self.neighbours, self.jumps = {}, {}
+        for piece, steps in STEPS.items():
+            self.neighbours[piece] = [[[] for y in range(size)]
+                                      for x in range(size)]
+            self.jumps[piece] = [[[] for y in range(size)]
+                                 for x in range(size)]
+            for x in range(size):
+                for y in range(size):
+                    for dx, dy in steps:
+                        if self.on_board(x + dx, y + dy):
+                            self.neighbours[piece][x][y].append(
+                                (x + dx, y + dy))
+                        if self.on_board(x + 2 * dx, y + 2 * dy):
+                            self.jumps[piece][x][y].append(
+                                (x + dx, y + dy, x + 2 * dx, y + 2 * dy))
+
+        self.stride = size + 1
+        self.board_mask = self.edge_mask = 0
+        for x in range(size):
+            for y in range(size):
+                self.board_mask |= self.bit(x, y)
+                if self.edge[x][y]:
+                    self.edge_mask |= self.bit(x, y)
+        self.crown_mask = {
+            side: sum(self.bit(row, y) for y in range(size))
+            for side, row in self.crown_row.items()}
+        self.shifts = {(dx, dy): dx * self.stride + dy
+                       for dx in (-1, 1) for dy in (-1, 1)}
+        self.bits = [[self.bit(x, y) for y in range(size)]
+                     for x in range(size)]
+        self.squares = {self.bit(x, y): (x, y)
+                        for x in range(size) for y in range(size)}
+
+    def on_board(self, x, y):
+        """on_board
+
+        The on_board method checks if (x, y) is a square on the board.
+
+        Args:
+            x (int) : The row of the square.\n
+            y (int) : The column of the square.
+
+        Returns:
+            bool : True if the square is on the board, False otherwise.
+        """
+        return 0 <= x < self.size and 0 <= y < self.size
+
+    def bit(self, x, y):
+        """bit
+
+        The bit method returns the bitboard of the single square (x, y).
+
+        Args:
+            x (int) : The row of the square.\n
+            y (int) : The column of the square.
+
+        Returns:
+            int : The bitboard with only square (x, y) set.
+        """
+        return 1 << (x * self.stride + y)
+
+
+def get_geometry(size):
+    """get_geometry
+
+    The get_geometry function returns the BoardGeometry for a board size,
+    building it the first time the size is asked for.
+
+    Args:
+        size (int) : The size of the board.
+
+    Returns:
+        BoardGeometry : The shared geometry for the size.
+    """
+    if size not in _GEOMETRIES:
+        _GEOMETRIES[size] = BoardGeometry(size)
+    return _GEOMETRIES[size]
@@ -0,0 +1,188 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""parallel
+
+File: parallel.py\n
+Author: Alan Grant\n
+Version: 1.0\n
+Date: 10/18/2026\n
+Class: CSCI-C 458\n
+
+This module provides access to the ParallelSearch class. It spreads the root
+moves of the bot's search over a pool of worker processes so a machine with
+several cores can search more of the tree within the same time limit.
+"""
+
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from .position import CheckersPosition
+from .deadline import SearchTimeout
+
+
+# The state of a worker process, set up once by _init_worker. _root is the
+# start time of the search the worker's tables were last used by and _game the
+# game of the bot it works for.
+_bot = None
+_alpha = None
+_root = None
+_game = None
+
+
+def _init_worker(alpha, bot_class, args, options):
+    """_init_worker
+
+    The _init_worker function runs once in every worker process. It builds
+    the bot the worker searches with.
+
+    Args:
+        alpha (multiprocessing.Value) : The best root score found so far,
+        shared by all workers.\n
+        bot_class (class) : The CheckersBot class.\n
+        args (tuple) : The max_score, max_depth, max_time and score_func the
+        bot is built with.\n
+        options (dict) : The keyword arguments the bot is built with.
+    """
+    global _bot, _alpha
+    _alpha = alpha
+    _bot = bot_class(None, *args, **options)
+
+
+def _search_move(state, move, depth, beta, start_time, game):
+    """_search_move
+
+    The _search_move function searches one root move in a worker process. It
+    scouts the move with a null window at the best root score any worker has
+    found so far, searches it again with the full window if it beats that,
+    and shares its own score when it does.
+
+    Args:
+        state (CheckersState) : The root state of the search.\n
+        move (tuple) : The root move to search.\n
+        depth (int) : The depth of the current iteration.\n
+        beta (float) : The top of the aspiration window.\n
+        start_time (float) : The time the search began, so the worker stops
+        at the same time limit as the bot.\n
+        game (int) : The game of the bot, so the worker forgets what it
+        learned when a new game begins.
+
+    Returns:
+        tuple : The score of the move, or None if the deadline passed first,
+        True if the score beat the shared score it was scouted at, so it is
+        more than an upper bound, and the search counters of the bot for the
+        search, as CheckersBot.counters returns them.
+    """
+    global _root, _game
+    if game != _game:
+        _game = game
+        _bot.reset_tables()
+    elif start_time != _root:
+        _bot.age_tables()
+    _root = start_time
+    position = CheckersPosition(state, _bot.generator,
+                                _bot.evaluator.tables(state.size))
+    _bot.start_time = start_time
+    _bot.set_deadline(start_time + _bot.max_time)
+    counts = _bot.counters()
+    alpha, improved = _alpha.value, False
+    try:
+        score = _bot.search_root_move(position, move, alpha, beta, depth,
+                                      scout=True)
+    except SearchTimeout:
+        score = None
+    else:
+        improved = score > alpha
+        with _alpha.get_lock():
+            if score > _alpha.value:
+                _alpha.value = score
+    return score, improved, [a - b for a, b in zip(_bot.counters(), counts)]
+
+
+class ParallelSearch:
+    """ParallelSearch
+
+    The ParallelSearch class searches the root moves of one iteration of the
+    bot's iterative deepening search in parallel, Young Brothers Wait style:
+    the first root move, normally the previous iteration's best, is searched
+    by the bot itself to get a good alpha bound, then the rest are handed to
+    a pool of worker processes. Workers share the best root score found so
+    far, so each later move is searched with the tightest bound known when
+    it starts. Every worker keeps its own transposition table of hash_mb
+    megabytes, kept and aged from one search to the next like the bot's.
+
+    Attributes:
+        bot (CheckersBot) : The bot the search is run for.\n
+        workers (int) : The number of worker processes.\n
+        alpha (multiprocessing.Value) : The best root score found so far.\n
+        pool (ProcessPoolExecutor) : The worker processes.
+    """
+
+    def __init__(self, bot, workers, options):
+        """__init__
+
+        The __init__ method is the constructor for the ParallelSearch class.
+
+        Args:
+            bot (CheckersBot) : The bot the search is run for.\n
+            workers (int) : The number of worker processes.\n
+            options (dict) : The keyword arguments to build each worker's bot
+            with.
+        """
+        self.bot = bot
+        self.workers = workers
+        self.alpha = multiprocessing.Value('d', -bot.max_score)
+        score_func = bot.evaluator if bot.incremental else bot.score_func
+        self.pool = ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker,
+            initargs=(self.alpha, type(bot), (bot.max_score, bot.max_depth,
+                      bot.max_time, score_func), options))
+
+    def search(self, state, position, root_moves, depth, alpha, beta):
+        """search
+
+        The search method runs one iteration of the search over the root
+        moves.
+
+        Args:
+            state (CheckersState) : The root state, sent to the workers.\n
+            position (CheckersPosition) : The root position.\n
+            root_moves (list) : The root moves, best first.\n
+            depth (int) : The depth of the iteration.\n
+            alpha (float) : The bottom of the aspiration window.\n
+            beta (float) : The top of the aspiration window.
+
+        Returns:
+            tuple : The best score, the best move and False if the deadline
+            cut the iteration short, as for CheckersBot._search_root. Of
+            equally scored moves the one first in root_moves is chosen, and a
+            move whose scout search did not beat the shared score is never
+            chosen over the first.
+        """
+        bot = self.bot
+        try:
+            val = bot.search_root_move(position, root_moves[0], alpha, beta,
+                                       depth)
+        except SearchTimeout:
+            return alpha, None, False
+        if val >= beta:
+            return val, root_moves[0], True
+        self.alpha.value = max(alpha, val)
+        futures = [self.pool.submit(_search_move, state, move, depth, beta,
+                                    bot.start_time, bot.game)
+                   for move in root_moves[1:]]
+        best_move, complete = root_moves[0], True
+        for move, future in zip(root_moves[1:], futures):
+            score, improved, counts = future.result()
+            bot.add_counters(counts)
+            if score is None:
+                complete = False
+            elif improved and score > val:
+                val, best_move = score, move
+        return val, best_move, complete
+
+    def close(self):
+        """close
+
+        The close method shuts the worker processes down.
+        """
+        self.pool.shutdown()
@@ -0,0 +1,478 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""pdn
+
+File: pdn.py\n
+Author: Alan Grant\n
+Version: 1.0\n
+Date: 10/18/2026\n
+Class: CSCI-C 458\n
+
+This module provides access to the PdnGame class and the functions to write
+and read game records in PDN (Portable Draughts Notation). A record is a list
+of tags such as [White "bot"] followed by the moves:
+
+    [Event "Tournament"]
+    [White "depth=6"]
+    [Black "depth=4"]
+    [Result "1-0"]
+    [GameType "21,B,8,8,N1,0"]
+    [FEN "B:W21-32:B1-12"]
+
+    1. 11-15 23-19 2. 8-11 22-17 ... 1-0
+
+The player, who moves first, plays Black and the bot White. Only the dark
+squares are numbered, from 1 at the player's back row, each row from the
+player's right, as in English draughts: on 8x8, square 1 is (7, 6). On most
+boards the dark squares are those whose row and column add up to an odd
+number; on boards such as layouts/4x4.board they add up to an even number,
+and the last field of the GameType tag is 1 to say so. A normal move is
+written with its two squares joined by '-', and a jump with every square it
+lands on joined by 'x'. The result is written from White's side: '1-0' if
+the bot won, '0-1' if the player won, '1/2-1/2' for a draw and '*' if the
+game did not finish.
+
+read_games reads a collection one game at a time, so files of any size can
+be streamed, and PdnGame.replay checks each move against the legal moves of
+the position it is played in.
+"""
+
+
+import re
+import textwrap
+
+from .checkers_state import CheckersState
+from .encoding import encode_move, index_moves
+from .successors import get_generator
+
+
+# The results a game may end with, for the bot winning, the player winning,
+# a draw and an unfinished game, and the other spellings read.
+RESULTS = {'1-0': True, '2-0': True, '0-1': False, '0-2': False,
+           '1/2-1/2': None, '1-1': None, '*': None}
+
+# The tag lines and the parts of the movetext which are not moves.
+TAG = re.compile(r'\[\s*(\w+)\s+"((?:[^"\\]|\\.)*)"\s*\]')
+COMMENT = re.compile(r'\{[^}]*\}')
+VARIATION = re.compile(r'\([^()]*\)')
+MOVE_NUMBER = re.compile(r'^\d+\.+')
+ANNOTATION = re.compile(r'[!?]+$')
+
+
+def dark_parity(board):
+    """dark_parity
+
+    The dark_parity function returns which squares of a board are dark, from
+    the squares its pieces stand on. A board without pieces is taken to have
+    the usual dark squares.
+
+    Args:
+        board (list) : The board as a list of rows.
+
+    Returns:
+        int : 1 if the row and column of each dark square add up to an odd
+        number, 0 if they add up to an even number.
+
+    Raises:
+        ValueError : If pieces stand on squares of both colours, which PDN
+        cannot number.
+    """
+    parities = {(x + y) % 2 for x, row in enumerate(board)
+                for y, square in enumerate(row) if square != '_'}
+    if len(parities) > 1:
+        raise ValueError('pieces stand on light and dark squares, which PDN '
+                         'cannot number')
+    return parities.pop() if parities else 1
+
+
+def square_number(x, y, size):
+    """square_number
+
+    The square_number function returns the number of a dark square. The
+    dark squares of a row are two columns apart, so the number is the same
+    whichever squares are dark.
+
+    Args:
+        x (int) : The row of the square.\n
+        y (int) : The column of the square.\n
+        size (int) : The size of the board.
+
+    Returns:
+        int : The number of the square, from 1.
+    """
+    return (size - 1 - x) * (size // 2) + (size - 1 - y) // 2 + 1
+
+
+def square_xy(number, size, parity=1):
+    """square_xy
+
+    The square_xy function returns the dark square of a number.
+
+    Args:
+        number (int) : The number of the square, from 1.\n
+        size (int) : The size of the board.\n
+        parity (int) : The parity of the dark squares, as dark_parity
+        returns it.
+
+    Returns:
+        tuple : The square (x, y).
+
+    Raises:
+        ValueError : If there is no square of that number.
+    """
+    half = size // 2
+    if not 0 < number <= half * size:
+        raise ValueError('no square {} on a {}x{} board'.format(
+            number, size, size))
+    row, column = divmod(number - 1, half)
+    x = size - 1 - row
+    # The dark squares are those whose row and column add up to parity.
+    y = size - 1 - 2 * column - (x - parity + 1) % 2
+    return x, y
+
+
+def start_state(size, parity=1):
+    """start_state
+
+    The start_state function returns the usual first position of a board of
+    the given size, with size / 2 - 1 rows of men each and the player on
+    move.
+
+    Args:
+        size (int) : The size of the board.\n
+        parity (int) : The parity of the dark squares, as dark_parity
+        returns it.
+
+    Returns:
+        CheckersState : The first position.
+    """
+    rows = size // 2 - 1
+    board = [['_'] * size for x in range(size)]
+    for x in range(size):
+        for y in range(size):
+            if (x + y) % 2 == parity:
+                if x < rows:
+                    board[x][y] = 'b'
+                elif x >= size - rows:
+                    board[x][y] = 'p'
+    return CheckersState(board, False, [], size)
+
+
+def state_fen(state):
+    """state_fen
+
+    The state_fen function writes a position as a PDN FEN string: the side
+    on move, then the squares of White's and Black's pieces, kings marked
+    with K.
+
+    Args:
+        state (CheckersState) : The position.
+
+    Returns:
+        str : The FEN string.
+
+    Raises:
+        ValueError : If pieces stand on squares of both colours.
+    """
+    dark_parity(state.board)
+    pieces = {'b': [], 'p': []}
+    for x, row in enumerate(state.board):
+        for y, square in enumerate(row):
+            if square != '_':
+                number = square_number(x, y, state.size)
+                pieces[square.lower()].append(
+                    (number, 'K' if square.isupper() else ''))
+    sides = ['{}{}'.format(colour, ','.join(
+        king + str(number) for number, king in sorted(pieces[piece])))
+        for colour, piece in (('W', 'b'), ('B', 'p'))]
+    return '{}:{}:{}'.format('W' if state.bots_move else 'B', *sides)
+
+
+def fen_state(fen, size, parity=1):
+    """fen_state
+
+    The fen_state function reads a position from a PDN FEN string.
+
+    Args:
+        fen (str) : The FEN string.\n
+        size (int) : The size of the board.\n
+        parity (int) : The parity of the dark squares, as dark_parity
+        returns it.
+
+    Returns:
+        CheckersState : The position.
+
+    Raises:
+        ValueError : If the string is not a position on the board.
+    """
+    fields = fen.strip().rstrip('.').split(':')
+    if not fields or fields[0].upper() not in ('W', 'B'):
+        raise ValueError('bad FEN {!r}'.format(fen))
+    board = [['_'] * size for x in range(size)]
+    for field in fields[1:]:
+        field = field.strip()
+        if not field:
+            continue
+        if field[0].upper() not in ('W', 'B'):
+            raise ValueError('bad FEN {!r}'.format(fen))
+        piece = 'b' if field[0].upper() == 'W' else 'p'
+        for item in filter(None, field[1:].split(',')):
+            item = item.strip()
+            if not item:
+                continue
+            king = item[0].upper() == 'K'
+            if king:
+                item = item[1:]
+            if '-' in item:
+                first, _, last = item.partition('-')
+                numbers = range(int(first), int(last) + 1)
+            else:
+                numbers = [int(item)]
+            for number in numbers:
+                x, y = square_xy(number, size, parity)
+                board[x][y] = piece.upper() if king else piece
+    return CheckersState(board, fields[0].upper() == 'W', [], size)
+
+
+def move_text(path, size):
+    """move_text
+
+    The move_text function writes a move in PDN.
+
+    Args:
+        path (list) : The squares (x, y) the piece visits.\n
+        size (int) : The size of the board.
+
+    Returns:
+        str : The move, such as '11-15' or '18x11x4'.
+    """
+    jump = len(path) > 2 or abs(path[1][0] - path[0][0]) == 2
+    return ('x' if jump else '-').join(
+        str(square_number(x, y, size)) for x, y in path)
+
+
+def result_text(winner):
+    """result_text
+
+    The result_text function writes the result of a game.
+
+    Args:
+        winner (bool) : True if the bot won, False if the player won, None
+        for a draw.
+
+    Returns:
+        str : The result, from White's side.
+    """
+    if winner is None:
+        return '1/2-1/2'
+    return '1-0' if winner else '0-1'
+
+
+def game_text(start, paths, result='*', tags=None):
+    """game_text
+
+    The game_text function writes a game as a PDN record.
+
+    Args:
+        start (CheckersState) : The position the game started from.\n
+        paths (list) : The path of each move played.\n
+        result (str) : The result, one of RESULTS.\n
+        tags (dict) : Other tags to write first, such as Event, White and
+        Black.
+
+    Returns:
+        str : The record, ending with a blank line.
+
+    Raises:
+        ValueError : If pieces stand on squares of both colours.
+    """
+    size = start.size
+    tags = dict(tags or {})
+    tags['Result'] = result
+    tags['GameType'] = '21,B,{0},{0},N1,{1}'.format(
+        size, 1 - dark_parity(start.board))
+    tags['FEN'] = state_fen(start)
+    lines = ['[{} "{}"]'.format(key, str(value).replace('"', '\\"'))
+             for key, value in tags.items()]
+    tokens = []
+    number, black = 1, not start.bots_move
+    if not black:
+        tokens.append('1...')
+    for path in paths:
+        if black:
+            tokens.append('{}.'.format(number))
+        tokens.append(move_text(path, size))
+        if not black:
+            number += 1
+        black = not black
+    tokens.append(result)
+    movetext = textwrap.fill(' '.join(tokens), 79)
+    return '\n'.join(lines) + '\n\n' + movetext + '\n\n'
+
+
+class PdnGame:
+    """PdnGame
+
+    The PdnGame class is one game read from a PDN record.
+
+    Attributes:
+        tags (dict) : The game's tags.\n
+        moves (list) : The game's moves as written, such as '11-15'.\n
+        result (str) : The result, one of RESULTS.
+    """
+
+    def __init__(self, tags, moves, result):
+        """__init__
+
+        The __init__ method is the constructor for the PdnGame class.
+
+        Args:
+            tags (dict) : The game's tags.\n
+            moves (list) : The game's moves as written.\n
+            result (str) : The result, one of RESULTS.
+        """
+        self.tags = tags
+        self.moves = moves
+        self.result = result
+
+    @property
+    def size(self):
+        """size
+
+        The size property is the size of the board, from the GameType tag.
+        Games without one are played on an 8x8 board.
+
+        Returns:
+            int : The size of the board.
+        """
+        fields = self.tags.get('GameType', '').split(',')
+        if len(fields) > 2 and fields[2].strip().isdigit():
+            return int(fields[2])
+        return 8
+
+    @property
+    def parity(self):
+        """parity
+
+        The parity property is the parity of the board's dark squares, as
+        dark_parity returns it: 0 if the last field of the GameType tag is
+        1, otherwise 1.
+
+        Returns:
+            int : The parity of the dark squares.
+        """
+        fields = self.tags.get('GameType', '').split(',')
+        if len(fields) > 5 and fields[5].strip() == '1':
+            return 0
+        return 1
+
+    def start(self):
+        """start
+
+        The start method returns the position the game started from, from
+        the FEN tag or the usual first position.
+
+        Returns:
+            CheckersState : The first position.
+        """
+        if 'FEN' in self.tags:
+            return fen_state(self.tags['FEN'], self.size, self.parity)
+        return start_state(self.size, self.parity)
+
+    def replay(self, backend='list'):
+        """replay
+
+        The replay method plays the game's moves from its first position.
+        A jump may be written with only its first and last squares if no
+        other jump joins them.
+
+        Args:
+            backend (str) : The name of the successor generator backend.
+
+        Yields:
+            tuple : The state before each move and the (path, captured,
+            piece) move tuple played in it.
+
+        Raises:
+            ValueError : If a move is not legal in its position.
+        """
+        size, parity = self.size, self.parity
+        generator = get_generator(backend)
+        state = self.start()
+        for ply, text in enumerate(self.moves):
+            legal = generator(state).moves()
+            try:
+                path = [square_xy(int(number), size, parity)
+                        for number in re.split('[x-]', text)]
+            except ValueError:
+                path = []
+            move = index_moves(legal, size).get(encode_move(path, size))
+            if move is None and 'x' in text and len(path) == 2:
+                found = [jump for jump in legal if jump[1] and
+                         jump[0][0] == path[0] and jump[0][-1] == path[1]]
+                if len(found) == 1:
+                    move = found[0]
+            if move is None:
+                raise ValueError('illegal move {} at ply {}'.format(
+                    text, ply + 1))
+            yield state, move
+            state = state.result(move)
+
+
+def _parse_game(tags, movetext):
+    """_parse_game
+
+    The _parse_game function builds a PdnGame from its tags and movetext,
+    leaving out comments, variations, move numbers and annotations.
+
+    Args:
+        tags (dict) : The game's tags.\n
+        movetext (str) : The game's movetext.
+
+    Returns:
+        PdnGame : The game.
+    """
+    text = COMMENT.sub(' ', movetext)
+    while VARIATION.search(text):
+        text = VARIATION.sub(' ', text)
+    moves, result = [], tags.get('Result', '*')
+    for token in text.split():
+        if token in RESULTS:
+            result = token
+            continue
+        token = ANNOTATION.sub('', MOVE_NUMBER.sub('', token))
+        if token and not token.startswith('$'):
+            moves.append(token)
+    return PdnGame(tags, moves, result)
+
+
+def read_games(stream):
+    """read_games
+
+    The read_games function reads the games of a PDN collection one at a
+    time. A game ends at its result or where the next game's tags begin.
+
+    Args:
+        stream (file) : An open text file, or any iterable of lines.
+
+    Yields:
+        PdnGame : Each game in the collection.
+    """
+    tags, movetext = {}, []
+    for line in stream:
+        stripped = line.strip()
+        if stripped.startswith('['):
+            if movetext:
+                yield _parse_game(tags, ' '.join(movetext))
+                tags, movetext = {}, []
+            for key, value in TAG.findall(stripped):
+                tags[key] = value.replace('\\"', '"')
+        elif stripped:
+            movetext.append(stripped)
+            text = COMMENT.sub(' ', ' '.join(movetext))
+            tokens = text.split()
+            if '{' not in text and tokens and tokens[-1] in RESULTS:
+                yield _parse_game(tags, ' '.join(movetext))
+                tags, movetext = {}, []
+    if movetext or tags:
+        yield _parse_game(tags, ' '.join(movetext))
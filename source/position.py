@@ -0,0 +1,194 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""position
+
+File: position.py\n
+Author: Alan Grant\n
+Version: 1.0\n
+Date: 10/18/2026\n
+Class: CSCI-C 458\n
+
+This module provides access to the CheckersPosition class. The bot's search
+walks the game tree on a single CheckersPosition, making a move before
+searching below it and unmaking it afterwards, instead of building a new
+CheckersState for every successor.
+"""
+
+
+from .checkers_state import CheckersState
+from .transposition import zobrist_keys, zobrist_hash
+from .evaluation import score_tables
+
+
+class CheckersPosition:
+    """CheckersPosition
+
+    The CheckersPosition class is a mutable game position. It owns a copy of
+    the board of the state it was created from and changes that board in
+    place when a move is made or unmade, the same way
+    SuccessorGenerator._gen_jumps updates and restores the board while
+    following a jump sequence.
+
+    Attributes:
+        board (list) : The board of the position, changed in place.\n
+        state (CheckersState) : A state sharing board with the position. It
+        always describes the current position, so it can be handed to a
+        scoring function.\n
+        generator (SuccessorGenerator) : The move generator for state. It is
+        told of every move made and unmade, so a generator keeping its own
+        copy of the position, as BitboardGenerator does, can update it.\n
+        hash (int) : The Zobrist hash of the position, updated with every move
+        made and unmade.\n
+        bot_pieces (int) : The number of pieces the bot has.\n
+        player_pieces (int) : The number of pieces the player has.\n
+        values (dict) : The value of each piece on each square, from
+        Evaluator.tables.\n
+        bot_material (float) : The sum of the values of the bot's pieces.\n
+        player_material (float) : The same sum for the player's pieces.\n
+        undo (list) : The pieces, hash, counts and material needed to unmake
+        each move made so far.
+    """
+
+    def __init__(self, state, generator, values=None):
+        """__init__
+
+        The __init__ method is the constructor for the CheckersPosition class.
+
+        Args:
+            state (CheckersState) : The state to start from. Its board is
+            copied, not changed.\n
+            generator (class) : The successor generator class to find moves
+            with.\n
+            values (dict) : The tables of an evaluator to keep the material
+            sums with, those of the default evaluator if None.
+        """
+        self.board = [row[:] for row in state.board]
+        self.state = CheckersState(self.board, state.bots_move, [],
+                                   state.size)
+        self.generator = generator(self.state)
+        self.keys, self.bot_key = zobrist_keys(state.size)
+        self.hash = zobrist_hash(self.state)
+        self.values = values or score_tables(state.size)
+        self.bot_pieces = self.player_pieces = 0
+        self.bot_material = self.player_material = 0
+        for x, row in enumerate(self.board):
+            for y, square in enumerate(row):
+                if square in 'bB':
+                    self.bot_pieces += 1
+                    self.bot_material += self.values[square][x][y]
+                elif square in 'pP':
+                    self.player_pieces += 1
+                    self.player_material += self.values[square][x][y]
+        self.undo = []
+
+    def moves(self):
+        """moves
+
+        The moves method returns every legal move of the side to move.
+
+        Returns:
+            list : A list of (path, captured, piece) move tuples.
+        """
+        return self.generator.moves()
+
+    def jumps(self):
+        """jumps
+
+        The jumps method returns only the jumps of the side to move.
+
+        Returns:
+            list : A list of (path, captured, piece) move tuples.
+        """
+        return self.generator.jumps()
+
+    def make_move(self, move):
+        """make_move
+
+        The make_move method plays a move on the board and passes the turn to
+        the other side.
+
+        Args:
+            move (tuple) : A (path, captured, piece) move tuple.
+        """
+        path, captured, piece = move
+        board, keys, values = self.board, self.keys, self.values
+        x, y = path[0]
+        moved, taken = board[x][y], []
+        self.undo.append((moved, taken, self.hash, self.bot_pieces,
+                          self.player_pieces, self.bot_material,
+                          self.player_material))
+        h = self.hash ^ self.bot_key ^ keys[moved][x][y]
+        gained = -values[moved][x][y]
+        board[x][y] = '_'
+        lost = 0
+        for x, y in captured:
+            taken.append(board[x][y])
+            h ^= keys[board[x][y]][x][y]
+            lost += values[board[x][y]][x][y]
+            board[x][y] = '_'
+        x, y = path[-1]
+        board[x][y] = piece
+        self.generator.make_move(move, moved, taken)
+        self.hash = h ^ keys[piece][x][y]
+        gained += values[piece][x][y]
+        if self.state.bots_move:
+            self.bot_material += gained
+            self.player_material -= lost
+            self.player_pieces -= len(captured)
+        else:
+            self.player_material += gained
+            self.bot_material -= lost
+            self.bot_pieces -= len(captured)
+        self.state.bots_move = not self.state.bots_move
+
+    def unmake_move(self, move):
+        """unmake_move
+
+        The unmake_move method takes back the last move made, which must be
+        move, and restores the board and the side to move.
+
+        Args:
+            move (tuple) : The (path, captured, piece) move tuple last made.
+        """
+        path, captured, _ = move
+        board = self.board
+        (moved, taken, self.hash, self.bot_pieces, self.player_pieces,
+         self.bot_material, self.player_material) = self.undo.pop()
+        x, y = path[-1]
+        board[x][y] = '_'
+        for (x, y), piece in zip(captured, taken):
+            board[x][y] = piece
+        x, y = path[0]
+        board[x][y] = moved
+        self.generator.unmake_move(move, moved, taken)
+        self.state.bots_move = not self.state.bots_move
+
+    def is_terminal(self):
+        """is_terminal
+
+        The is_terminal method checks if one side has no pieces left, using
+        the piece counts instead of scanning the board. Like
+        CheckersState.is_terminal it sets bot_lost on state when it returns
+        True.
+
+        Returns:
+            bool : True if a terminal state has been reached, False otherwise.
+        """
+        if self.bot_pieces and self.player_pieces:
+            return False
+        self.state.bot_lost = self.player_pieces > 0
+        return True
+
+    def score(self):
+        """score
+
+        The score method returns the same score as the evaluator whose tables
+        the position uses, from the running material sums.
+
+        Returns:
+            float : The bot's material minus the player's if the bot is on
+            move, the player's minus the bot's otherwise.
+        """
+        if self.state.bots_move:
+            return self.bot_material - self.player_material
+        return self.player_material - self.bot_material
@@ -0,0 +1,292 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""positions
+
+File: positions.py\n
+Author: Alan Grant\n
+Version: 1.0\n
+Date: 10/18/2026\n
+Class: CSCI-C 458\n
+
+This module provides the batch analysis of single positions, for programs
+which need many positions scored without playing a game. Positions are read
+one per line, in any of three forms:
+
+    W:W21,22,K30:B5,9,10         a PDN FEN string (see source.pdn)
+    p _b_b/b_b_/____/p_p_/...    the side on move and the board's rows
+    layouts/8x8.board b          a board file, and the side on move
+
+Every position is searched by a CheckersBot over a pool of worker processes
+and one line of JSON is written for each, in the order of the input, with the
+best move, its score for the side on move and the depth searched, or the
+error if the line is not a position.
+
+Analyse positions with:
+
+    python -m source.positions positions.txt --time 0.5 --workers 4
+"""
+
+
+import argparse
+import json
+import os
+import sys
+from time import time
+
+from .checkers_bot import CheckersBot
+from .checkers_state import CheckersState
+from .analysis import SCORE, bounded_map, evaluate
+from .encoding import encode_move, MAX_SIZE
+from .pdn import fen_state, move_text
+
+
+# The pieces and the empty square a board may hold.
+SQUARES = frozenset('_bBpP')
+
+# The bot of a worker process, built once by _init_worker.
+_bot = None
+
+
+def _board(rows):
+    """_board
+
+    The _board function checks that rows of squares make a square board.
+
+    Args:
+        rows (list) : The rows, each a string or list of squares.
+
+    Returns:
+        list : The board as a list of lists.
+
+    Raises:
+        ValueError : If the rows do not make a square board of pieces, or the
+        board is larger than moves can be encoded for.
+    """
+    board = [list(row) for row in rows]
+    size = len(board)
+    if size < 2 or any(len(row) != size for row in board):
+        raise ValueError('the board is not square')
+    _check_size(size)
+    if any(square not in SQUARES for row in board for square in row):
+        raise ValueError('the board holds squares other than _bBpP')
+    return board
+
+
+def _check_size(size):
+    """_check_size
+
+    The _check_size function checks that the moves of a board can be
+    encoded, which encoding.encode_move does for boards up to MAX_SIZE.
+
+    Args:
+        size (int) : The size of the board.
+
+    Raises:
+        ValueError : If the board is larger than MAX_SIZE.
+    """
+    if size > MAX_SIZE:
+        raise ValueError('boards larger than {0}x{0} are not supported'
+                         .format(MAX_SIZE))
+
+
+def parse_position(line, size=8, side='p', parity=1):
+    """parse_position
+
+    The parse_position function reads a position from a line of input.
+
+    Args:
+        line (str) : A PDN FEN string, the side on move and the board's rows
+        joined by '/', or the path of a board file optionally followed by
+        the side on move.\n
+        size (int) : The size of the board of a FEN string.\n
+        side (str) : The side on move of a board file without one, 'b' or
+        'p'.\n
+        parity (int) : The parity of the dark squares of a FEN string's
+        board, as source.pdn.dark_parity returns it.
+
+    Returns:
+        CheckersState : The position.
+
+    Raises:
+        ValueError : If the line is not a position.\n
+        OSError : If the board file cannot be read.
+    """
+    line = line.strip()
+    if line[:2].upper() in ('W:', 'B:'):
+        _check_size(size)
+        return fen_state(line, size, parity)
+    tokens = line.split()
+    if (len(tokens) == 2 and tokens[0] in ('b', 'p') and
+            set(tokens[1]) <= SQUARES | {'/'}):
+        board = _board(tokens[1].split('/'))
+        return CheckersState(board, tokens[0] == 'b', [], len(board))
+    if len(tokens) > 1 and tokens[-1] in ('b', 'p'):
+        line, side = line.rsplit(None, 1)
+    if not os.path.isfile(line):
+        raise ValueError('not a position or board file: {!r}'.format(line))
+    with open(line) as f:
+        board = _board(row.split() for row in f if row.strip())
+    return CheckersState(board, side == 'b', [], len(board))
+
+
+def _init_worker(max_depth, max_time, tablebase):
+    """_init_worker
+
+    The _init_worker function runs once in every worker process. It builds
+    the bot the positions are searched with.
+
+    Args:
+        max_depth (int) : The max depth of each search.\n
+        max_time (float) : The max time in seconds of each search.\n
+        tablebase (str) : The file path to an endgame tablebase, or None.
+    """
+    global _bot
+    _bot = CheckersBot(None, SCORE, max_depth, max_time, None,
+                       tablebase=tablebase)
+
+
+def analyse_position(bot, number, line, size=8, side='p', parity=1):
+    """analyse_position
+
+    The analyse_position function searches the position on a line of input.
+    The bot forgets its earlier searches first, so the result does not
+    depend on which positions came before.
+
+    Args:
+        bot (CheckersBot) : The bot to search with.\n
+        number (int) : The number of the line, from 1.\n
+        line (str) : The line.\n
+        size (int) : The size of the board of a FEN string.\n
+        side (str) : The side on move of a board file without one.\n
+        parity (int) : The parity of the dark squares of a FEN string's
+        board.
+
+    Returns:
+        dict : The line number and the position, then the side on move, the
+        best move in PDN and as its code and list of squares, the score for
+        the side on move, the depth searched, the positions visited and the
+        seconds taken; or the error, if the line is not a position or its
+        board file cannot be read.
+    """
+    record = {'line': number, 'position': line.strip()}
+    try:
+        state = parse_position(line, size, side, parity)
+    except (ValueError, OSError) as e:
+        return dict(record, error=str(e))
+    bot.new_game()
+    start = time()
+    best, score, depth = evaluate(bot, state)
+    record.update({
+        'side': 'b' if state.bots_move else 'p',
+        'best': move_text(best, state.size) if best else None,
+        'code': encode_move(best, state.size) if best else None,
+        'path': best, 'score': score, 'depth': depth, 'nodes': bot.nodes,
+        'time': round(time() - start, 4)})
+    return record
+
+
+def _analyse(number, line, size, side, parity):
+    """_analyse
+
+    The _analyse function analyses one position in a worker process.
+
+    Args:
+        number (int) : The number of the line.\n
+        line (str) : The line.\n
+        size (int) : The size of the board of a FEN string.\n
+        side (str) : The side on move of a board file without one.\n
+        parity (int) : The parity of the dark squares of a FEN string's
+        board.
+
+    Returns:
+        dict : The record of analyse_position.
+    """
+    return analyse_position(_bot, number, line, size, side, parity)
+
+
+def analyse_positions(stream, output, max_depth, max_time, workers=1,
+                      size=8, side='p', parity=1, tablebase=None):
+    """analyse_positions
+
+    The analyse_positions function analyses every position of a stream and
+    writes a line of JSON for each to output, in the order of the input.
+    Blank lines and lines starting with '#' are skipped.
+
+    Args:
+        stream (file) : The open input, one position per line.\n
+        output (file) : The open file to write to.\n
+        max_depth (int) : The max depth of each search.\n
+        max_time (float) : The max time in seconds of each search.\n
+        workers (int) : The number of processes to search on.\n
+        size (int) : The size of the board of FEN strings.\n
+        side (str) : The side on move of board files without one.\n
+        parity (int) : The parity of the dark squares of FEN strings'
+        boards.\n
+        tablebase (str) : The file path to an endgame tablebase, or None.
+
+    Returns:
+        dict : The number of positions analysed and of lines which were not
+        positions.
+    """
+    totals = {'positions': 0, 'errors': 0}
+    items = ((number, line, size, side, parity)
+             for number, line in enumerate(stream, 1)
+             if line.strip() and not line.lstrip().startswith('#'))
+    for record in bounded_map(_analyse, items, workers, _init_worker,
+                              (max_depth, max_time, tablebase)):
+        totals['errors' if 'error' in record else 'positions'] += 1
+        output.write(json.dumps(record) + '\n')
+        output.flush()
+    if workers <= 1 and _bot is not None:
+        _bot.close()
+    return totals
+
+
+def main():
+    """main
+
+    The main function is the command line interface of the position
+    analysis.
+    """
+    parser = argparse.ArgumentParser(
+        description='Find the best move of every position in a file.')
+    parser.add_argument('input', nargs='?', default='-',
+                        help='file of positions, one per line '
+                             '(default: stdin)')
+    parser.add_argument('-o', '--output',
+                        help='file to write the JSON lines to '
+                             '(default: stdout)')
+    parser.add_argument('--depth', type=int, default=25,
+                        help='max depth of each search in plies')
+    parser.add_argument('--time', type=float, default=1.0,
+                        help='max seconds of each search')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='processes to search on')
+    parser.add_argument('--size', type=int, default=8,
+                        help='board size of FEN strings')
+    parser.add_argument('--side', choices=('b', 'p'), default='p',
+                        help='side on move of board files which give none')
+    parser.add_argument('--parity', type=int, choices=(0, 1), default=1,
+                        help='1 if the dark squares of FEN strings\' boards '
+                             'have odd row + column, 0 if even')
+    parser.add_argument('--tablebase',
+                        help='endgame tablebase to score endings with')
+    args = parser.parse_args()
+    stream = sys.stdin if args.input == '-' else open(args.input)
+    output = open(args.output, 'w') if args.output else sys.stdout
+    start = time()
+    try:
+        totals = analyse_positions(stream, output, args.depth, args.time,
+                                   args.workers, args.size, args.side,
+                                   args.parity, args.tablebase)
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+        if output is not sys.stdout:
+            output.close()
+    print('{positions} positions, {errors} errors'.format(**totals),
+          '({:.1f}s)'.format(time() - start), file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
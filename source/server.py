@@ -0,0 +1,649 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""server
+
+File: server.py\n
+Author: Alan Grant\n
+Version: 1.0\n
+Date: 10/18/2026\n
+Class: CSCI-C 458\n
+
+This module provides access to the GameServer class. A GameServer hosts many
+games of checkers at once over a TCP or Unix socket. Clients send one JSON
+object per line and get one JSON object per line back. The human's moves are
+checked against the SuccessorGenerator, and the bot's searches are run on a
+bounded pool of worker processes. Searches wait in a queue of limited length
+for a free worker; when every worker is busy and the queue is full a move is
+turned away with a "busy" error rather than queued without end.
+
+The requests are:
+
+    {"op": "new", "layout": "8x8", "time": 1.0, "budget": 60}
+    {"op": "move", "game": 1, "move": [[5, 0], [4, 1]]}
+    {"op": "state", "game": 1}
+    {"op": "close", "game": 1}
+    {"op": "stats"}
+
+Every reply has "ok" set to true, or to false with an "error" message. Squares
+are [x, y] pairs, x being the row, as in CheckersGame. Run a server with:
+
+    python -m source.server --port 8765 --workers 4
+"""
+
+
+import argparse
+import asyncio
+import json
+import math
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from time import time
+
+from .board import CheckersBoard
+from .book import default_book_path
+from .checkers_state import CheckersState
+from .checkers_bot import CheckersBot
+from .encoding import index_moves, find_move
+from .successors import get_generator
+from .tablebase import default_tablebase_path
+
+
+# A game's bot plans to spread what is left of its budget over this many more
+# moves, and never searches for less than MIN_TIME seconds, even once the
+# budget is spent.
+MOVES_LEFT = 20
+MIN_TIME = 0.05
+
+# The number of recent searches the latency figures are taken from.
+LATENCY_WINDOW = 1000
+
+# The bots of a worker process, keyed by layout, built as they are needed.
+_bots = {}
+_settings = None
+
+
+def _init_worker(settings):
+    """_init_worker
+
+    The _init_worker function runs once in every worker process. It keeps
+    the settings the worker's bots are built with.
+
+    Args:
+        settings (dict) : The max_depth and the CheckersBot keyword arguments
+        of the bots.
+    """
+    global _settings
+    _settings = settings
+
+
+def _search(layout, board, move_time):
+    """_search
+
+    The _search function finds the bot's move in a worker process. Each
+    worker has one bot per layout, using the layout's opening book and
+    tablebase if they have been built. A worker serves many games in turn,
+    so its tables hold positions from all of them.
+
+    Args:
+        layout (str) : The file path to the game's layout file.\n
+        board (list) : The board, with the bot on move.\n
+        move_time (float) : The max time in seconds of the search.
+
+    Returns:
+        tuple : The path and the board of the bot's move, or None if the bot
+        has no moves, the number of positions searched and the seconds the
+        search took.
+    """
+    start = time()
+    bot = _bots.get(layout)
+    if bot is None:
+        options = dict(_settings)
+        max_depth = options.pop('max_depth')
+        book = default_book_path(layout)
+        tablebase = default_tablebase_path(layout)
+        bot = _bots[layout] = CheckersBot(
+            None, 1e9, max_depth, move_time, None,
+            book=book if os.path.exists(book) else None,
+            tablebase=tablebase if os.path.exists(tablebase) else None,
+            **options)
+    bot.max_time = bot.soft_time = move_time
+    bot.update_state(CheckersState(board, True, [], len(board)))
+    result = bot.get_move()
+    if result is None:
+        return None, bot.nodes, time() - start
+    return (result.moves, result.board), bot.nodes, time() - start
+
+
+class ServerGame:
+    """ServerGame
+
+    The ServerGame class holds one game hosted by a GameServer.
+
+    Attributes:
+        id (int) : The number the game is known by.\n
+        layout (str) : The file path to the layout file.\n
+        state (CheckersState) : The current state of the game.\n
+        move_time (float) : The most seconds the bot searches for a move.\n
+        budget (float) : The seconds of searching the bot has left.\n
+        status (str) : 'playing', 'player_won' or 'bot_won'.\n
+        busy (bool) : True while the bot is searching its move.\n
+        plies (int) : The number of moves made.
+    """
+
+    def __init__(self, id, layout, board, move_time, budget):
+        """__init__
+
+        The __init__ method is the constructor for the ServerGame class. The
+        player moves first.
+
+        Args:
+            id (int) : The number the game is known by.\n
+            layout (str) : The file path to the layout file.\n
+            board (list) : The starting board.\n
+            move_time (float) : The most seconds the bot searches for a
+            move.\n
+            budget (float) : The seconds of searching the bot has for the
+            whole game.
+        """
+        self.id = id
+        self.layout = layout
+        self.state = CheckersState([row[:] for row in board], False, [],
+                                   len(board))
+        self.move_time = move_time
+        self.budget = budget
+        self.status = 'playing'
+        self.busy = False
+        self.plies = 0
+
+    def next_move_time(self):
+        """next_move_time
+
+        The next_move_time method returns how long the bot may search its
+        next move: move_time, or a share of what is left of the budget if
+        that is less. The time never drops below MIN_TIME, so the budget
+        only slows the bot down and is not a hard limit: a game whose budget
+        is spent goes on with MIN_TIME per move.
+
+        Returns:
+            float : The time in seconds.
+        """
+        return min(self.move_time, max(self.budget / MOVES_LEFT, MIN_TIME))
+
+    def to_dict(self, generator):
+        """to_dict
+
+        The to_dict method returns the game as it is sent to clients.
+
+        Args:
+            generator (class) : The successor generator class used to list
+            the player's legal moves.
+
+        Returns:
+            dict : The game's number, board, status, moves made, budget left
+            and the player's legal moves.
+        """
+        moves = []
+        if self.status == 'playing' and not self.state.bots_move:
+            moves = [move[0] for move in generator(self.state).moves()]
+        return {'game': self.id,
+                'board': [' '.join(row) for row in self.state.board],
+                'status': self.status, 'plies': self.plies,
+                'budget': round(self.budget, 3), 'moves': moves}
+
+
+class _Job:
+    """_Job
+
+    The _Job class is a bot search waiting in the GameServer's queue.
+    """
+
+    def __init__(self, layout, board, move_time, future):
+        """__init__
+
+        The __init__ method is the constructor for the _Job class. The time
+        it was queued is taken now.
+
+        Args:
+            layout (str) : The file path to the layout file.\n
+            board (list) : The board the bot is to move on.\n
+            move_time (float) : The most seconds the bot searches for.\n
+            future (asyncio.Future) : The future the bot's move, the
+            positions visited and the seconds taken are set on.
+        """
+        self.layout = layout
+        self.board = board
+        self.move_time = move_time
+        self.future = future
+        self.queued = time()
+
+
+class GameServer:
+    """GameServer
+
+    The GameServer class hosts games for clients connected over a socket.
+    Each connection's requests are answered in order, so a client waiting on
+    the bot's move sends nothing more until it has been made.
+
+    Attributes:
+        layouts (str) : The directory of the layout files.\n
+        workers (int) : The number of processes searching the bot's moves.\n
+        max_queue (int) : The most searches which may wait for a worker.\n
+        move_time (float) : The most seconds a game may give the bot for a
+        move.\n
+        budget (float) : The most seconds of searching a game may give the
+        bot.\n
+        settings (dict) : The max_depth and CheckersBot keyword arguments of
+        the workers' bots.\n
+        generator (class) : The successor generator class used to check the
+        player's moves.\n
+        games (dict) : The games being played, keyed by number.\n
+        queue (asyncio.Queue) : The searches waiting for a worker.\n
+        pending (int) : The searches queued or running. A move is turned
+        away when there are already workers + max_queue.\n
+        pool (ProcessPoolExecutor) : The worker processes.\n
+        queue_latency (deque) : The seconds recent searches waited in the
+        queue.\n
+        search_latency (deque) : The seconds recent searches took.\n
+        counts (dict) : The number of games started, searches run, searches
+        turned away and positions searched.
+    """
+
+    def __init__(self, layouts='layouts', workers=1, max_queue=16,
+                 move_time=1.0, budget=300.0, max_depth=25, backend='list',
+                 hash_mb=16):
+        """__init__
+
+        The __init__ method is the constructor for the GameServer class.
+
+        Args:
+            layouts (str) : The directory of the layout files.\n
+            workers (int) : The number of processes searching the bot's
+            moves.\n
+            max_queue (int) : The most searches which may wait for a worker.\n
+            move_time (float) : The most seconds a game may give the bot for a
+            move.\n
+            budget (float) : The most seconds of searching a game may give the
+            bot.\n
+            max_depth (int) : The max depth of the bot's search.\n
+            backend (str) : The name of the successor generator backend.\n
+            hash_mb (float) : The size of each worker's transposition table
+            per layout, in megabytes.
+        """
+        self.layouts = layouts
+        self.workers = workers
+        self.max_queue = max_queue
+        self.move_time = move_time
+        self.budget = budget
+        self.settings = {'max_depth': max_depth, 'backend': backend,
+                         'hash_mb': hash_mb}
+        self.generator = get_generator(backend)
+        self.games = {}
+        self._next_id = 1
+        self._boards = {}
+        self.queue = None
+        self.pending = 0
+        self.pool = None
+        self._dispatchers = []
+        self.queue_latency = deque(maxlen=LATENCY_WINDOW)
+        self.search_latency = deque(maxlen=LATENCY_WINDOW)
+        self.counts = {'games': 0, 'searches': 0, 'rejected': 0, 'nodes': 0}
+
+    async def start(self):
+        """start
+
+        The start method starts the worker processes and the tasks handing
+        them queued searches. It must be called from the event loop.
+        """
+        self.queue = asyncio.Queue()
+        self.pool = ProcessPoolExecutor(max_workers=self.workers,
+                                        initializer=_init_worker,
+                                        initargs=(self.settings,))
+        self._dispatchers = [asyncio.create_task(self._dispatch())
+                             for _ in range(self.workers)]
+
+    async def close(self):
+        """close
+
+        The close method stops handing out searches and shuts down the
+        worker processes.
+        """
+        for task in self._dispatchers:
+            task.cancel()
+        await asyncio.gather(*self._dispatchers, return_exceptions=True)
+        self._dispatchers = []
+        if self.pool:
+            self.pool.shutdown(cancel_futures=True)
+            self.pool = None
+
+    async def _dispatch(self):
+        """_dispatch
+
+        The _dispatch method hands queued searches to the worker processes,
+        one at a time. The server runs one per worker, so a search is only
+        taken off the queue when a worker is free for it.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            job = await self.queue.get()
+            start = time()
+            self.queue_latency.append(start - job.queued)
+            try:
+                result = await loop.run_in_executor(
+                    self.pool, _search, job.layout, job.board,
+                    job.move_time)
+            except Exception as e:
+                if not job.future.done():
+                    job.future.set_exception(e)
+            else:
+                self.search_latency.append(time() - start)
+                if not job.future.done():
+                    job.future.set_result(result)
+            finally:
+                self.pending -= 1
+                self.queue.task_done()
+
+    def _layout(self, name):
+        """_layout
+
+        The _layout method returns the file path and starting board of a
+        layout in the layouts directory.
+
+        Args:
+            name (str) : The name of the layout, such as "8x8".
+
+        Returns:
+            tuple : The file path and the board.
+
+        Raises:
+            ValueError : If there is no such layout.
+        """
+        path = os.path.join(self.layouts, str(name) + '.board')
+        if os.path.basename(path) != str(name) + '.board' or (
+                not os.path.isfile(path)):
+            raise ValueError('unknown layout {!r}'.format(name))
+        if path not in self._boards:
+            self._boards[path] = CheckersBoard(path).board
+        return path, self._boards[path]
+
+    def _game(self, request):
+        """_game
+
+        The _game method returns the game a request is about.
+
+        Args:
+            request (dict) : The request.
+
+        Returns:
+            ServerGame : The game.
+
+        Raises:
+            ValueError : If there is no such game.
+        """
+        game = self.games.get(request.get('game'))
+        if game is None:
+            raise ValueError('unknown game {!r}'.format(request.get('game')))
+        return game
+
+    async def handle(self, request):
+        """handle
+
+        The handle method answers one request.
+
+        Args:
+            request (dict) : The request, as described for the module.
+
+        Returns:
+            dict : The reply.
+        """
+        try:
+            op = request.get('op')
+            if op == 'new':
+                return self._new(request)
+            if op == 'move':
+                return await self._move(request)
+            if op == 'state':
+                return dict(self._game(request).to_dict(self.generator),
+                            ok=True)
+            if op == 'close':
+                del self.games[self._game(request).id]
+                return {'ok': True}
+            if op == 'stats':
+                return dict(self.stats(), ok=True)
+            raise ValueError('unknown op {!r}'.format(op))
+        except (ValueError, TypeError, KeyError) as e:
+            return {'ok': False, 'error': str(e)}
+
+    def _new(self, request):
+        """_new
+
+        The _new method starts a game. Its time per move and budget are
+        capped by the server's.
+
+        Args:
+            request (dict) : The request, with the layout and optionally the
+            time per move and budget.
+
+        Returns:
+            dict : The reply, with the new game.
+        """
+        path, board = self._layout(request.get('layout', '8x8'))
+        move_time = float(request.get('time', self.move_time))
+        budget = float(request.get('budget', self.budget))
+        if not (math.isfinite(move_time) and math.isfinite(budget)):
+            raise ValueError('time and budget must be finite')
+        if move_time <= 0 or budget <= 0:
+            raise ValueError('time and budget must be positive')
+        move_time = min(move_time, self.move_time)
+        budget = min(budget, self.budget)
+        game = ServerGame(self._next_id, path, board, move_time, budget)
+        self._next_id += 1
+        self.games[game.id] = game
+        self.counts['games'] += 1
+        return dict(game.to_dict(self.generator), ok=True)
+
+    async def _move(self, request):
+        """_move
+
+        The _move method makes the player's move in a game, then queues the
+        bot's search and waits for its move. Only the search itself is taken
+        from the game's budget, not the wait for a worker. If every worker is
+        searching and max_queue searches are already waiting, the player's
+        move is not made and the client is told the server is busy, and if
+        the search fails the player's move is taken back.
+
+        Args:
+            request (dict) : The request, with the game and the move as a
+            list of squares.
+
+        Returns:
+            dict : The reply, with the game after the bot's move and the
+            bot's move, or the error.
+        """
+        game = self._game(request)
+        if game.status != 'playing':
+            raise ValueError('the game is over')
+        if game.busy:
+            raise ValueError('the bot is still thinking')
+        path = [tuple(square) for square in request['move']]
+        size = game.state.size
+        move = find_move(index_moves(self.generator(game.state).moves(), size),
+                         path, size)
+        if move is None:
+            raise ValueError('illegal move {}'.format(request['move']))
+        successor = game.state.result(move)
+
+        if successor.is_terminal():
+            game.state, game.status = successor, 'player_won'
+            game.plies += 1
+            return dict(game.to_dict(self.generator), ok=True, bot_move=None)
+
+        move_time = game.next_move_time()
+        future = asyncio.get_running_loop().create_future()
+        job = _Job(game.layout, successor.board, move_time, future)
+        if self.pending >= self.workers + self.max_queue:
+            self.counts['rejected'] += 1
+            return {'ok': False, 'error': 'busy', 'queued': self.queue.qsize()}
+        self.pending += 1
+        self.queue.put_nowait(job)
+        # The player's move is only kept once the search has finished, so a
+        # failed search leaves the game as it was, with the player on move.
+        game.busy = True
+        try:
+            result, nodes, elapsed = await future
+        except Exception as e:
+            return {'ok': False, 'error': 'search failed: {}'.format(e)}
+        finally:
+            game.busy = False
+        game.state = successor
+        game.plies += 1
+        game.budget = max(game.budget - elapsed, 0.0)
+        self.counts['searches'] += 1
+        self.counts['nodes'] += nodes
+
+        if result is None:
+            game.status = 'player_won'
+            return dict(game.to_dict(self.generator), ok=True, bot_move=None)
+        bot_path, board = result
+        game.state = CheckersState(board, False, bot_path, game.state.size)
+        game.plies += 1
+        if game.state.is_terminal() or not self.generator(
+                game.state).moves():
+            game.status = 'bot_won'
+        return dict(game.to_dict(self.generator), ok=True, bot_move=bot_path)
+
+    def stats(self):
+        """stats
+
+        The stats method returns the server's load and latency figures. The
+        latencies are over the last LATENCY_WINDOW searches: the time waited
+        in the queue for a worker and the time the search itself took.
+
+        Returns:
+            dict : The figures.
+        """
+        return {'games': len(self.games), 'started': self.counts['games'],
+                'searches': self.counts['searches'],
+                'rejected': self.counts['rejected'],
+                'nodes': self.counts['nodes'],
+                'queued': self.queue.qsize() if self.queue else 0,
+                'max_queue': self.max_queue, 'workers': self.workers,
+                'queue_latency': _summary(self.queue_latency),
+                'search_latency': _summary(self.search_latency)}
+
+    async def _client(self, reader, writer):
+        """_client
+
+        The _client method serves one connection until the client closes it.
+
+        Args:
+            reader (asyncio.StreamReader) : The connection's reader.\n
+            writer (asyncio.StreamWriter) : The connection's writer.
+        """
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError('a request must be a JSON object')
+                except ValueError as e:
+                    reply = {'ok': False, 'error': str(e)}
+                else:
+                    reply = await self.handle(request)
+                writer.write(json.dumps(reply).encode() + b'\n')
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host='127.0.0.1', port=8765, path=None):
+        """serve
+
+        The serve method starts the server and serves clients until it is
+        cancelled.
+
+        Args:
+            host (str) : The address to listen on.\n
+            port (int) : The TCP port to listen on.\n
+            path (str) : The Unix socket to listen on instead of TCP, or None.
+        """
+        await self.start()
+        try:
+            if path:
+                server = await asyncio.start_unix_server(self._client, path)
+            else:
+                server = await asyncio.start_server(self._client, host, port)
+            async with server:
+                await server.serve_forever()
+        finally:
+            await self.close()
+
+
+def _summary(values):
+    """_summary
+
+    The _summary function sums up a list of latencies.
+
+    Args:
+        values (iterable) : The latencies in seconds.
+
+    Returns:
+        dict : The number of latencies and their mean, median, 95th
+        percentile and max in milliseconds.
+    """
+    values = sorted(values)
+    if not values:
+        return {'count': 0}
+    n = len(values)
+    return {'count': n,
+            'mean_ms': round(1000 * sum(values) / n, 2),
+            'p50_ms': round(1000 * values[n // 2], 2),
+            'p95_ms': round(1000 * values[min(n - 1, int(n * 0.95))], 2),
+            'max_ms': round(1000 * values[-1], 2)}
+
+
+def main():
+    """main
+
+    The main function is the command line interface of the game server.
+    """
+    parser = argparse.ArgumentParser(
+        description='Host checkers games over a socket.')
+    parser.add_argument('--host', default='127.0.0.1',
+                        help='the address to listen on')
+    parser.add_argument('--port', type=int, default=8765,
+                        help='the TCP port to listen on')
+    parser.add_argument('--unix', help='listen on this Unix socket instead')
+    parser.add_argument('--layouts', default='layouts',
+                        help='the directory of the layout files')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='processes to search the bot\'s moves on')
+    parser.add_argument('--max-queue', type=int, default=16,
+                        help='most searches which may wait for a worker')
+    parser.add_argument('--time', type=float, default=1.0,
+                        help='most seconds the bot searches for a move')
+    parser.add_argument('--budget', type=float, default=300.0,
+                        help='most seconds of searching for a whole game')
+    parser.add_argument('--depth', type=int, default=25,
+                        help='max depth of the bot\'s search')
+    parser.add_argument('--backend', default='list',
+                        help='the successor generator backend')
+    parser.add_argument('--hash-mb', type=float, default=16,
+                        help='megabytes of transposition table per worker '
+                        'and layout')
+    args = parser.parse_args()
+    server = GameServer(args.layouts, args.workers, args.max_queue,
+                        args.time, args.budget, args.depth, args.backend,
+                        args.hash_mb)
+    try:
+        asyncio.run(server.serve(args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""stats
+
+File: stats.py\n
+Author: Alan Grant\n
+Version: 1.0\n
+Date: 10/18/2026\n
+Class: CSCI-C 458\n
+
+This module provides access to the SearchStats class, the record the bot
+keeps of each iteration of its iterative deepening search. It shows how deep
+the bot got, how much work each depth took and how well its moves were
+ordered, which is the place to start when the bot is slow or plays a strange
+move.
+"""
+
+
+import json
+
+
+class SearchStats:
+    """SearchStats
+
+    The SearchStats class holds the statistics of one iteration of the bot's
+    search. The counts are for that iteration alone.
+
+    Attributes:
+        depth (int) : The depth of the iteration.\n
+        complete (bool) : False if the time limit cut the iteration short.\n
+        nodes (int) : The number of positions visited.\n
+        cutoffs (int) : The number of positions whose search was cut off
+        because a move was too good for the other side to allow.\n
+        first_cutoffs (int) : The number of those cutoffs caused by the first
+        move searched.\n
+        evals (int) : The number of positions scored by the scoring
+        function.\n
+        generated (int) : The number of moves generated.\n
+        time (float) : The seconds the iteration took.\n
+        score (float) : The score of the best move.\n
+        pv (list) : The principal variation, as the code of each move.
+    """
+
+    def __init__(self, depth, complete, counts, time, score, pv):
+        """__init__
+
+        The __init__ method is the constructor for the SearchStats class.
+
+        Args:
+            depth (int) : The depth of the iteration.\n
+            complete (bool) : False if the time limit cut the iteration
+            short.\n
+            counts (tuple) : The nodes, cutoffs, first_cutoffs, evals and
+            generated counts of the iteration.\n
+            time (float) : The seconds the iteration took.\n
+            score (float) : The score of the best move.\n
+            pv (list) : The principal variation, as the code of each move.
+        """
+        self.depth = depth
+        self.complete = complete
+        (self.nodes, self.cutoffs, self.first_cutoffs, self.evals,
+         self.generated) = counts
+        self.time = time
+        self.score = score
+        self.pv = pv
+
+    @property
+    def first_cutoff_rate(self):
+        """first_cutoff_rate
+
+        The first_cutoff_rate property is the fraction of cutoffs caused by
+        the first move searched. The closer it is to 1 the better the moves
+        are ordered.
+
+        Returns:
+            float : The fraction, or 0.0 if there were no cutoffs.
+        """
+        return self.first_cutoffs / self.cutoffs if self.cutoffs else 0.0
+
+    def to_dict(self):
+        """to_dict
+
+        The to_dict method returns the statistics as a dict of plain values.
+
+        Returns:
+            dict : The statistics, with the first cutoff rate and the nodes
+            visited per second.
+        """
+        return {'depth': self.depth, 'complete': self.complete,
+                'nodes': self.nodes, 'cutoffs': self.cutoffs,
+                'first_cutoffs': self.first_cutoffs,
+                'first_cutoff_rate': self.first_cutoff_rate,
+                'evals': self.evals, 'generated': self.generated,
+                'time': self.time,
+                'nps': self.nodes / self.time if self.time else 0.0,
+                'score': self.score, 'pv': self.pv}
+
+    def to_json(self):
+        """to_json
+
+        The to_json method returns the statistics as one line of JSON.
+
+        Returns:
+            str : The statistics as JSON.
+        """
+        return json.dumps(self.to_dict())
+
+    def __str__(self):
+        """__str__
+
+        The __str__ method returns a one line summary of the statistics.
+
+        Returns:
+            str : The summary.
+        """
+        return ('depth {:2d}{} {:9d} nodes {:6.2f}s {:5.1%} first cutoffs '
+                'score {:g}'.format(self.depth, ' ' if self.complete else '*',
+                                    self.nodes, self.time,
+                                    self.first_cutoff_rate, self.score))
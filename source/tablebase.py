@@ -0,0 +1,541 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""tablebase
+
+File: tablebase.py\n
+Author: Alan Grant\n
+Version: 1.0\n
+Date: 10/18/2026\n
+Class: CSCI-C 458\n
+
+This module provides access to the Tablebase class and the build_tablebase
+function. An endgame tablebase holds the exact result of every position with
+a few pieces left: whether the side on move wins, loses or draws with best
+play and in how many moves. They are found by retrograde analysis, working
+back from the positions where the side on move has lost.
+
+Positions are grouped by their material, the number of men and kings of each
+side. Each material group is a table with one byte per position, indexed by
+the squares each kind of piece stands on. Build the tablebase for a layout
+with:
+
+    python -m source.tablebase layouts/4x4.board --pieces 8
+"""
+
+
+import argparse
+import mmap
+import os
+import struct
+from math import comb
+
+from .board import CheckersBoard
+from .checkers_state import CheckersState
+from .successors import SuccessorGenerator
+
+
+# The file starts with a header: magic, version, board size, the parity of the
+# playable squares, the most pieces of any position and the number of
+# material groups, followed by the material and data offset of each group.
+HEADER = struct.Struct('>4sBBBBI')
+GROUP = struct.Struct('>BBBBQ')
+MAGIC = b'CKTB'
+VERSION = 1
+
+# The order of the pieces in a material group and in the index.
+PIECES = 'bBpP'
+
+# The byte stored for a position is DRAW, WIN + distance or LOSS + distance,
+# where distance is the number of moves to the end of the game with best play.
+# Distances too long to store are saturated.
+DRAW, WIN, LOSS = 0, 1, 128
+MAX_DISTANCE = 126
+
+
+def default_tablebase_path(layout):
+    """default_tablebase_path
+
+    The default_tablebase_path function returns where the tablebase for a
+    layout is kept: next to the layout file, with a .tb extension.
+
+    Args:
+        layout (str) : The file path to the layout file.
+
+    Returns:
+        str : The file path to the layout's tablebase.
+    """
+    return os.path.splitext(layout)[0] + '.tb'
+
+
+class _Indexer:
+    """_Indexer
+
+    The _Indexer class turns positions into indexes into their material
+    group's table and back. The pieces of each kind take their squares from
+    the playable squares the kinds before them left free, so the squares of a
+    kind are ranked as a combination of the free squares and the ranks of all
+    the kinds are combined as a mixed radix number. The side on move is the
+    lowest digit.
+
+    Attributes:
+        size (int) : The size of the board.\n
+        squares (list) : The playable squares (x, y), in row order.\n
+        numbers (dict) : The number of each playable square.
+    """
+
+    def __init__(self, size, parity):
+        """__init__
+
+        The __init__ method is the constructor for the _Indexer class.
+
+        Args:
+            size (int) : The size of the board.\n
+            parity (int) : (x + y) % 2 of the playable squares.
+        """
+        self.size = size
+        self.squares = [(x, y) for x in range(size) for y in range(size)
+                        if (x + y) % 2 == parity]
+        self.numbers = {square: n for n, square in enumerate(self.squares)}
+
+    def radices(self, material):
+        """radices
+
+        The radices method returns the number of ways each kind of piece of a
+        material group can be placed.
+
+        Args:
+            material (tuple) : The number of b, B, p and P pieces.
+
+        Returns:
+            list : The radix of each kind of piece.
+        """
+        free, radices = len(self.squares), []
+        for count in material:
+            radices.append(comb(free, count))
+            free -= count
+        return radices
+
+    def group_size(self, material):
+        """group_size
+
+        The group_size method returns the number of positions of a material
+        group, counting both sides on move.
+
+        Args:
+            material (tuple) : The number of b, B, p and P pieces.
+
+        Returns:
+            int : The size of the group's table.
+        """
+        size = 2
+        for radix in self.radices(material):
+            size *= radix
+        return size
+
+    def index(self, board, bots_move):
+        """index
+
+        The index method finds the material group and index of a position.
+
+        Args:
+            board (list) : The board of the position.\n
+            bots_move (bool) : True if the bot is on move.
+
+        Returns:
+            tuple : The material group and the index, or None if a piece is
+            not on a playable square.
+        """
+        placed = {piece: [] for piece in PIECES}
+        for x, row in enumerate(board):
+            for y, square in enumerate(row):
+                if square != '_':
+                    number = self.numbers.get((x, y))
+                    if number is None:
+                        return None
+                    placed[square].append(number)
+        material = tuple(len(placed[piece]) for piece in PIECES)
+        index, taken = 0, []
+        for piece, radix in zip(PIECES, self.radices(material)):
+            rank = 0
+            for k, number in enumerate(placed[piece]):
+                # Number the square among the squares left free.
+                rank += comb(number - sum(1 for t in taken if t < number),
+                             k + 1)
+            index = index * radix + rank
+            taken.extend(placed[piece])
+        return material, index * 2 + (1 if bots_move else 0)
+
+    def board(self, material, index):
+        """board
+
+        The board method builds the position at an index of a material group.
+
+        Args:
+            material (tuple) : The number of b, B, p and P pieces.\n
+            index (int) : The index of the position.
+
+        Returns:
+            tuple : The board and True if the bot is on move.
+        """
+        bots_move = index % 2 == 1
+        index //= 2
+        ranks = []
+        for radix in reversed(self.radices(material)):
+            index, rank = divmod(index, radix)
+            ranks.append(rank)
+        board = [['_'] * self.size for x in range(self.size)]
+        free = list(range(len(self.squares)))
+        for piece, count, rank in zip(PIECES, material, reversed(ranks)):
+            chosen = []
+            for k in range(count, 0, -1):
+                c = k - 1
+                while comb(c + 1, k) <= rank:
+                    c += 1
+                rank -= comb(c, k)
+                chosen.append(c)
+            for c in chosen:
+                x, y = self.squares[free[c]]
+                board[x][y] = piece
+            for c in sorted(chosen, reverse=True):
+                del free[c]
+        return board, bots_move
+
+
+def _materials(pieces):
+    """_materials
+
+    The _materials function lists the material groups with at most pieces
+    pieces and at least one piece on each side, in the order they have to be
+    solved: a capture leads to a group with fewer pieces and crowning a man
+    to a group with fewer men, so those groups come first.
+
+    Args:
+        pieces (int) : The most pieces of a position.
+
+    Returns:
+        list : The (b, B, p, P) piece counts of each group.
+    """
+    materials = []
+    for total in range(2, pieces + 1):
+        for b in range(total + 1):
+            for king_b in range(total - b + 1):
+                for p in range(total - b - king_b + 1):
+                    king_p = total - b - king_b - p
+                    if b + king_b and p + king_p:
+                        materials.append((b, king_b, p, king_p))
+    return sorted(materials, key=lambda m: (sum(m), m[0] + m[2]))
+
+
+def _valid(board, size):
+    """_valid
+
+    The _valid function checks a board has no man on the row that would have
+    crowned it.
+
+    Args:
+        board (list) : The board to check.\n
+        size (int) : The size of the board.
+
+    Returns:
+        bool : True if the board can occur in a game.
+    """
+    return 'b' not in board[size - 1] and 'p' not in board[0]
+
+
+def _after(board, move):
+    """_after
+
+    The _after function returns the board reached by making a move.
+
+    Args:
+        board (list) : The board to move on. It is not changed.\n
+        move (tuple) : A (path, captured, piece) move tuple.
+
+    Returns:
+        list : The new board.
+    """
+    path, captured, piece = move
+    board = [row[:] for row in board]
+    x, y = path[0]
+    board[x][y] = '_'
+    for x, y in captured:
+        board[x][y] = '_'
+    x, y = path[-1]
+    board[x][y] = piece
+    return board
+
+
+def _encode(result, distance):
+    """_encode
+
+    The _encode function packs a result and distance into a byte.
+
+    Args:
+        result (int) : WIN or LOSS.\n
+        distance (int) : The number of moves to the end of the game.
+
+    Returns:
+        int : The stored byte.
+    """
+    return result + min(distance, MAX_DISTANCE)
+
+
+def _decode(value):
+    """_decode
+
+    The _decode function unpacks a stored byte.
+
+    Args:
+        value (int) : The stored byte.
+
+    Returns:
+        tuple : DRAW, WIN or LOSS and the distance.
+    """
+    if value == DRAW:
+        return DRAW, 0
+    if value >= LOSS:
+        return LOSS, value - LOSS
+    return WIN, value - WIN
+
+
+def _solve_group(indexer, material, solved):
+    """_solve_group
+
+    The _solve_group function solves one material group by retrograde
+    analysis. Every move out of the group, a capture or a man being crowned,
+    leads to a group already solved. Positions where the side on move has no
+    moves are lost. From there, level by level, a position is won in d + 1 if
+    a move leads to a position lost in d, and lost in d + 1 if every move
+    leads to a won position, the longest of them won in d. Positions never
+    resolved are draws.
+
+    Args:
+        indexer (_Indexer) : The indexer of the board.\n
+        material (tuple) : The number of b, B, p and P pieces of the group.\n
+        solved (dict) : The tables of the groups solved so far, keyed by
+        material.
+
+    Returns:
+        bytearray : The table of the group.
+    """
+    size = indexer.group_size(material)
+    table = bytearray(size)
+    parents = [[] for i in range(size)]
+    unknown = [0] * size
+    longest = [0] * size
+    levels = {}
+
+    def push(level, i, result):
+        levels.setdefault(level, []).append((i, result))
+
+    for i in range(size):
+        board, bots_move = indexer.board(material, i)
+        if not _valid(board, indexer.size):
+            continue
+        state = CheckersState(board, bots_move, [], indexer.size)
+        moves = SuccessorGenerator(state).moves()
+        win, drawn = None, False
+        for move in moves:
+            group, j = indexer.index(_after(board, move), not bots_move)
+            if group == material:
+                parents[j].append(i)
+                unknown[i] += 1
+                continue
+            if not (group[0] + group[1] and group[2] + group[3]):
+                # The last piece of the other side was captured.
+                result, distance = LOSS, 0
+            else:
+                result, distance = _decode(solved[group][j])
+            if result == LOSS:
+                win = distance + 1 if win is None else min(win, distance + 1)
+            elif result == WIN:
+                longest[i] = max(longest[i], distance)
+            else:
+                drawn = True
+        if not moves:
+            push(0, i, LOSS)
+        elif win is not None or drawn:
+            # A move to a lost or drawn position means it is never lost.
+            unknown[i] = None
+            if win is not None:
+                push(win, i, WIN)
+        elif unknown[i] == 0:
+            push(longest[i] + 1, i, LOSS)
+
+    level = 0
+    while levels:
+        for i, result in levels.pop(level, []):
+            if table[i] != DRAW:
+                continue
+            table[i] = _encode(result, level)
+            for parent in parents[i]:
+                if table[parent] != DRAW:
+                    continue
+                if result == LOSS:
+                    push(level + 1, parent, WIN)
+                elif unknown[parent] is not None:
+                    unknown[parent] -= 1
+                    longest[parent] = max(longest[parent], level)
+                    if unknown[parent] == 0:
+                        push(longest[parent] + 1, parent, LOSS)
+        level += 1
+    return table
+
+
+def build_tablebase(layout, path, pieces, log=print):
+    """build_tablebase
+
+    The build_tablebase function solves every material group of up to pieces
+    pieces for the board size of a layout and writes them to a file. The
+    playable squares are those of the layout's pieces. The number of
+    positions grows quickly with the pieces and the board: every position of
+    a 4x4 board takes seconds and every 4 piece position of a 6x6 board under
+    a minute, while every position of a 6x6 board is out of reach.
+
+    Args:
+        layout (str) : The file path to the layout file.\n
+        path (str) : The file path to write the tablebase to.\n
+        pieces (int) : The most pieces of a position in the tablebase.\n
+        log (function) : Called with a line of progress for every group.
+
+    Returns:
+        int : The number of positions in the tablebase.
+    """
+    board = CheckersBoard(layout).board
+    size = len(board)
+    parity = next((x + y) % 2 for x in range(size) for y in range(size)
+                  if board[x][y] != '_')
+    indexer = _Indexer(size, parity)
+    pieces = min(pieces, len(indexer.squares))
+    solved = {}
+    for material in _materials(pieces):
+        solved[material] = _solve_group(indexer, material, solved)
+        log('{} {:10d} positions'.format(
+            ''.join(piece * count for piece, count in zip(PIECES, material)),
+            len(solved[material])))
+
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, size, parity, pieces,
+                            len(solved)))
+        offset = HEADER.size + GROUP.size * len(solved)
+        for material, table in solved.items():
+            f.write(GROUP.pack(*material, offset))
+            offset += len(table)
+        for table in solved.values():
+            f.write(table)
+    return sum(len(table) for table in solved.values())
+
+
+class Tablebase:
+    """Tablebase
+
+    The Tablebase class looks positions up in a tablebase file. The file is
+    memory-mapped, so a probe reads a single byte of it.
+
+    Attributes:
+        path (str) : The file path to the tablebase.\n
+        size (int) : The board size the tablebase was built for.\n
+        pieces (int) : The most pieces of a position in the tablebase.\n
+        offsets (dict) : The offset of each material group's table.
+    """
+
+    def __init__(self, path):
+        """__init__
+
+        The __init__ method is the constructor for the Tablebase class. It
+        opens and maps the tablebase file and reads its header.
+
+        Args:
+            path (str) : The file path to the tablebase.
+        """
+        self.path = path
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.size, parity, self.pieces, groups = (
+            HEADER.unpack_from(self._map, 0))
+        if magic != MAGIC or version != VERSION:
+            raise ValueError('{} is not a version {} tablebase'.format(
+                             path, VERSION))
+        self._indexer = _Indexer(self.size, parity)
+        self.offsets = {}
+        for n in range(groups):
+            *material, offset = GROUP.unpack_from(
+                self._map, HEADER.size + n * GROUP.size)
+            self.offsets[tuple(material)] = offset
+
+    def probe(self, state):
+        """probe
+
+        The probe method looks up the result of a state.
+
+        Args:
+            state (CheckersState) : The state to look up.
+
+        Returns:
+            tuple : WIN, LOSS or DRAW for the side on move and the number of
+            moves to the end of the game, or None if the state is not in the
+            tablebase.
+        """
+        if state.size != self.size:
+            return None
+        found = self._indexer.index(state.board, state.bots_move)
+        if found is None or found[0] not in self.offsets:
+            return None
+        material, index = found
+        return _decode(self._map[self.offsets[material] + index])
+
+    def score(self, state, win_score):
+        """score
+
+        The score method scores a state for a search, from the point of view
+        of the side on move. Wins are worth less the more moves they take, so
+        a search prefers the quickest win and the slowest loss.
+
+        Args:
+            state (CheckersState) : The state to score.\n
+            win_score (float) : The score of winning at once.
+
+        Returns:
+            float : The score of the state, or None if it is not in the
+            tablebase.
+        """
+        found = self.probe(state)
+        if found is None:
+            return None
+        result, distance = found
+        if result == WIN:
+            return win_score - distance
+        if result == LOSS:
+            return distance - win_score
+        return 0
+
+    def close(self):
+        """close
+
+        The close method unmaps the tablebase file.
+        """
+        self._map.close()
+
+
+def main():
+    """main
+
+    The main function is the command line interface of the tablebase
+    builder.
+    """
+    parser = argparse.ArgumentParser(
+        description='Build the endgame tablebase for a checkers layout.')
+    parser.add_argument('layout', help='the .board layout file')
+    parser.add_argument('-o', '--output',
+                        help='the tablebase file (default: next to the '
+                        'layout)')
+    parser.add_argument('--pieces', type=int, default=4,
+                        help='the most pieces of a position')
+    args = parser.parse_args()
+    output = args.output or default_tablebase_path(args.layout)
+    count = build_tablebase(args.layout, output, args.pieces)
+    print('Wrote {} positions to {}'.format(count, output))
+
+
+if __name__ == '__main__':
+    main()
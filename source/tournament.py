@@ -0,0 +1,405 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""tournament
+
+File: tournament.py\n
+Author: Alan Grant\n
+Version: 1.0\n
+Date: 10/18/2026\n
+Class: CSCI-C 458\n
+
+This module provides access to the Player class and the play_game and
+run_tournament functions. They play bots against each other without a human
+at the terminal, over a pool of worker processes, to compare scoring
+functions and search settings. A CheckersBot always plays the 'b' pieces, so
+the bot playing the 'p' pieces is shown the board turned around with the
+colours swapped.
+
+Run a tournament with:
+
+    python -m source.tournament layouts/6x6.board --games 1000 --workers 4
+        --a depth=6,time=0.1 --b depth=4,time=0.1
+"""
+
+
+import argparse
+import importlib
+import random
+from concurrent.futures import ProcessPoolExecutor
+from time import time
+
+from .board import CheckersBoard
+from .checkers_state import CheckersState
+from .checkers_bot import CheckersBot
+from .successors import SuccessorGenerator
+from .pdn import dark_parity, game_text, result_text
+
+
+# The piece of the other side, for turning a board around.
+SWAP = {'b': 'p', 'B': 'P', 'p': 'b', 'P': 'B', '_': '_'}
+
+# The settings of a player spec which are not numbers or strings.
+CONSTANTS = {'True': True, 'False': False, 'None': None}
+
+# The bots of a worker process, built once by _init_worker.
+_bots = None
+
+
+def mirror(state):
+    """mirror
+
+    The mirror function turns a state around for the other side: the board
+    is rotated half a turn, the colours are swapped and so is the side on
+    move. Mirroring twice gives back the same state.
+
+    Args:
+        state (CheckersState) : The state to turn around.
+
+    Returns:
+        CheckersState : The mirrored state.
+    """
+    size = state.size
+    board = [[SWAP[square] for square in reversed(row)]
+             for row in reversed(state.board)]
+    moves = [(size - 1 - x, size - 1 - y) for x, y in state.moves]
+    return CheckersState(board, not state.bots_move, moves, size)
+
+
+class Player:
+    """Player
+
+    The Player class describes a bot taking part in a tournament. It is
+    handed to the worker processes, so its scoring function must be defined
+    at the top level of a module.
+
+    Attributes:
+        name (str) : The name the player is reported under.\n
+        max_depth (int) : The max depth of the bot's search.\n
+        max_time (float) : The max time in seconds of each search.\n
+        score_func (function) : The bot's scoring function, or None for the
+        default.\n
+        options (dict) : Extra keyword arguments for the CheckersBot.
+    """
+
+    def __init__(self, name, max_depth, max_time, score_func=None,
+                 **options):
+        """__init__
+
+        The __init__ method is the constructor for the Player class.
+
+        Args:
+            name (str) : The name the player is reported under.\n
+            max_depth (int) : The max depth of the bot's search.\n
+            max_time (float) : The max time in seconds of each search.\n
+            score_func (function) : The bot's scoring function, or None for
+            the default.\n
+            options : Extra keyword arguments for the CheckersBot, such as
+            hash_mb or backend.
+        """
+        self.name = name
+        self.max_depth = max_depth
+        self.max_time = max_time
+        self.score_func = score_func
+        self.options = options
+
+    def build(self):
+        """build
+
+        The build method builds the player's bot.
+
+        Returns:
+            CheckersBot : A bot with the player's settings.
+        """
+        return CheckersBot(None, 1e9, self.max_depth, self.max_time,
+                           self.score_func, **self.options)
+
+
+def parse_player(spec):
+    """parse_player
+
+    The parse_player function builds a Player from a comma separated list of
+    settings, such as "depth=6,time=0.5,func=mymodule:my_score,hash_mb=32".
+    depth, time and func set the search depth, time and scoring function,
+    func being either module:function or the name of a registered evaluator;
+    everything else is passed on to the CheckersBot. Values are read as
+    True, False or None, a number, or else a string.
+
+    Args:
+        spec (str) : The settings of the player.
+
+    Returns:
+        Player : The player.
+    """
+    settings = {}
+    for item in spec.split(','):
+        key, _, value = item.partition('=')
+        value = value.strip()
+        if value in CONSTANTS:
+            settings[key.strip()] = CONSTANTS[value]
+            continue
+        for kind in (int, float):
+            try:
+                value = kind(value)
+                break
+            except ValueError:
+                pass
+        settings[key.strip()] = value
+    func = settings.pop('func', None)
+    if func and ':' in func:
+        module, _, name = func.partition(':')
+        func = getattr(importlib.import_module(module), name)
+    return Player(spec, settings.pop('depth', 25), settings.pop('time', 1.0),
+                  func, **settings)
+
+
+def play_game(layout, bots, opening_plies=0, seed=0, max_plies=200):
+    """play_game
+
+    The play_game function plays one game between two bots. The 'p' side
+    moves first, as the human does in CheckersGame. The first opening_plies
+    moves are picked at random so that games between the same bots differ. A
+    side loses when it has no pieces or no legal moves, and the game is drawn
+    after max_plies moves.
+
+    Args:
+        layout (str) : The file path to the layout file.\n
+        bots (dict) : The bot playing each side, keyed by True for 'b' and
+        False for 'p'.\n
+        opening_plies (int) : The number of random moves to start with.\n
+        seed (int) : The seed of the random opening.\n
+        max_plies (int) : The number of moves after which the game is drawn.
+
+    Returns:
+        dict : The winner, True for 'b', False for 'p' or None for a draw,
+        the number of moves played, the path of each move, and for each side
+        the number of searched moves, positions visited and seconds spent.
+    """
+    board = CheckersBoard(layout).board
+    state = CheckersState(board, False, [], len(board))
+    stats = {side: {'moves': 0, 'nodes': 0, 'time': 0.0}
+             for side in (True, False)}
+    rng = random.Random(seed)
+    winner = None
+    paths = []
+    for bot in bots.values():
+        bot.new_game()
+    for ply in range(max_plies):
+        if state.is_terminal():
+            winner = not state.bot_lost
+            break
+        side = state.bots_move
+        if ply < opening_plies:
+            moves = SuccessorGenerator(state).moves()
+            if not moves:
+                winner = not side
+                break
+            state = state.result(rng.choice(moves))
+            paths.append(state.moves)
+            continue
+        bot = bots[side]
+        bot.update_state(state if side else mirror(state))
+        start = time()
+        result = bot.get_move()
+        stats[side]['time'] += time() - start
+        stats[side]['nodes'] += bot.nodes
+        if result is None:
+            winner = not side
+            break
+        stats[side]['moves'] += 1
+        state = result if side else mirror(result)
+        paths.append(state.moves)
+    return {'winner': winner, 'plies': len(paths), 'moves': paths,
+            'stats': stats}
+
+
+def _init_worker(players):
+    """_init_worker
+
+    The _init_worker function runs once in every worker process. It builds
+    the bots of the players.
+
+    Args:
+        players (list) : The two Players.
+    """
+    global _bots
+    _bots = [player.build() for player in players]
+
+
+def _play(layout, first_is_b, opening_plies, seed, max_plies):
+    """_play
+
+    The _play function plays one game of a tournament in a worker process.
+
+    Args:
+        layout (str) : The file path to the layout file.\n
+        first_is_b (bool) : True if the first player plays the 'b' pieces.\n
+        opening_plies (int) : The number of random moves to start with.\n
+        seed (int) : The seed of the random opening.\n
+        max_plies (int) : The number of moves after which the game is drawn.
+
+    Returns:
+        dict : The result of play_game, with the winner and the statistics
+        given by player, 0 for the first and 1 for the second.
+    """
+    first, second = _bots
+    bots = {first_is_b: first, not first_is_b: second}
+    game = play_game(layout, bots, opening_plies, seed, max_plies)
+    game['first_is_b'] = first_is_b
+    if game['winner'] is not None:
+        game['winner'] = 0 if game['winner'] == first_is_b else 1
+    game['stats'] = [game['stats'][first_is_b], game['stats'][not first_is_b]]
+    return game
+
+
+def run_tournament(layout, players, games, workers=1, opening_plies=2,
+                   max_plies=200, seed=0, pdn=None):
+    """run_tournament
+
+    The run_tournament function plays games between two players and totals
+    the results. Games are played in pairs from the same random opening with
+    the players swapping sides, so neither gains from the opening or from
+    moving first.
+
+    Args:
+        layout (str) : The file path to the layout file.\n
+        players (list) : The two Players.\n
+        games (int) : The number of games to play.\n
+        workers (int) : The number of processes to play games on.\n
+        opening_plies (int) : The number of random moves each game starts
+        with.\n
+        max_plies (int) : The number of moves after which a game is drawn.\n
+        seed (int) : The seed of the first random opening.\n
+        pdn (str) : The file path to write every game to as a PDN record, or
+        None.
+
+    Returns:
+        dict : The wins, draws and losses of the first player, the number of
+        games, the seconds taken, and for each player the number of searched
+        moves, positions visited and seconds spent searching.
+
+    Raises:
+        ValueError : If pdn is given and the layout's pieces stand on squares
+        of both colours, which PDN cannot number.
+    """
+    if pdn:
+        dark_parity(CheckersBoard(layout).board)
+    specs = [(layout, n % 2 == 0, opening_plies, seed + n // 2, max_plies)
+             for n in range(games)]
+    totals = {'wins': 0, 'draws': 0, 'losses': 0, 'games': games,
+              'players': [{'moves': 0, 'nodes': 0, 'time': 0.0}
+                          for player in players]}
+    start = time()
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=_init_worker,
+                                 initargs=(players,)) as pool:
+            results = list(pool.map(_play, *zip(*specs),
+                                    chunksize=max(1, games // (workers * 8))))
+    else:
+        _init_worker(players)
+        results = [_play(*spec) for spec in specs]
+        for bot in _bots:
+            bot.close()
+    totals['time'] = time() - start
+    if pdn:
+        write_games(layout, players, results, pdn)
+
+    for game in results:
+        if game['winner'] is None:
+            totals['draws'] += 1
+        elif game['winner'] == 0:
+            totals['wins'] += 1
+        else:
+            totals['losses'] += 1
+        for total, stats in zip(totals['players'], game['stats']):
+            for key in total:
+                total[key] += stats[key]
+    return totals
+
+
+def write_games(layout, players, results, path):
+    """write_games
+
+    The write_games function writes the games of a tournament to a file as
+    PDN records, the player of the 'b' pieces as White.
+
+    Args:
+        layout (str) : The file path to the layout file.\n
+        players (list) : The two Players.\n
+        results (list) : The games, as _play returns them.\n
+        path (str) : The file path to write to.
+    """
+    board = CheckersBoard(layout).board
+    start = CheckersState(board, False, [], len(board))
+    with open(path, 'w') as f:
+        for n, game in enumerate(results):
+            first, second = players
+            if not game['first_is_b']:
+                first, second = second, first
+            winner = game['winner']
+            if winner is not None:
+                winner = (winner == 0) == game['first_is_b']
+            f.write(game_text(start, game['moves'], result_text(winner),
+                              {'Event': 'Tournament', 'Round': n + 1,
+                               'White': first.name, 'Black': second.name}))
+
+
+def report(players, totals):
+    """report
+
+    The report function formats the results of a tournament.
+
+    Args:
+        players (list) : The two Players.\n
+        totals (dict) : The results from run_tournament.
+
+    Returns:
+        str : The report.
+    """
+    lines = ['{} games in {:.1f}s, {:.2f} games/s'.format(
+        totals['games'], totals['time'],
+        totals['games'] / max(totals['time'], 1e-9)),
+        '{} vs {}: {} won, {} drawn, {} lost'.format(
+            players[0].name, players[1].name, totals['wins'],
+            totals['draws'], totals['losses'])]
+    for player, stats in zip(players, totals['players']):
+        moves = max(stats['moves'], 1)
+        lines.append('{}: {:.0f} nodes/move, {:.1f} ms/move'.format(
+            player.name, stats['nodes'] / moves, 1000 * stats['time'] / moves))
+    return '\n'.join(lines)
+
+
+def main():
+    """main
+
+    The main function is the command line interface of the tournament
+    harness.
+    """
+    parser = argparse.ArgumentParser(
+        description='Play checkers bots against each other.')
+    parser.add_argument('layout', help='the .board layout file')
+    parser.add_argument('--a', default='depth=4,time=0.1',
+                        help='settings of the first player')
+    parser.add_argument('--b', default='depth=2,time=0.1',
+                        help='settings of the second player')
+    parser.add_argument('--games', type=int, default=100,
+                        help='number of games to play')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='processes to play games on')
+    parser.add_argument('--opening-plies', type=int, default=2,
+                        help='random moves each game starts with')
+    parser.add_argument('--max-plies', type=int, default=200,
+                        help='moves after which a game is drawn')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='seed of the random openings')
+    parser.add_argument('--pdn', help='file to write every game to as PDN')
+    args = parser.parse_args()
+    players = [parse_player(args.a), parse_player(args.b)]
+    totals = run_tournament(args.layout, players, args.games, args.workers,
+                            args.opening_plies, args.max_plies, args.seed,
+                            args.pdn)
+    print(report(players, totals))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""transposition
+
+File: transposition.py\n
+Author: Alan Grant\n
+Version: 1.0\n
+Date: 10/18/2026\n
+Class: CSCI-C 458\n
+
+This module provides access to the TranspositionTable class and the Zobrist
+keys used to hash positions. The bot's search stores what it learns about a
+position in the table so the same position reached by a different move order,
+or searched again by the next iteration of the iterative deepening search,
+does not have to be searched from scratch.
+"""
+
+
+import random
+
+
+# Bound types of a stored score.
+EXACT, LOWER, UPPER = 0, 1, 2
+
+# Approximate memory used by one table entry: the slot, the entry tuple, its
+# key and score and the code of its move.
+ENTRY_BYTES = 200
+
+# Zobrist keys, keyed by board size.
+_KEYS = {}
+
+
+def zobrist_keys(size):
+    """zobrist_keys
+
+    The zobrist_keys function returns the random 64 bit keys used to hash
+    positions on a board of the given size. The keys come from a generator
+    seeded with the size, so every process gets the same hash for the same
+    position.
+
+    Args:
+        size (int) : The size of the board.
+
+    Returns:
+        tuple : A dict mapping each piece to a size x size list of keys for
+        its squares, and the key for the bot being on move.
+    """
+    if size not in _KEYS:
+        rng = random.Random(size)
+        pieces = {piece: [[rng.getrandbits(64) for y in range(size)]
+                          for x in range(size)]
+                  for piece in 'bBpP'}
+        _KEYS[size] = (pieces, rng.getrandbits(64))
+    return _KEYS[size]
+
+
+def zobrist_hash(state):
+    """zobrist_hash
+
+    The zobrist_hash function computes the hash of a state from scratch.
+
+    Args:
+        state (CheckersState) : The state to hash.
+
+    Returns:
+        int : The 64 bit Zobrist hash of the state.
+    """
+    pieces, bot_key = zobrist_keys(state.size)
+    h = bot_key if state.bots_move else 0
+    for x, row in enumerate(state.board):
+        for y, square in enumerate(row):
+            if square != '_':
+                h ^= pieces[square][x][y]
+    return h
+
+
+class TranspositionTable:
+    """TranspositionTable
+
+    The TranspositionTable class is a fixed-size hash table of search results.
+    Each bucket has two slots. The first keeps the entry searched to the
+    greatest depth and the second always takes the newest entry that did not
+    fit in the first, so deep results survive while recent ones stay
+    available. The table is kept from one search to the next; entries from
+    earlier searches still answer probes but give up the first slot to any
+    entry of the current search.
+
+    Attributes:
+        buckets (int) : The number of buckets, a power of two.\n
+        table (list) : The slots, two per bucket. An empty slot is None and a
+        full one a tuple (key, depth, flag, score, move, generation), move
+        being the code of the best move from encoding.encode_move.\n
+        generation (int) : The number of the current search.
+    """
+
+    def __init__(self, max_mb):
+        """__init__
+
+        The __init__ method is the constructor for the TranspositionTable
+        class.
+
+        Args:
+            max_mb (float) : The most memory in megabytes the table may use.
+        """
+        self.buckets = 1
+        while self.buckets * 4 * ENTRY_BYTES <= max_mb * 1024 * 1024:
+            self.buckets *= 2
+        self.table = None
+        self.clear()
+
+    def clear(self):
+        """clear
+
+        The clear method empties the table.
+        """
+        self.table = [None] * (self.buckets * 2)
+        self.generation = 0
+
+    def age(self):
+        """age
+
+        The age method starts a new search, making every entry stored so far
+        an old one.
+        """
+        self.generation += 1
+
+    def probe(self, key):
+        """probe
+
+        The probe method looks up the entry stored for a position.
+
+        Args:
+            key (int) : The Zobrist hash of the position.
+
+        Returns:
+            tuple : The entry (key, depth, flag, score, move, generation), or
+            None if the position is not in the table.
+        """
+        i = (key & (self.buckets - 1)) << 1
+        entry = self.table[i]
+        if entry is not None and entry[0] == key:
+            return entry
+        entry = self.table[i + 1]
+        if entry is not None and entry[0] == key:
+            return entry
+        return None
+
+    def store(self, key, depth, flag, score, move):
+        """store
+
+        The store method saves a search result. It goes in the depth-preferred
+        slot if it was searched at least as deep as the entry already there,
+        or is for the same position, or the entry there is from an earlier
+        search, and in the always-replace slot otherwise.
+
+        Args:
+            key (int) : The Zobrist hash of the position.\n
+            depth (int) : The depth the position was searched to.\n
+            flag (int) : EXACT, LOWER or UPPER; whether score is the exact
+            value, a lower bound or an upper bound.\n
+            score (float) : The score found by the search.\n
+            move (int) : The code of the best move found, or None.
+        """
+        i = (key & (self.buckets - 1)) << 1
+        entry = self.table[i]
+        new = (key, depth, flag, score, move, self.generation)
+        if (entry is None or entry[0] == key or depth >= entry[1] or
+                entry[5] != self.generation):
+            self.table[i] = new
+        else:
+            self.table[i + 1] = new